@@ -2,7 +2,7 @@
 Advanced Analytics for Grant AI
 Provides reporting, metrics, and insights for grant discovery and application management.
 """
-from typing import List, Dict
+from typing import Dict, Iterable, List
 from grant_ai.models.grant import Grant
 from grant_ai.utils.logger import get_logger
 
@@ -13,19 +13,23 @@ class GrantAnalytics:
     def __init__(self):
         logger.info("Initialized GrantAnalytics.")
 
-    def summarize_grants(self, grants: List[Grant]) -> Dict:
-        """Summarize grants by domain, relevance, and funding amount."""
+    def summarize_grants(self, grants: Iterable[Grant]) -> Dict:
+        """Summarize grants by domain, relevance, and funding amount.
+
+        ``grants`` is iterated exactly once, so a generator may be passed.
+        """
         summary = {
-            "total": len(grants),
+            "total": 0,
             "domains": {},
             "funding": 0.0,
         }
         for grant in grants:
+            summary["total"] += 1
             domain = getattr(grant, 'domain', 'other')
             summary["domains"].setdefault(domain, 0)
             summary["domains"][domain] += 1
             summary["funding"] += getattr(grant, 'amount', 0.0)
-        logger.info(f"Summarized {len(grants)} grants.")
+        logger.info(f"Summarized {summary['total']} grants.")
         return summary
 
     def generate_report(self, grants: List[Grant]) -> str:
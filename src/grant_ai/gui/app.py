@@ -30,8 +30,8 @@ if org_profile:
     st.header("Grant Search")
     query = st.text_input("Search Grants", "education technology")
     if st.button("Search State/Federal Grants"):
-        scraper = StateFederalGrantScraper()
-        results = scraper.search_grants(query)
+        with StateFederalGrantScraper() as scraper:
+            results = scraper.search_grants(query)
         st.write(f"Found {len(results)} grants.")
         for grant in results:
             st.write(f"- {grant.title} ({grant.funder_name})")
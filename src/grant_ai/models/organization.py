@@ -1,10 +1,11 @@
 """Data models for organizations, grants, and AI companies."""
 
+import re
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import FrozenSet, List, Optional, Pattern, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class FocusArea(str, Enum):
@@ -92,6 +93,9 @@ class OrganizationProfile(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
     
+    # Cached (focus_areas, matcher) pair built by get_keyword_matcher()
+    _keyword_matcher: Optional[tuple] = PrivateAttr(default=None)
+    
     class Config:
         """Pydantic configuration."""
         use_enum_values = True
@@ -134,3 +138,22 @@ class OrganizationProfile(BaseModel):
                 keywords.extend(["education", "learning", "academic", "school"])
             # Add more keyword mappings as needed
         return list(set(keywords))  # Remove duplicates
+    
+    def get_keyword_matcher(self) -> Tuple[FrozenSet[str], Pattern[str]]:
+        """Get lower-cased focus keywords and a compiled regex matching any of them.
+        
+        The result is cached on the profile and rebuilt only when the
+        focus areas change, so many scrapers can share it.
+        """
+        key = tuple(self.focus_areas)
+        if self._keyword_matcher is None or self._keyword_matcher[0] != key:
+            keywords = frozenset(k.lower() for k in self.get_focus_keywords())
+            if keywords:
+                alternation = "|".join(
+                    re.escape(k) for k in sorted(keywords, key=len, reverse=True)
+                )
+                pattern = re.compile(alternation)
+            else:
+                pattern = re.compile(r"(?!x)x")  # never matches
+            self._keyword_matcher = (key, (keywords, pattern))
+        return self._keyword_matcher[1]
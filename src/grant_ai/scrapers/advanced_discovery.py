@@ -2,17 +2,54 @@
 Advanced Grant Discovery API Integration
 Handles NASA NSPIRES, ESA, Grants.gov, and other federal/international sources
 """
+import hashlib
+import heapq
 import re
+import time
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin
 
 import requests
 from bs4 import BeautifulSoup
+from dateutil import parser as date_parser
 
 from grant_ai.models.grant import EligibilityType, FundingType, Grant, GrantStatus
 
 
+# Date patterns used to locate deadlines in listing text
+_DATE_PATTERNS = [
+    re.compile(r'deadline[:\s]*([A-Za-z]+ \d{1,2},? \d{4})', re.IGNORECASE),
+    re.compile(r'due[:\s]*([A-Za-z]+ \d{1,2},? \d{4})', re.IGNORECASE),
+    re.compile(r'closes[:\s]*([A-Za-z]+ \d{1,2},? \d{4})', re.IGNORECASE),
+    re.compile(r'(\d{1,2}/\d{1,2}/\d{4})'),
+    re.compile(r'(\d{4}-\d{2}-\d{2})'),
+]
+
+# Amount patterns used to locate funding ranges in listing text
+_AMOUNT_PATTERNS = [
+    re.compile(r'\$([0-9,]+(?:\.[0-9]{2})?)', re.IGNORECASE),
+    re.compile(r'([0-9,]+)\s*(?:USD|dollars)', re.IGNORECASE),
+    re.compile(r'up to \$([0-9,]+)', re.IGNORECASE),
+    re.compile(r'maximum \$([0-9,]+)', re.IGNORECASE),
+]
+
+
+def _make_grant_id(prefix: str, title: str, url: str = "") -> str:
+    """Build a stable grant ID from the normalized title and source URL"""
+    content = f"{' '.join(title.lower().split())}|{url}"
+    return f"{prefix}_{hashlib.blake2b(content.encode('utf-8'), digest_size=8).hexdigest()}"
+
+
+@lru_cache(maxsize=1024)
+def _parse_date_cached(date_str: str) -> datetime:
+    """Parse a date string, memoized since listing pages repeat the same dates"""
+    return date_parser.parse(date_str)
+
+
 @dataclass
 class GrantDiscoveryResult:
     """Result from grant discovery API"""
@@ -21,12 +58,23 @@ class GrantDiscoveryResult:
     success: bool
     message: str
     keyword_matches: List[str]
+    # Grants above the relevance threshold, before the max_results cap
+    total_matches: Optional[int] = None
+
+    def __post_init__(self):
+        if self.total_matches is None:
+            self.total_matches = len(self.grants)
 
 
 class AdvancedGrantDiscovery:
     """Advanced grant discovery with API integration and AI filtering"""
     
+    SCRAPE_CACHE_TTL = 600  # Seconds a scraped source result stays fresh
+    SCRAPE_CACHE_SIZE = 32  # Maximum number of cached (source, keywords) results
+    
     def __init__(self):
+        # Scrape results keyed by (source_id, keywords) -> (timestamp, grants)
+        self._scrape_cache: Dict[Tuple[str, Tuple[str, ...]], Tuple[float, List[Grant]]] = {}
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': (
@@ -100,16 +148,21 @@ class AdvancedGrantDiscovery:
             try:
                 grants = await self._scrape_source_with_keywords(source_id, source_config, keywords)
                 
-                # Filter by keyword relevance
-                relevant_grants = self._filter_grants_by_relevance(grants, keywords)
-                keyword_matches = self._find_keyword_matches(relevant_grants, keywords)
+                # Score by keyword relevance and collect matches in one pass
+                relevant_grants, keyword_matches, total_matches = self._score_and_match(
+                    grants, keywords, max_results
+                )
                 
+                message = f"Found {total_matches} relevant grants"
+                if total_matches > len(relevant_grants):
+                    message += f" (showing top {len(relevant_grants)})"
                 results[source_id] = GrantDiscoveryResult(
                     source=source_config['name'],
-                    grants=relevant_grants[:max_results],
+                    grants=relevant_grants,
                     success=True,
-                    message=f"Found {len(relevant_grants)} relevant grants",
-                    keyword_matches=keyword_matches
+                    message=message,
+                    keyword_matches=keyword_matches,
+                    total_matches=total_matches
                 )
                 
             except Exception as e:
@@ -124,20 +177,44 @@ class AdvancedGrantDiscovery:
         return results
     
     async def _scrape_source_with_keywords(self, source_id: str, source_config: Dict, keywords: List[str]) -> List[Grant]:
-        """Scrape a specific source with keyword filtering"""
+        """Scrape a specific source with keyword filtering, reusing fresh cached results"""
+        cache_key = (source_id, tuple(keywords))
+        cached = self._scrape_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self.SCRAPE_CACHE_TTL:
+            return list(cached[1])
         
         if source_id == 'nasa_nspires':
-            return await self._scrape_nasa_nspires(keywords)
+            grants = await self._scrape_nasa_nspires(keywords)
         elif source_id == 'esa_open_space':
-            return await self._scrape_esa_open_space(keywords)
+            grants = await self._scrape_esa_open_space(keywords)
         elif source_id == 'grants_gov':
-            return await self._scrape_grants_gov(keywords)
+            grants = await self._scrape_grants_gov(keywords)
         elif source_id == 'nsf_ai':
-            return await self._scrape_nsf_ai(keywords)
+            grants = await self._scrape_nsf_ai(keywords)
         elif source_id == 'doe_ai':
-            return await self._scrape_doe_ai(keywords)
+            grants = await self._scrape_doe_ai(keywords)
         else:
             return []
+        
+        self._scrape_cache.pop(cache_key, None)
+        self._scrape_cache[cache_key] = (time.monotonic(), grants)
+        self._manage_cache()
+        return list(grants)
+    
+    def _manage_cache(self):
+        """Drop expired entries and keep the scrape cache within its size limit"""
+        now = time.monotonic()
+        for key in [k for k, (ts, _) in self._scrape_cache.items()
+                    if now - ts >= self.SCRAPE_CACHE_TTL]:
+            del self._scrape_cache[key]
+        
+        # Dicts preserve insertion order, so the first keys are the oldest
+        while len(self._scrape_cache) > self.SCRAPE_CACHE_SIZE:
+            del self._scrape_cache[next(iter(self._scrape_cache))]
+    
+    def clear_cache(self):
+        """Clear cached scrape results"""
+        self._scrape_cache.clear()
     
     async def _scrape_nasa_nspires(self, keywords: List[str]) -> List[Grant]:
         """Scrape NASA NSPIRES for relevant opportunities"""
@@ -164,13 +241,14 @@ class AdvancedGrantDiscovery:
                     if not any(keyword.lower() in title.lower() for keyword in keywords):
                         continue
                     
-                    # Extract additional information
+                    # Extract additional information from a single text walk
+                    listing_text = sol.get_text(' ', strip=True)
                     description = self._extract_description(sol)
-                    deadline = self._extract_deadline(sol)
-                    amount = self._extract_amount(sol)
+                    deadline = self._extract_deadline(listing_text)
+                    amount = self._extract_amount(listing_text)
                     
                     grant = Grant(
-                        id=f"nasa_{id(title)}",
+                        id=_make_grant_id("nasa", title, url),
                         title=title,
                         description=description,
                         funder_name="NASA",
@@ -216,10 +294,12 @@ class AdvancedGrantDiscovery:
                     if not any(keyword.lower() in title.lower() for keyword in keywords):
                         continue
                     
+                    listing_text = opp.get_text(' ', strip=True)
                     description = self._extract_description(opp)
-                    deadline = self._extract_deadline(opp)
+                    deadline = self._extract_deadline(listing_text)
                     
                     grant = Grant(
+                        id=_make_grant_id("esa", title, url),
                         title=title,
                         description=description,
                         agency="European Space Agency (ESA)",
@@ -270,11 +350,13 @@ class AdvancedGrantDiscovery:
                     agency_elem = listing.find(text=re.compile(r'Agency|Department'))
                     agency = agency_elem.strip() if agency_elem else "Federal Agency"
                     
+                    listing_text = listing.get_text(' ', strip=True)
                     description = self._extract_description(listing)
-                    deadline = self._extract_deadline(listing)
-                    amount = self._extract_amount(listing)
+                    deadline = self._extract_deadline(listing_text)
+                    amount = self._extract_amount(listing_text)
                     
                     grant = Grant(
+                        id=_make_grant_id("grants_gov", title, base_url),
                         title=title,
                         description=description,
                         agency=agency,
@@ -324,6 +406,7 @@ class AdvancedGrantDiscovery:
                     description = self._extract_description(container) or "NSF research funding opportunity in AI/ML"
                     
                     grant = Grant(
+                        id=_make_grant_id("nsf", title, url),
                         title=title,
                         description=description,
                         agency="National Science Foundation (NSF)",
@@ -372,10 +455,12 @@ class AdvancedGrantDiscovery:
                     if not any(keyword.lower() in title.lower() for keyword in self.ai_keywords):
                         continue
                     
+                    listing_text = opp.get_text(' ', strip=True)
                     description = self._extract_description(opp)
-                    deadline = self._extract_deadline(opp)
+                    deadline = self._extract_deadline(listing_text)
                     
                     grant = Grant(
+                        id=_make_grant_id("doe", title, url),
                         title=title,
                         description=description,
                         agency="U.S. Department of Energy",
@@ -399,18 +484,28 @@ class AdvancedGrantDiscovery:
         
         return grants
     
-    def _filter_grants_by_relevance(self, grants: List[Grant], keywords: List[str]) -> List[Grant]:
-        """Filter grants by keyword relevance scoring"""
+    def _score_and_match(self, grants: List[Grant], keywords: List[str],
+                         max_results: int = 50) -> Tuple[List[Grant], List[str], int]:
+        """Score grants by keyword relevance and collect matched keywords in one pass
+
+        Only the ``max_results`` highest-scoring grants are returned, along
+        with the matched keywords and the number of grants that scored above
+        zero before the cap. The returned grants are scored copies; the
+        input grants are left unchanged.
+        """
         scored_grants = []
+        matched = set()
+        lowered_keywords = [(keyword, keyword.lower()) for keyword in keywords]
         
         for grant in grants:
             score = 0
             text_content = f"{grant.title} {grant.description}".lower()
             
             # Score based on keyword matches
-            for keyword in keywords:
-                if keyword.lower() in text_content:
+            for keyword, keyword_lower in lowered_keywords:
+                if keyword_lower in text_content:
                     score += 1
+                    matched.add(keyword)
             
             # Bonus scoring for AI/space technology terms
             for ai_term in self.ai_keywords:
@@ -421,25 +516,14 @@ class AdvancedGrantDiscovery:
                 if space_term.lower() in text_content:
                     score += 1.5
             
-            # Only include grants with some relevance
+            # Only include grants with some relevance; score a copy, since
+            # the scraped grants may be shared through the scrape cache
             if score > 0:
-                grant.relevance_score = score
-                scored_grants.append(grant)
-        
-        # Sort by relevance score (highest first)
-        return sorted(scored_grants, key=lambda g: getattr(g, 'relevance_score', 0), reverse=True)
-    
-    def _find_keyword_matches(self, grants: List[Grant], keywords: List[str]) -> List[str]:
-        """Find which keywords had matches in the grants"""
-        matches = set()
-        
-        for grant in grants:
-            text_content = f"{grant.title} {grant.description}".lower()
-            for keyword in keywords:
-                if keyword.lower() in text_content:
-                    matches.add(keyword)
+                scored_grants.append(grant.model_copy(update={'relevance_score': score}))
         
-        return list(matches)
+        # Keep the top-K by relevance score (highest first)
+        top_grants = heapq.nlargest(max_results, scored_grants, key=attrgetter('relevance_score'))
+        return top_grants, list(matched), len(scored_grants)
     
     def _extract_description(self, element) -> str:
         """Extract description from HTML element"""
@@ -459,48 +543,26 @@ class AdvancedGrantDiscovery:
         # Fallback to element text
         return element.get_text(strip=True)[:300] if element else ""
     
-    def _extract_deadline(self, element) -> Optional[datetime]:
-        """Extract deadline from HTML element"""
-        # Look for date patterns
-        date_patterns = [
-            r'deadline[:\s]*([A-Za-z]+ \d{1,2},? \d{4})',
-            r'due[:\s]*([A-Za-z]+ \d{1,2},? \d{4})',
-            r'closes[:\s]*([A-Za-z]+ \d{1,2},? \d{4})',
-            r'(\d{1,2}/\d{1,2}/\d{4})',
-            r'(\d{4}-\d{2}-\d{2})'
-        ]
-        
-        text = element.get_text() if element else ""
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+    def _extract_deadline(self, text: str) -> Optional[datetime]:
+        """Extract deadline from pre-extracted listing text"""
+        for pattern in _DATE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 try:
                     date_str = match.group(1)
                     # Try to parse the date
-                    from dateutil import parser
-                    return parser.parse(date_str)
+                    return _parse_date_cached(date_str)
                 except:
                     continue
         
         return None
     
-    def _extract_amount(self, element) -> Dict[str, int]:
-        """Extract funding amount from HTML element"""
-        # Look for amount patterns
-        amount_patterns = [
-            r'\$([0-9,]+(?:\.[0-9]{2})?)',
-            r'([0-9,]+)\s*(?:USD|dollars)',
-            r'up to \$([0-9,]+)',
-            r'maximum \$([0-9,]+)'
-        ]
-        
-        text = element.get_text() if element else ""
+    def _extract_amount(self, text: str) -> Dict[str, int]:
+        """Extract funding amount from pre-extracted listing text"""
         amounts = []
         
-        for pattern in amount_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern in _AMOUNT_PATTERNS:
+            for match in pattern.findall(text):
                 try:
                     # Clean and convert to int
                     amount_str = match.replace(',', '')
@@ -526,7 +588,6 @@ class AdvancedGrantDiscovery:
                 if href.startswith('http'):
                     return href
                 else:
-                    from urllib.parse import urljoin
                     return urljoin(base_url, href)
         
         # Fallback to first link
@@ -536,7 +597,6 @@ class AdvancedGrantDiscovery:
             if href.startswith('http'):
                 return href
             else:
-                from urllib.parse import urljoin
                 return urljoin(base_url, href)
         
         return base_url
@@ -564,6 +624,7 @@ class EnhancedGrantDiscovery:
     def get_discovery_summary(self, results: Dict[str, GrantDiscoveryResult]) -> Dict:
         """Get summary of discovery results"""
         total_grants = sum(len(result.grants) for result in results.values() if result.success)
+        total_matches = sum(result.total_matches for result in results.values() if result.success)
         successful_sources = [result.source for result in results.values() if result.success]
         failed_sources = [result.source for result in results.values() if not result.success]
         
@@ -573,6 +634,7 @@ class EnhancedGrantDiscovery:
         
         return {
             'total_grants': total_grants,
+            'total_matches': total_matches,
             'successful_sources': successful_sources,
             'failed_sources': failed_sources,
             'matched_keywords': list(all_keywords),
@@ -2,21 +2,55 @@
 from __future__ import annotations
 
 from abc import ABC
-from typing import Any, Callable, Dict, List, Optional, cast
+from collections import Counter
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
 
-from pydantic import HttpUrl
+from pydantic import HttpUrl, TypeAdapter
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 from grant_ai.models.grants_core import GrantRecord
 from grant_ai.models.organization import OrganizationProfile
 
+try:
+    from grant_ai.models.grant import Grant as _LegacyGrant
+except Exception:  # pragma: no cover - defensive
+    _LegacyGrant = None
+
+# Fields read from a legacy Grant when converting it to a GrantRecord
+_LEGACY_FIELDS = attrgetter(
+    "id",
+    "title",
+    "description",
+    "application_url",
+    "information_url",
+    "amount_min",
+    "amount_max",
+    "application_deadline",
+    "focus_areas",
+)
+
 _SCRAPER_REGISTRY: Dict[str, "ScraperBase"] = {}
 
+_HTTP_URL_ADAPTER = TypeAdapter(HttpUrl)
+
+# Keyword sets larger than this are matched with an Aho-Corasick automaton
+# (or the profile's regex); smaller ones use plain substring checks
+_AUTOMATON_MIN_KEYWORDS = 4
+
 
 def register_scraper(name: str) -> Callable[[type], type]:
     """Decorator to register a scraper implementation by name."""
 
     def _decorator(cls: type) -> type:
         instance = cls()  # instantiate once (scrapers should be stateless)
+        _bind_legacy_impl(instance)
         _SCRAPER_REGISTRY[name] = instance
         return cls
 
@@ -43,6 +77,12 @@ class ScraperBase(ABC):
 
     source_name: str = "unknown"
 
+    # Legacy method resolved once per instance by _bind_legacy_impl
+    _legacy_mode: Optional[str] = None
+    _impl: Optional[Callable[..., Any]] = None
+    # How often each keyword matched, used to try likely keywords first
+    _kw_hits: Optional[Counter] = None
+
     def scrape_grants(
         self,
         profile: OrganizationProfile,
@@ -56,34 +96,72 @@ class ScraperBase(ABC):
           keyword match using organization's focus keywords.
         - If a subclass implements search_grants(query=...), use that.
         """
+        mode = self._legacy_mode
+        if mode is None:
+            mode = _bind_legacy_impl(self)
+
         # legacy: search_grants
-        if hasattr(self, "search_grants") and callable(
-            getattr(self, "search_grants")
-        ):
+        if mode == "search_grants":
             query = " ".join(profile.get_focus_keywords())
-            results = getattr(self, "search_grants")(query=query)
+            results = self._impl(query=query)
             converted = [_to_record(g, self.source_name) for g in results]
             return self._truncate(converted, limit)
 
         # legacy: get_all_grants
-        if hasattr(self, "get_all_grants") and callable(
-            getattr(self, "get_all_grants")
-        ):
-            all_grants = getattr(self, "get_all_grants")()
-            keywords = set(k.lower() for k in profile.get_focus_keywords())
-            filtered = []
-            for g in all_grants:
-                title_part = str(getattr(g, 'title', ''))
-                desc_part = str(getattr(g, 'description', ''))
-                text = f"{title_part} {desc_part}".lower()
-                if any(k in text for k in keywords):
-                    filtered.append(g)
+        if mode == "get_all_grants":
+            all_grants = self._impl()
+            keywords, pattern = profile.get_keyword_matcher()
+            automaton = (
+                _build_automaton(keywords)
+                if AHOCORASICK_AVAILABLE
+                and len(keywords) > _AUTOMATON_MIN_KEYWORDS
+                else None
+            )
+            # Lower-case every grant's text once, then filter by index
+            grants = list(all_grants)
+            texts = [
+                f"{getattr(g, 'title', '')} {getattr(g, 'description', '')}".lower()
+                for g in grants
+            ]
+            if automaton is not None:
+                keep = [
+                    i for i, text in enumerate(texts)
+                    if next(automaton.iter(text), None) is not None
+                ]
+            elif len(keywords) <= _AUTOMATON_MIN_KEYWORDS:
+                keep = self._match_by_frequency(texts, keywords)
+            else:
+                keep = [
+                    i for i, text in enumerate(texts) if pattern.search(text)
+                ]
+            filtered = [grants[i] for i in keep]
             converted = [_to_record(g, self.source_name) for g in filtered]
             return self._truncate(converted, limit)
 
         # Nothing to do by default
         return []
 
+    def _match_by_frequency(
+        self, texts: List[str], keywords: FrozenSet[str]
+    ) -> List[int]:
+        """Return indices of texts containing a keyword.
+
+        Keywords are tried in order of past hits on this scraper, so the
+        first substring check usually succeeds for matching texts.
+        """
+        hits = self._kw_hits
+        if hits is None:
+            hits = self._kw_hits = Counter()
+        ordered = sorted(keywords, key=hits.__getitem__, reverse=True)
+        keep = []
+        for i, text in enumerate(texts):
+            for keyword in ordered:
+                if keyword in text:
+                    hits[keyword] += 1
+                    keep.append(i)
+                    break
+        return keep
+
     def _truncate(
         self, items: List[GrantRecord], limit: Optional[int]
     ) -> List[GrantRecord]:
@@ -97,41 +175,71 @@ class ScraperBase(ABC):
         raise NotImplementedError
 
 
+def _bind_legacy_impl(instance: ScraperBase) -> str:
+    """Resolve which legacy method an instance overrides and bind it.
+
+    Only methods overridden by the subclass count; the base class stubs
+    raise NotImplementedError. Returns the mode name ("" when neither is
+    implemented).
+    """
+    cls = type(instance)
+    if cls.search_grants is not ScraperBase.search_grants:
+        instance._impl = instance.search_grants
+        instance._legacy_mode = "search_grants"
+    elif cls.get_all_grants is not ScraperBase.get_all_grants:
+        instance._impl = instance.get_all_grants
+        instance._legacy_mode = "get_all_grants"
+    else:
+        instance._impl = None
+        instance._legacy_mode = ""
+    return instance._legacy_mode
+
+
+@lru_cache(maxsize=64)
+def _build_automaton(keywords: FrozenSet[str]) -> Any:
+    """Build (and cache) an Aho-Corasick automaton for a keyword set."""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+@lru_cache(maxsize=4096)
+def _make_httpurl(url: str) -> HttpUrl:
+    """Validate a URL string once; grants often share agency URLs."""
+    return _HTTP_URL_ADAPTER.validate_python(url)
+
+
 def _to_record(grant_obj: Any, source: str) -> GrantRecord:
     """Best-effort conversion from legacy Grant model to GrantRecord."""
-    try:
-        from grant_ai.models.grant import Grant as LegacyGrant  # local import
-    except Exception:  # pragma: no cover - defensive
-        LegacyGrant = object  # type: ignore
-
-    if isinstance(grant_obj, LegacyGrant):
-        url_str = (
-            str(getattr(grant_obj, "application_url"))
-            if getattr(grant_obj, "application_url", None)
-            else (
-                str(getattr(grant_obj, "information_url"))
-                if getattr(grant_obj, "information_url", None)
-                else "http://example.com"
-            )
-        )
-        desc = getattr(grant_obj, "description", None) or ""
-        min_amount = getattr(grant_obj, "amount_min", None)
-        max_amount = getattr(grant_obj, "amount_max", None)
-        deadline = getattr(grant_obj, "application_deadline", None)
-        tags = getattr(grant_obj, "focus_areas", []) or []
+    if _LegacyGrant is not None and isinstance(grant_obj, _LegacyGrant):
+        (
+            grant_id,
+            title,
+            desc,
+            application_url,
+            information_url,
+            min_amount,
+            max_amount,
+            deadline,
+            tags,
+        ) = _LEGACY_FIELDS(grant_obj)
+        if application_url:
+            url_str = str(application_url)
+        elif information_url:
+            url_str = str(information_url)
+        else:
+            url_str = "http://example.com"
         return GrantRecord(
-            id=str(
-                getattr(
-                    grant_obj, "id", getattr(grant_obj, "title", "unknown")
-                )
-            ),
-            title=str(getattr(grant_obj, "title", "Untitled")),
-            description=str(desc) if desc is not None else None,
-            url=cast(HttpUrl, HttpUrl(url_str)),
+            id=str(grant_id or title),
+            title=str(title),
+            description=str(desc or ""),
+            url=_make_httpurl(url_str),
             min_amount=min_amount,
             max_amount=max_amount,
             deadline=deadline,
-            tags=list(tags),
+            tags=list(tags or []),
             source=source,
         )
 
@@ -143,7 +251,7 @@ def _to_record(grant_obj: Any, source: str) -> GrantRecord:
         id=title,
         title=title,
         description=desc,
-        url=cast(HttpUrl, HttpUrl(str(url_str2))),
+        url=_make_httpurl(str(url_str2)),
         source=source,
     )
 
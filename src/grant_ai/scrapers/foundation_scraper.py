@@ -9,11 +9,14 @@ class FoundationScraper:
     def __init__(self):
         self.sources = []
     def discover_foundation_grants(self, keywords: List[str]) -> List[Dict]:
-        """Discover foundation grants matching keywords."""
+        """Discover foundation grants matching keywords.
+
+        Each source is returned once, however many of its focus areas match.
+        """
         # Placeholder: simulate scraping
-        results = []
-        for source in self.sources:
-            for kw in keywords:
-                if kw in source.get('focus_areas', []):
-                    results.append(source)
-        return results
+        wanted = set(keywords)
+        # Focus areas are compared whole, so a set intersection suffices
+        return [
+            source for source in self.sources
+            if not wanted.isdisjoint(source.get('focus_areas', []))
+        ]
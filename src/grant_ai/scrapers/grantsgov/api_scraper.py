@@ -1,36 +1,255 @@
 """
 Grants.gov API client and scraper integration for Grant AI project.
 """
+import asyncio
+import hashlib
+import json
 import logging
-from typing import List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
 
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import (
     ConnectionError,
     HTTPError,
     ReadTimeout,
     RequestException,
 )
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from grant_ai.models.grant import EligibilityType, FundingType, Grant, GrantStatus
+from grant_ai.models.grants_core import GrantRecord
+from grant_ai.models.organization import OrganizationProfile
 
-from ..base import GrantScraper
+from ..base import GrantScraper, _to_record
 
 GRANTS_GOV_API_URL = (
     "https://www.grants.gov/grantsws/rest/opportunities/search/"
 )
+DEFAULT_CACHE_DIR = Path("data/.grantsgov_cache")
+# Upper bound on concurrent page requests for the sync path
+MAX_PAGE_WORKERS = 8
+# Results per page when the caller does not pass ``rows``
+DEFAULT_ROWS = 25
 
 logger = logging.getLogger(__name__)
 
+# Shared aiohttp session for the async path, created lazily per event loop
+_aiohttp_session: Optional[aiohttp.ClientSession] = None
+_aiohttp_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def _get_aiohttp_session() -> aiohttp.ClientSession:
+    """Return the shared aiohttp session, creating it for the running loop.
+
+    A session left over from another event loop (e.g. an earlier
+    ``asyncio.run`` that never called ``close_async_session``) is closed
+    before it is replaced, so its connector is not leaked.
+    """
+    global _aiohttp_session, _aiohttp_loop
+    loop = asyncio.get_running_loop()
+    if _aiohttp_session is not None and _aiohttp_loop is not loop:
+        await _close_stale_session(_aiohttp_session, _aiohttp_loop)
+        _aiohttp_session = None
+    if _aiohttp_session is None or _aiohttp_session.closed:
+        connector = aiohttp.TCPConnector(limit=100, keepalive_timeout=30)
+        _aiohttp_session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+        _aiohttp_loop = loop
+    return _aiohttp_session
+
+
+async def _close_stale_session(
+    session: aiohttp.ClientSession, loop: Optional[asyncio.AbstractEventLoop]
+) -> None:
+    """Close a session created on an event loop other than the running one."""
+    if session.closed:
+        return
+    if loop is None or loop.is_closed():
+        # The transports died with their loop; this only releases the connector
+        await session.close()
+    else:
+        # The loop is still alive (e.g. in another thread), so close it there
+        asyncio.run_coroutine_threadsafe(session.close(), loop)
+
+
+async def close_async_session() -> None:
+    """Close the shared aiohttp session used by async searches."""
+    global _aiohttp_session, _aiohttp_loop
+    if _aiohttp_session is not None and not _aiohttp_session.closed:
+        await _aiohttp_session.close()
+    _aiohttp_session = None
+    _aiohttp_loop = None
+
+
+def _loads(body: bytes) -> Any:
+    """Decode a JSON body, using orjson when it is installed.
+
+    Raises ValueError on malformed input (orjson's decode error subclasses it).
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def keyword_query(keywords: List[str]) -> str:
+    """Combine keywords into a single grants.gov OR query."""
+    return " OR ".join(k.strip() for k in keywords if k and k.strip())
+
+
+def _status_error(status_code: int, text: str) -> RequestException:
+    """Map a grants.gov HTTP error status to a user-facing exception."""
+    if status_code == 403:
+        return RequestException(
+            "Access denied by grants.gov API. "
+            "The service may be temporarily restricted."
+        )
+    elif status_code == 429:
+        return RequestException(
+            "Too many requests to grants.gov API. "
+            "Please wait before trying again."
+        )
+    elif status_code >= 500:
+        return RequestException(
+            f"grants.gov API server error ({status_code}). "
+            "The service may be temporarily down."
+        )
+    else:
+        return RequestException(
+            f"grants.gov API returned error {status_code}: "
+            f"{text[:200]}"
+        )
+
 
 class GrantsGovAPIScraper(GrantScraper):
     """Scraper using the grants.gov public API."""
 
-    def search_grants(self, query: str = "", **kwargs) -> List[Grant]:
+    source_name = "grants.gov"
+
+    def __init__(
+        self,
+        http2: bool = False,
+        cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR,
+        cache_ttl: int = 0,
+        validate: bool = True,
+    ) -> None:
+        """Create the scraper.
+
+        Args:
+            http2: Send sync requests through an HTTP/2 ``httpx.Client`` so
+                parallel queries multiplex over one connection. Requires
+                ``httpx[http2]``; falls back to ``requests`` otherwise.
+            cache_dir: Directory for cached API responses.
+            cache_ttl: Default seconds a cached response stays valid;
+                0 disables the cache.
+            validate: Run full Pydantic validation on each parsed grant.
+                Set to False for bulk loads to build grants with
+                ``Grant.model_construct`` instead.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_ttl = cache_ttl
+        self.validate = validate
+        self._client = None
+        if http2 and HTTPX_AVAILABLE:
+            try:
+                self._client = httpx.Client(
+                    http2=True,
+                    timeout=httpx.Timeout(30.0),
+                    limits=httpx.Limits(
+                        max_connections=20, max_keepalive_connections=10
+                    ),
+                )
+            except ImportError:
+                logger.warning("h2 not installed; HTTP/2 disabled for grants.gov")
+        elif http2:
+            logger.warning("httpx not installed; HTTP/2 disabled for grants.gov")
+
+        # Keep-alive session so repeated queries reuse pooled connections
+        self._session = requests.Session()
+        retries = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            raise_on_status=False,
+        )
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries),
+        )
+
+    def close(self) -> None:
+        """Release pooled connections held by the scraper."""
+        self._session.close()
+        if self._client is not None:
+            self._client.close()
+
+    def __enter__(self) -> "GrantsGovAPIScraper":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def scrape_grants(
+        self,
+        profile: OrganizationProfile,
+        limit: Optional[int] = None,
+        filters: Optional[Dict] = None,
+    ) -> List[GrantRecord]:
+        """Return grants.gov grants matching the profile's focus keywords.
+
+        The keywords are sent to the API as one OR query, so only matching
+        opportunities are downloaded. Pass ``filters={"open_only": True}``
+        to restrict the search to posted opportunities.
+        """
+        filters = filters or {}
+        extra = {"rows": limit} if limit else {}
+        grants = self.search_grants(
+            keywords=profile.get_focus_keywords(),
+            open_only=bool(filters.get("open_only")),
+            **extra,
+        )
+        records = [_to_record(g, self.source_name) for g in grants]
+        return self._truncate(records, limit)
+
+    def search_grants(
+        self,
+        query: str = "",
+        cache_ttl: Optional[int] = None,
+        keywords: Optional[List[str]] = None,
+        open_only: bool = False,
+        max_pages: int = 1,
+        **kwargs,
+    ) -> List[Grant]:
         """Search for grants using the grants.gov API.
         
         Args:
             query: Search query string
+            cache_ttl: Seconds a cached response may be reused; defaults
+                to the scraper's ``cache_ttl``
+            keywords: Keywords OR-ed into the query so the API filters
+                server-side
+            open_only: Only return posted (open) opportunities
+            max_pages: Maximum result pages to fetch; pages after the
+                first are requested concurrently
             **kwargs: Additional API parameters
             
         Returns:
@@ -39,17 +258,62 @@ class GrantsGovAPIScraper(GrantScraper):
         Raises:
             RequestException: For various network/API errors
         """
-        params = {
-            "startRecordNum": 0,
-            "oppStatuses": "forecasted,posted,closed",
-            "keyword": query,
-            "rows": 25,
-        }
-        params.update(kwargs)
+        params = self._build_params(query, kwargs, keywords, open_only)
+        ttl = self.cache_ttl if cache_ttl is None else cache_ttl
         
-        try:
+        cache_key = self._cache_key(params, max_pages)
+        
+        data = self._read_cache(cache_key, ttl)
+        if data is None:
             logger.info(f"Searching grants.gov API with query: '{query}'")
-            response = requests.get(
+            fetch = (
+                self._fetch_json_http2 if self._client is not None
+                else self._fetch_json
+            )
+            data = fetch(params)
+            pages = self._page_params(params, data, max_pages)
+            if pages:
+                with ThreadPoolExecutor(
+                    max_workers=min(len(pages), MAX_PAGE_WORKERS)
+                ) as executor:
+                    self._merge_pages(data, executor.map(fetch, pages))
+            self._write_cache(cache_key, data, ttl)
+        
+        return self._parse_hits(data)
+
+    def build_params(
+        self,
+        query: str = "",
+        keywords: Optional[List[str]] = None,
+        open_only: bool = False,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Return the API parameters ``search_grants`` sends for a query.
+
+        Lets other clients (e.g. the Scrapy spider) issue the same request.
+        """
+        return self._build_params(query, kwargs, keywords, open_only)
+
+    def parse_response(self, body: bytes) -> List[Grant]:
+        """Convert a raw grants.gov search response body into Grant objects.
+
+        Raises:
+            RequestException: If the body is not valid JSON or cannot be parsed
+        """
+        try:
+            data = _loads(body)
+        except ValueError as e:
+            logger.error(f"Invalid JSON response from grants.gov API: {e}")
+            raise RequestException(
+                "grants.gov API returned invalid data. "
+                "The service may be experiencing issues."
+            ) from e
+        return self._parse_hits(data)
+
+    def _fetch_json(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch one page of search results through the requests session."""
+        try:
+            response = self._session.get(
                 GRANTS_GOV_API_URL,
                 params=params,
                 timeout=30
@@ -72,26 +336,7 @@ class GrantsGovAPIScraper(GrantScraper):
             
         except HTTPError as e:
             logger.error(f"HTTP error from grants.gov API: {e}")
-            if response.status_code == 403:
-                raise RequestException(
-                    "Access denied by grants.gov API. "
-                    "The service may be temporarily restricted."
-                ) from e
-            elif response.status_code == 429:
-                raise RequestException(
-                    "Too many requests to grants.gov API. "
-                    "Please wait before trying again."
-                ) from e
-            elif response.status_code >= 500:
-                raise RequestException(
-                    f"grants.gov API server error ({response.status_code}). "
-                    "The service may be temporarily down."
-                ) from e
-            else:
-                raise RequestException(
-                    f"grants.gov API returned error {response.status_code}: "
-                    f"{response.text[:200]}"
-                ) from e
+            raise _status_error(response.status_code, response.text) from e
                 
         except Exception as e:
             logger.error(f"Unexpected error during API request: {e}")
@@ -101,7 +346,7 @@ class GrantsGovAPIScraper(GrantScraper):
             ) from e
         
         try:
-            data = response.json()
+            data = _loads(response.content)
         except ValueError as e:
             logger.error(f"Invalid JSON response from grants.gov API: {e}")
             raise RequestException(
@@ -109,10 +354,249 @@ class GrantsGovAPIScraper(GrantScraper):
                 "The service may be experiencing issues."
             ) from e
         
-        results = []
+        return data
+
+    def _fetch_json_http2(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch one page of search results through the HTTP/2 client."""
         try:
-            for item in data.get("oppHits", []):
-                grant = Grant(
+            response = self._client.get(GRANTS_GOV_API_URL, params=params)
+            response.raise_for_status()
+            
+        except httpx.ConnectError as e:
+            logger.error(f"Network connection failed: {e}")
+            raise RequestException(
+                "Unable to connect to grants.gov API. "
+                "Please check your internet connection."
+            ) from e
+            
+        except httpx.TimeoutException as e:
+            logger.error(f"API request timed out: {e}")
+            raise RequestException(
+                "grants.gov API request timed out. "
+                "The service may be temporarily unavailable."
+            ) from e
+            
+        except httpx.HTTPStatusError as e:
+            logger.error(f"HTTP error from grants.gov API: {e}")
+            raise _status_error(response.status_code, response.text) from e
+                
+        except Exception as e:
+            logger.error(f"Unexpected error during API request: {e}")
+            raise RequestException(
+                f"Unexpected error occurred while accessing grants.gov API: "
+                f"{e}"
+            ) from e
+        
+        try:
+            data = _loads(response.content)
+        except ValueError as e:
+            logger.error(f"Invalid JSON response from grants.gov API: {e}")
+            raise RequestException(
+                "grants.gov API returned invalid data. "
+                "The service may be experiencing issues."
+            ) from e
+        
+        return data
+
+    async def async_search_grants(
+        self,
+        query: str = "",
+        cache_ttl: Optional[int] = None,
+        keywords: Optional[List[str]] = None,
+        open_only: bool = False,
+        max_pages: int = 1,
+        session: Optional[aiohttp.ClientSession] = None,
+        **kwargs,
+    ) -> List[Grant]:
+        """Search for grants using the grants.gov API without blocking.
+        
+        Uses a shared aiohttp session so several queries can run
+        concurrently via ``asyncio.gather``. Shares the on-disk response
+        cache with ``search_grants``.
+        
+        Args:
+            query: Search query string
+            cache_ttl: Seconds a cached response may be reused; defaults
+                to the scraper's ``cache_ttl``
+            keywords: Keywords OR-ed into the query so the API filters
+                server-side
+            open_only: Only return posted (open) opportunities
+            max_pages: Maximum result pages to fetch; pages after the
+                first are requested concurrently
+            session: aiohttp session to send the requests through instead
+                of the module's shared one; the caller owns and closes it
+            **kwargs: Additional API parameters
+            
+        Returns:
+            List of Grant objects
+            
+        Raises:
+            RequestException: For various network/API errors
+        """
+        params = self._build_params(query, kwargs, keywords, open_only)
+        ttl = self.cache_ttl if cache_ttl is None else cache_ttl
+        
+        cache_key = self._cache_key(params, max_pages)
+        
+        data = self._read_cache(cache_key, ttl)
+        if data is None:
+            logger.info(f"Searching grants.gov API (async) with query: '{query}'")
+            if session is None:
+                session = await _get_aiohttp_session()
+            data = await self._async_fetch_json(params, session)
+            pages = self._page_params(params, data, max_pages)
+            if pages:
+                self._merge_pages(data, await asyncio.gather(
+                    *(self._async_fetch_json(page, session) for page in pages)
+                ))
+            self._write_cache(cache_key, data, ttl)
+        
+        return self._parse_hits(data)
+
+    async def _async_fetch_json(
+        self, params: Dict[str, Any], session: aiohttp.ClientSession
+    ) -> Dict[str, Any]:
+        """Fetch one page of search results through an aiohttp session."""
+        try:
+            async with session.get(GRANTS_GOV_API_URL, params=params) as response:
+                if response.status >= 400:
+                    text = await response.text()
+                    logger.error(
+                        f"HTTP error from grants.gov API: {response.status}"
+                    )
+                    raise _status_error(response.status, text)
+                body = await response.read()
+                
+        except RequestException:
+            raise
+            
+        except aiohttp.ClientConnectionError as e:
+            logger.error(f"Network connection failed: {e}")
+            raise RequestException(
+                "Unable to connect to grants.gov API. "
+                "Please check your internet connection."
+            ) from e
+            
+        except asyncio.TimeoutError as e:
+            logger.error(f"API request timed out: {e}")
+            raise RequestException(
+                "grants.gov API request timed out. "
+                "The service may be temporarily unavailable."
+            ) from e
+            
+        except Exception as e:
+            logger.error(f"Unexpected error during API request: {e}")
+            raise RequestException(
+                f"Unexpected error occurred while accessing grants.gov API: "
+                f"{e}"
+            ) from e
+        
+        try:
+            data = _loads(body)
+        except ValueError as e:
+            logger.error(f"Invalid JSON response from grants.gov API: {e}")
+            raise RequestException(
+                "grants.gov API returned invalid data. "
+                "The service may be experiencing issues."
+            ) from e
+        
+        return data
+
+    @staticmethod
+    def _page_params(
+        params: Dict[str, Any], first_page: Dict[str, Any], max_pages: int
+    ) -> List[Dict[str, Any]]:
+        """Return request parameters for the pages after the first one.
+
+        Uses the first response's ``hitCount`` so only pages that hold
+        results are requested, capped at ``max_pages`` pages in total.
+        """
+        rows = int(params.get("rows") or 0)
+        if max_pages <= 1 or rows <= 0:
+            return []
+        start = int(params.get("startRecordNum") or 0)
+        total = int(first_page.get("hitCount") or 0)
+        stop = min(total, start + rows * max_pages)
+        return [
+            {**params, "startRecordNum": offset}
+            for offset in range(start + rows, stop, rows)
+        ]
+
+    @staticmethod
+    def _merge_pages(data: Dict[str, Any], pages: Any) -> None:
+        """Append the hits from later pages to the first page's response."""
+        hits = data.setdefault("oppHits", [])
+        for page in pages:
+            hits.extend(page.get("oppHits", []))
+
+    @staticmethod
+    def _cache_key(params: Dict[str, Any], max_pages: int) -> Dict[str, Any]:
+        """Return the parameters a response is cached under."""
+        if max_pages > 1:
+            return {**params, "max_pages": max_pages}
+        return params
+
+    def _cache_path(self, params: Dict[str, Any]) -> Path:
+        """Return the cache file for a set of request parameters."""
+        key = json.dumps(params, sort_keys=True, default=str)
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def _read_cache(
+        self, params: Dict[str, Any], ttl: int
+    ) -> Optional[Dict[str, Any]]:
+        """Return a cached response if one is younger than ``ttl`` seconds."""
+        if ttl <= 0:
+            return None
+        path = self._cache_path(params)
+        try:
+            if time.time() - path.stat().st_mtime >= ttl:
+                return None
+            return _loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(
+        self, params: Dict[str, Any], data: Dict[str, Any], ttl: int
+    ) -> None:
+        """Store a successful response in the on-disk cache."""
+        if ttl <= 0:
+            return
+        path = self._cache_path(params)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Could not write grants.gov cache: {e}")
+
+    @staticmethod
+    def _build_params(
+        query: str,
+        extra: Dict[str, Any],
+        keywords: Optional[List[str]] = None,
+        open_only: bool = False,
+    ) -> Dict[str, Any]:
+        """Build grants.gov search parameters for a query."""
+        if keywords:
+            query = keyword_query([query, *keywords])
+        params = {
+            "startRecordNum": 0,
+            "oppStatuses": "posted" if open_only else "forecasted,posted,closed",
+            "keyword": query,
+            "rows": DEFAULT_ROWS,
+        }
+        params.update(extra)
+        return params
+
+    def _parse_hits(self, data: Dict[str, Any]) -> List[Grant]:
+        """Convert a grants.gov search response into Grant objects."""
+        build = Grant if self.validate else Grant.model_construct
+        try:
+            results = [
+                build(
                     id=(item.get("cfdaList", [""])[0] + "-" +
                         item.get("opportunityId", "")),
                     title=item.get("opportunityTitle", ""),
@@ -134,7 +618,8 @@ class GrantsGovAPIScraper(GrantScraper):
                     source="grants.gov",
                     source_url=item.get("opportunityUrl", None),
                 )
-                results.append(grant)
+                for item in data.get("oppHits", [])
+            ]
                 
         except Exception as e:
             logger.error(f"Error processing grants.gov API response: {e}")
@@ -146,3 +631,115 @@ class GrantsGovAPIScraper(GrantScraper):
             f"Successfully retrieved {len(results)} grants from grants.gov API"
         )
         return results
+
+
+class GrantsGovBatcher:
+    """Coalesce concurrent keyword lookups into batched grants.gov searches.
+
+    Keywords requested within ``max_wait_ms`` of each other (up to
+    ``batch_size``) are sent as one OR query that asks for ``rows`` results
+    per keyword; the hits are then split back out to each keyword by
+    matching title and synopsis text. When the combined response may be
+    truncated, or holds hits the API matched on other fields, the batch
+    falls back to one search per keyword, so every keyword gets the same
+    grants as an unbatched ``async_search_grants`` call.
+
+    Example:
+        batcher = GrantsGovBatcher(scraper)
+        housing, youth = await asyncio.gather(
+            batcher.get("housing"), batcher.get("youth")
+        )
+    """
+
+    def __init__(
+        self,
+        scraper: Optional[GrantsGovAPIScraper] = None,
+        batch_size: int = 16,
+        max_wait_ms: int = 20,
+        **search_kwargs: Any,
+    ) -> None:
+        self._scraper = scraper or GrantsGovAPIScraper()
+        self.batch_size = batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._search_kwargs = search_kwargs
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    def get(self, keyword: str) -> "asyncio.Future[List[Grant]]":
+        """Queue a keyword lookup and return a future for its grants."""
+        loop = asyncio.get_running_loop()
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        future = loop.create_future()
+        self._queue.put_nowait((keyword, future))
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run())
+        return future
+
+    async def _run(self) -> None:
+        """Drain the queue in batches until no lookups are pending."""
+        while not self._queue.empty():
+            batch = [self._queue.get_nowait()]
+            if self._queue.qsize() < self.batch_size - 1:
+                await asyncio.sleep(self.max_wait)
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[Any]) -> None:
+        """Search for the batch's keywords and resolve each keyword's future."""
+        keywords = list(dict.fromkeys(keyword for keyword, _ in batch))
+        try:
+            if len(keywords) == 1:
+                results = {keywords[0]: await self._search(keywords[0])}
+            else:
+                results = await self._search_batch(keywords)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for keyword, future in batch:
+            if not future.done():
+                future.set_result(list(results[keyword]))
+
+    async def _search(self, query: str, **overrides: Any) -> List[Grant]:
+        """Run one search with the batcher's search arguments."""
+        return await self._scraper.async_search_grants(
+            query=query, **{**self._search_kwargs, **overrides}
+        )
+
+    async def _search_batch(self, keywords: List[str]) -> Dict[str, List[Grant]]:
+        """Search several keywords with one OR query, splitting the hits back.
+
+        Falls back to one search per keyword when the split could differ
+        from unbatched results.
+        """
+        rows = int(self._search_kwargs.get("rows", DEFAULT_ROWS))
+        max_pages = int(self._search_kwargs.get("max_pages", 1))
+        batch_rows = rows * len(keywords)
+        grants = await self._search(keyword_query(keywords), rows=batch_rows)
+
+        split: Dict[str, List[Grant]] = {keyword: [] for keyword in keywords}
+        needles = [(keyword, keyword.lower()) for keyword in keywords]
+        unattributed = False
+        for grant in grants:
+            text = f"{grant.title} {grant.description or ''}".lower()
+            matched = False
+            for keyword, needle in needles:
+                if needle in text:
+                    split[keyword].append(grant)
+                    matched = True
+            unattributed = unattributed or not matched
+
+        if unattributed or len(grants) >= batch_rows * max_pages:
+            logger.debug(
+                "grants.gov batch of %d keywords needs per-keyword searches",
+                len(keywords),
+            )
+            batches = await asyncio.gather(
+                *(self._search(keyword) for keyword in keywords)
+            )
+            return dict(zip(keywords, batches))
+        return {keyword: hits[:rows] for keyword, hits in split.items()}
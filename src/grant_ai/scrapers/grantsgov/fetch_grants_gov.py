@@ -1,21 +1,61 @@
 """
 CLI script to fetch grants from grants.gov API and save as JSON.
 """
+import asyncio
 import json
 from pathlib import Path
 
-from grant_ai.scrapers.grantsgov.api_scraper import GrantsGovAPIScraper
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from grant_ai.scrapers.grantsgov.api_scraper import (
+    GrantsGovAPIScraper,
+    close_async_session,
+)
+
+QUERIES = ["housing"]
+
+
+async def fetch_all(queries):
+    """Fetch grants for all queries concurrently."""
+    scraper = GrantsGovAPIScraper(cache_ttl=3600)
+    try:
+        batches = await asyncio.gather(
+            *[scraper.async_search_grants(query=q, rows=10) for q in queries]
+        )
+    finally:
+        await close_async_session()
+    return [g for batch in batches for g in batch]
+
+
+def _dumps(record):
+    """Serialize one record to JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record, default=str)
+    return json.dumps(record, default=str).encode("utf-8")
+
+
+def write_grants(grants, out_path):
+    """Stream grants to a JSON array file one record at a time."""
+    with open(out_path, "wb") as f:
+        f.write(b"[")
+        for i, grant in enumerate(grants):
+            if i:
+                f.write(b",\n")
+            f.write(_dumps(grant.dict()))
+        f.write(b"]\n")
 
 
 def main():
-    scraper = GrantsGovAPIScraper()
     print("Fetching grants from grants.gov API...")
-    grants = scraper.search_grants(query="housing", rows=10)
+    grants = asyncio.run(fetch_all(QUERIES))
     print(f"Fetched {len(grants)} grants.")
     out_path = Path("data/grants_gov_housing.json")
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(out_path, "w") as f:
-        json.dump([g.dict() for g in grants], f, indent=2, default=str)
+    write_grants(grants, out_path)
     print(f"Saved to {out_path}")
 
 if __name__ == "__main__":
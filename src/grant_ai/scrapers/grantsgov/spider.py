@@ -1,29 +1,48 @@
-from datetime import datetime
+"""
+Scrapy spider for grants.gov backed by the public JSON search API.
+
+grants.gov renders search results with JavaScript, so the spider queries the
+same API as GrantsGovAPIScraper instead of parsing HTML. Code that does not
+need Scrapy pipelines should call GrantsGovAPIScraper directly and skip the
+Scrapy engine entirely.
+"""
+from urllib.parse import urlencode
 
 import scrapy
 
-from grant_ai.models.grant import EligibilityType, FundingType, Grant, GrantStatus
+from grant_ai.scrapers.grantsgov.api_scraper import (
+    GRANTS_GOV_API_URL,
+    GrantsGovAPIScraper,
+)
 
 
 class GrantsGovSpider(scrapy.Spider):
     name = "grantsgov"
     allowed_domains = ["grants.gov"]
-    start_urls = [
-        "https://www.grants.gov/web/grants/search-grants.html"
-    ]
+
+    def __init__(self, query: str = "", rows: int = 25, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.query = query
+        self.rows = int(rows)
+        self._api = GrantsGovAPIScraper()
+
+    def start_requests(self):
+        params = self._api.build_params(self.query, rows=self.rows)
+        yield scrapy.Request(
+            f"{GRANTS_GOV_API_URL}?{urlencode(params)}", callback=self.parse
+        )
 
     def parse(self, response):
-        # This is a placeholder: grants.gov uses JavaScript for search results, so real scraping would require Selenium or API
-        # For demo, parse static HTML for grant titles (if any)
-        for grant in response.css(".search-result"):  # Example selector
-            title = grant.css(".search-title::text").get()
-            funder = grant.css(".search-agency::text").get()
-            deadline = grant.css(".search-deadline::text").get()
-            url = grant.css("a::attr(href)").get()
+        # A single API page holds all requested rows; no links are followed
+        for grant in self._api.parse_response(response.body):
             yield {
-                "title": title,
-                "funder_name": funder,
-                "application_deadline": deadline,
-                "application_url": url,
+                "title": grant.title,
+                "funder_name": grant.funder_name,
+                "application_deadline": grant.application_deadline,
+                "application_url": (
+                    str(grant.application_url) if grant.application_url else None
+                ),
             }
-        # In production, use Selenium or the grants.gov API for robust scraping.
+
+    def closed(self, reason):
+        self._api.close()
@@ -2,6 +2,7 @@
 NSF Grant Scraper for Grant AI
 """
 from typing import List, Dict
+from grant_ai.utils.helpers import keyword_pattern
 from grant_ai.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -22,7 +23,12 @@ def discover_nsf_grants(keywords: List[str]) -> List[Dict]:
             {"title": "NSF AI Research Program", "description": "AI for science.", "status": "open"},
             {"title": "NSF STEM Education Grant", "description": "STEM outreach.", "status": "awarded"},
         ]
-        results = [g for g in sample_grants if any(k.lower() in g["title"].lower() for k in keywords)]
+        terms = [k for k in keywords if k]
+        if not terms:
+            return []
+        # One cached trie regex scans each title once
+        pattern = keyword_pattern(tuple(sorted(set(terms))))
+        results = [g for g in sample_grants if pattern.search(g["title"])]
         logger.info(f"NSF grants discovered: {len(results)} for keywords: {keywords}")
         return results
     except Exception as e:
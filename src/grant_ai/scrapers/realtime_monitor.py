@@ -2,24 +2,58 @@
 Real-Time Grant Monitor
 Automated monitoring for new grant opportunities and alerts.
 """
-from typing import Callable, Dict, List
-import time
+from typing import Callable, Dict, List, Optional
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
 
 class RealTimeGrantMonitor:
     """Monitor grant sources in real time and trigger alerts."""
     def __init__(self):
         self.sources: List[str] = []
+        self.intervals: Dict[str, int] = {}
         self.alert_callbacks: List[Callable[[Dict], None]] = []
-    def add_source(self, source: str):
+    def add_source(self, source: str, interval: Optional[int] = None):
+        """Add a source, optionally with its own polling interval (seconds)."""
         self.sources.append(source)
+        if interval is not None:
+            self.intervals[source] = interval
     def add_alert_callback(self, callback: Callable[[Dict], None]):
         self.alert_callbacks.append(callback)
-    def monitor(self, interval: int = 3600):
-        """Monitor sources for new grants every interval (seconds)."""
+    async def monitor(self, interval: int = 3600):
+        """Monitor all sources concurrently until cancelled.
+
+        Each source is polled by its own task on the running event loop,
+        every ``interval`` seconds unless it was added with its own
+        interval. Run with ``asyncio.run(monitor.monitor())``; calling it
+        without awaiting only creates a coroutine and polls nothing.
+        """
+        tasks = [
+            asyncio.create_task(
+                self._poll_loop(source, self.intervals.get(source, interval))
+            )
+            for source in self.sources
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+    async def _poll_loop(self, source: str, interval: int):
+        """Poll one source forever, sleeping without blocking the loop.
+
+        A failed poll (including a failing alert callback) is logged and the
+        source is polled again after ``interval``.
+        """
         while True:
-            for source in self.sources:
-                # Placeholder: simulate monitoring
-                alert = {"source": source, "new_grant": True}
-                for cb in self.alert_callbacks:
-                    cb(alert)
-            time.sleep(interval)
+            try:
+                await self._fetch(source)
+            except Exception:
+                logger.exception(f"Polling grant source {source} failed")
+            await asyncio.sleep(interval)
+    async def _fetch(self, source: str):
+        # Placeholder: simulate monitoring
+        alert = {"source": source, "new_grant": True}
+        for cb in self.alert_callbacks:
+            cb(alert)
@@ -3,34 +3,97 @@ Simple Advanced Grant Discovery Test
 Basic implementation for testing the new discovery features
 Includes robust error handling and logging.
 """
-import uuid
+import copy
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Dict, List
-import logging
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
-from grant_ai.models.grant import EligibilityType, FundingType, Grant, GrantStatus
-from grant_ai.scrapers.nsf_grants import discover_nsf_grants
-from grant_ai.scrapers.doe_grants import discover_doe_grants
+import numpy as np
+
+from grant_ai.models.grant import Grant
+from grant_ai.utils.helpers import keyword_pattern
 from grant_ai.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-@dataclass
+_WORD = re.compile(r"\w+")
+
+
+# Constant part of the _search_source stub result
+_SEARCH_STUB = {'success': True, 'message': 'Search completed'}
+
+
+@lru_cache(maxsize=None)
+def _stub_result(source: str) -> Dict:
+    """Build the stub search result for a source once."""
+    return {
+        **_SEARCH_STUB,
+        'source': source,
+        'grants': [{'title': f'Sample {source} grant', 'domain': 'ai', 'confidence': 0.9}],
+    }
+
+
+@lru_cache(maxsize=1)
+def _get_analytics():
+    """Return a shared GrantAnalytics, importing it on first use."""
+    from grant_ai.analytics.advanced_analytics import GrantAnalytics
+    return GrantAnalytics()
+
+
+# dataclass(slots=True) needs Python 3.10; older versions keep a __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class SimpleGrantResult:
-    """Simple result from grant discovery."""
+    """Simple result from grant discovery (immutable, so it can be cached and shared)."""
     source: str
     grants: List[Grant]
     success: bool
     message: str
+    count: Optional[int] = None  # len(grants), filled in when omitted
+
+    def __post_init__(self):
+        if self.count is None:
+            object.__setattr__(self, 'count', len(self.grants))
+
+
+class SampleColumns(NamedTuple):
+    """A source's sample grants stored as parallel columns."""
+    titles: List[str]
+    descriptions: List[str]
+    funders: List[str]
+    amount_mins: List[int]
+    amount_maxs: List[int]
+
+    @classmethod
+    def from_rows(cls, rows: List[Dict]) -> "SampleColumns":
+        """Transpose a list of sample dicts into columns.
+
+        Funder names repeat across grants, so they are interned and equal
+        names share one string object.
+        """
+        return cls(
+            [row['title'] for row in rows],
+            [row['description'] for row in rows],
+            [sys.intern(row['funder']) for row in rows],
+            [row['amount_min'] for row in rows],
+            [row['amount_max'] for row in rows],
+        )
 
 
 class SimpleAdvancedDiscovery:
     """Discovers AI and space technology grants from advanced sources."""
     
+    RESULT_CACHE_SIZE = 128  # Maximum number of cached keyword queries
+    
     def __init__(self):
         # Sample grants for different sources
-        self.sample_grants = {
+        samples = {
             'nasa': [
                 {
                     'title': 'NASA STTR: AI for Autonomous Spacecraft Navigation',
@@ -82,47 +145,201 @@ class SimpleAdvancedDiscovery:
                 }
             ]
         }
+        # Stored column-wise so matching only walks the title column
+        self.sample_grants = {
+            source: SampleColumns.from_rows(rows) for source, rows in samples.items()
+        }
+        # Grant objects built once; queries only select references
+        self._grants = {
+            source: self._build_sample_grants(source, columns)
+            for source, columns in self.sample_grants.items()
+        }
+        # Lower-cased titles and their word tokens (inverted index sidecar)
+        self._titles_lc = {
+            source: [title.lower() for title in columns.titles]
+            for source, columns in self.sample_grants.items()
+        }
+        self._title_tokens = {
+            source: [frozenset(_WORD.findall(title)) for title in titles]
+            for source, titles in self._titles_lc.items()
+        }
+        # Amount columns as int64 arrays for vectorized range filters
+        self._amounts = {
+            source: (
+                np.array(columns.amount_mins, dtype=np.int64),
+                np.array(columns.amount_maxs, dtype=np.int64),
+            )
+            for source, columns in self.sample_grants.items()
+        }
+        # Discovery results keyed by the normalized keyword tuple
+        self._results_cache: Dict[Tuple[str, ...], Dict[str, SimpleGrantResult]] = {}
         logger.info("Initialized SimpleAdvancedDiscovery with sample grants.")
 
     def discover_ai_space_grants(self, keywords: List[str] = None) -> Dict[str, SimpleGrantResult]:
-        """Discover grants related to AI and space technology using sample data."""
+        """Discover grants related to AI and space technology using sample data.
+
+        Results are cached per keyword set, since the sample data never
+        changes. The cache holds its own shallow copies of the grants and a
+        hit returns fresh ones, so mutating a result does not affect later
+        calls.
+        """
+        kws = self._normalize_keywords(keywords)
+        cached = self._results_cache.get(kws)
+        if cached is not None:
+            return self._copy_results(cached)
         
-        results = {}
-        for source, grants in self.sample_grants.items():
-            try:
-                filtered = [Grant(**g) for g in grants if any(k.lower() in g['title'].lower() for k in keywords)]
-                results[source] = SimpleGrantResult(
-                    source=source,
-                    grants=filtered,
-                    success=True,
-                    message=f"Found {len(filtered)} grants."
-                )
-                logger.info(f"{source}: Found {len(filtered)} grants for keywords {keywords}.")
-            except Exception as e:
-                logger.error(f"Error discovering grants for source {source}: {e}")
-                results[source] = SimpleGrantResult(
-                    source=source,
-                    grants=[],
-                    success=False,
-                    message=str(e)
-                )
+        sources = list(self.sample_grants)
+        # Sources are independent, so search them concurrently and collect
+        # each result as soon as it is ready
+        completed = {}
+        with ThreadPoolExecutor(max_workers=max(1, len(sources))) as executor:
+            futures = {
+                executor.submit(self._discover_source, source, kws): source
+                for source in sources
+            }
+            for future in as_completed(futures):
+                completed[futures[future]] = future.result()
+        results = {source: completed[source] for source in sources}
         
+        if all(r.success for r in results.values()):
+            self._remember(self._results_cache, kws, self._copy_results(results, tuple))
         return results
 
-    def _search_source(self, source: str, keywords: List[str]) -> Dict:
-        """Stub for searching a source."""
-        logger.info(f"Searching {source} for keywords: {keywords}")
+    @staticmethod
+    def _normalize_keywords(keywords: List[str] = None) -> Tuple[str, ...]:
+        """Return keywords lower-cased, de-duplicated and sorted, for use as a cache key."""
+        return tuple(sorted({k.lower() for k in keywords or ()}))
+
+    @staticmethod
+    def _copy_results(
+        results: Dict[str, SimpleGrantResult], container: type = list
+    ) -> Dict[str, SimpleGrantResult]:
+        """Return results holding shallow copies of the grants in new containers.
+
+        Cached results use ``tuple`` containers so their grant sequences
+        cannot be changed in place.
+        """
         return {
-            'source': source,
-            'success': True,
-            'grants': [{'title': f'Sample {source} grant', 'domain': 'ai', 'confidence': 0.9}],
-            'message': 'Search completed'
+            source: SimpleGrantResult(
+                source=result.source,
+                grants=container(grant.model_copy() for grant in result.grants),
+                success=result.success,
+                message=result.message,
+                count=result.count,
+            )
+            for source, result in results.items()
         }
 
+    def _remember(self, cache: Dict, key: Tuple[str, ...], value: Dict) -> None:
+        """Store a result, evicting the oldest entries beyond RESULT_CACHE_SIZE."""
+        cache[key] = value
+        # Dicts preserve insertion order, so the first keys are the oldest
+        while len(cache) > self.RESULT_CACHE_SIZE:
+            del cache[next(iter(cache))]
+
+    def clear_cache(self):
+        """Clear cached discovery results."""
+        self._results_cache.clear()
+
+    def _discover_source(self, source: str, keywords: Tuple[str, ...]) -> SimpleGrantResult:
+        """Search a single source for lower-cased keywords, capturing any error."""
+        try:
+            filtered = self._select_sample_grants(source, keywords)
+            logger.info(f"{source}: Found {len(filtered)} grants for keywords {keywords}.")
+            return SimpleGrantResult(
+                source=source,
+                grants=filtered,
+                success=True,
+                message=f"Found {len(filtered)} grants.",
+                count=len(filtered),
+            )
+        except Exception as e:
+            logger.error(f"Error discovering grants for source {source}: {e}")
+            return SimpleGrantResult(
+                source=source,
+                grants=[],
+                success=False,
+                message=str(e),
+                count=0,
+            )
+
+    @staticmethod
+    def _build_sample_grants(source: str, columns: SampleColumns) -> List[Grant]:
+        """Build the Grant objects for a source's samples.
+
+        The samples are trusted internal data, so Pydantic validation is
+        skipped with ``model_construct``.
+        """
+        return [
+            Grant.model_construct(
+                id=f"{source}_{index}",
+                title=title,
+                description=description,
+                funder_name=funder,
+                amount_min=amount_min,
+                amount_max=amount_max,
+            )
+            for index, (title, description, funder, amount_min, amount_max)
+            in enumerate(zip(*columns))
+        ]
+
+    def _select_sample_grants(self, source: str, keywords: Tuple[str, ...]) -> List[Grant]:
+        """Return a source's prebuilt grants whose title matches a keyword.
+
+        ``keywords`` must already be lower-cased. Single-word keywords are
+        matched against the precomputed title tokens with a set
+        intersection; multi-word keywords are folded into one cached regex
+        so each title is scanned once. The returned grants are shared
+        between calls.
+        """
+        words = frozenset(k for k in keywords if _WORD.fullmatch(k))
+        phrase_pattern = keyword_pattern(tuple(sorted(k for k in keywords if k not in words)))
+        rows = zip(self._title_tokens[source], self._titles_lc[source])
+        mask = np.fromiter(
+            (not words.isdisjoint(tokens) or phrase_pattern.search(title_lc) is not None
+             for tokens, title_lc in rows),
+            dtype=bool,
+            count=len(self._titles_lc[source]),
+        )
+        return self._take(source, mask)
+
+    def grants_in_amount_range(self, min_amount: Optional[int] = None,
+                               max_amount: Optional[int] = None) -> Dict[str, List[Grant]]:
+        """Return each source's sample grants whose funding range overlaps the given bounds."""
+        results = {}
+        for source, (amount_mins, amount_maxs) in self._amounts.items():
+            mask = np.ones(len(amount_mins), dtype=bool)
+            if min_amount is not None:
+                mask &= amount_maxs >= min_amount
+            if max_amount is not None:
+                mask &= amount_mins <= max_amount
+            results[source] = self._take(source, mask)
+        return results
+
+    def _take(self, source: str, mask: np.ndarray) -> List[Grant]:
+        """Return the prebuilt grants of a source selected by a boolean mask."""
+        grants = self._grants[source]
+        return [grants[i] for i in mask.nonzero()[0]]
+
+    def _search_source(self, source: str, keywords: List[str]) -> Dict:
+        """Stub for searching a source.
+
+        Returns a shallow copy of a cached per-source result; its
+        ``grants`` list is shared and must be treated as read-only.
+        """
+        logger.info(f"Searching {source} for keywords: {keywords}")
+        return dict(_stub_result(source))
+
     def get_discovery_summary(self, results: dict) -> dict:
         """Return summary of discovery results."""
-        total_grants = sum(len(r.grants) for r in results.values() if hasattr(r, 'grants'))
-        successful_sources = [k for k, r in results.items() if getattr(r, 'success', False)]
+        total_grants = 0
+        successful_sources = []
+        for k, r in results.items():
+            count = getattr(r, 'count', None)
+            if count is not None:
+                total_grants += count
+            if getattr(r, 'success', False):
+                successful_sources.append(k)
         success_rate = len(successful_sources) / max(1, len(results))
         return {
             'total_grants': total_grants,
@@ -136,19 +353,41 @@ class SimpleEnhancedGrantDiscovery(SimpleAdvancedDiscovery):
     
     def __init__(self):
         super().__init__()
+        self._analysis_cache: Dict[Tuple[str, ...], Dict] = {}
         logger.info("Initialized SimpleEnhancedGrantDiscovery.")
 
+    def clear_cache(self):
+        """Clear cached discovery results and analytics."""
+        super().clear_cache()
+        self._analysis_cache.clear()
+
     def discover_and_analyze(self, keywords: List[str]) -> Dict:
-        """Discover grants and return analytics summary."""
+        """Discover grants and return analytics summary (cached per keyword set).
+
+        Like ``discover_ai_space_grants``, the cache keeps its own copies and
+        a hit returns fresh ones.
+        """
+        key = self._normalize_keywords(keywords)
+        cached = self._analysis_cache.get(key)
+        if cached is not None:
+            return self._copy_analysis(cached)
         results = self.discover_ai_space_grants(keywords)
-        all_grants = []
-        for r in results.values():
-            if r.success:
-                all_grants.extend(r.grants)
-        from grant_ai.analytics.advanced_analytics import GrantAnalytics
-        analytics = GrantAnalytics()
-        summary = analytics.summarize_grants(all_grants)
-        return {
+        analytics = _get_analytics()
+        # summarize_grants iterates once, so stream the grants without a list
+        summary = analytics.summarize_grants(chain.from_iterable(
+            r.grants for r in results.values() if r.success
+        ))
+        analysis = {
             "results": results,
             "analytics": summary,
         }
+        if all(r.success for r in results.values()):
+            self._remember(self._analysis_cache, key, self._copy_analysis(analysis, tuple))
+        return analysis
+
+    def _copy_analysis(self, analysis: Dict, container: type = list) -> Dict:
+        """Return an analysis with copied results and analytics summary."""
+        return {
+            "results": self._copy_results(analysis["results"], container),
+            "analytics": copy.deepcopy(analysis["analytics"]),
+        }
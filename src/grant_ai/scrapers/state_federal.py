@@ -1,17 +1,179 @@
 """
-Scraper for state, federal, and common grant databases (placeholder).
+Scraper for state, federal, and common grant databases.
 """
-from typing import List
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Coroutine, Dict, List, Optional
+
+import aiohttp
 
 from grant_ai.models.grant import Grant
 
 from .base import GrantScraper
+from .grantsgov.api_scraper import GrantsGovAPIScraper
+
+logger = logging.getLogger(__name__)
+
+# An async portal search: (query, **kwargs) -> grants
+PortalSearch = Callable[..., Awaitable[List[Grant]]]
+
+# aiohttp session used by the search currently running in this context
+_current_session: ContextVar[Optional[aiohttp.ClientSession]] = ContextVar(
+    "state_federal_session", default=None
+)
+
+
+def _new_session() -> aiohttp.ClientSession:
+    """Create a pooled aiohttp session for portal searches."""
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=30),
+        timeout=aiohttp.ClientTimeout(total=30),
+    )
+
+
+def _run_in_thread(fn: Callable[..., Any], *args: Any) -> Any:
+    """Run ``fn`` on a worker thread and return its result."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(fn, *args).result()
+
+
+def _run(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine to completion from synchronous code.
+
+    ``asyncio.run`` cannot be called while this thread runs an event loop,
+    so in that case the coroutine gets its own loop on a worker thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    return _run_in_thread(asyncio.run, coro)
 
 
 class StateFederalGrantScraper(GrantScraper):
-    """Scraper for state, federal, and common grant databases."""
-    
-    def search_grants(self, query: str = "", **kwargs) -> List[Grant]:
-        # TODO: Implement actual scraping logic for grants.gov, state portals, etc.
-        # This is a placeholder for demonstration.
-        return []
+    """Scraper for state, federal, and common grant databases.
+
+    Every registered portal is searched concurrently on one event loop
+    through an aiohttp session owned by this scraper. A portal that fails is
+    logged and skipped so the others still return. grants.gov is registered
+    by default; state portals can be added with ``add_portal``.
+
+    Async callers should ``await async_search_grants``, which keeps the
+    session open between searches; release it with ``await aclose()`` or
+    ``async with``. ``search_grants`` is the blocking entry point; it uses a
+    session for the one call. Call ``close`` (or use the scraper as a
+    context manager) to release the grants.gov client's pooled connections.
+    """
+
+    def __init__(self) -> None:
+        self._grants_gov = GrantsGovAPIScraper()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.portals: Dict[str, PortalSearch] = {
+            "grants.gov": self._search_grants_gov,
+        }
+
+    def close(self) -> None:
+        """Release the grants.gov client and this scraper's aiohttp session."""
+        self._grants_gov.close()
+        self._discard_session()
+
+    async def aclose(self) -> None:
+        """Release pooled connections from async code."""
+        self._grants_gov.close()
+        session, loop = self._session, self._session_loop
+        if session is not None and loop is asyncio.get_running_loop():
+            self._session = self._session_loop = None
+            await session.close()
+        else:
+            self._discard_session()
+
+    def __enter__(self) -> "StateFederalGrantScraper":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "StateFederalGrantScraper":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def add_portal(self, name: str, search: PortalSearch) -> None:
+        """Register an async search function for another grant portal."""
+        self.portals[name] = search
+
+    def search_grants(self, query: str = "", **kwargs: Any) -> List[Grant]:
+        """Search all portals for ``query`` and return the combined grants.
+
+        Blocks until every portal answers. Called while an event loop is
+        running, the search runs on a worker thread; async code should
+        await ``async_search_grants`` instead.
+        """
+        return _run(self._search_once(query, **kwargs))
+
+    async def async_search_grants(self, query: str = "", **kwargs: Any) -> List[Grant]:
+        """Search all portals for ``query`` without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        if self._session_loop is not loop:
+            self._discard_session()
+        if self._session is None or self._session.closed:
+            self._session = _new_session()
+            self._session_loop = loop
+        return await self._async_search(self._session, query, **kwargs)
+
+    async def _search_once(self, query: str, **kwargs: Any) -> List[Grant]:
+        """Search with a session that is closed before the loop ends."""
+        async with _new_session() as session:
+            return await self._async_search(session, query, **kwargs)
+
+    async def _async_search(
+        self, session: aiohttp.ClientSession, query: str, **kwargs: Any
+    ) -> List[Grant]:
+        """Query every portal concurrently and merge their results."""
+        names = list(self.portals)
+        # Each gathered task copies this context, so portals see the session
+        token = _current_session.set(session)
+        try:
+            batches = await asyncio.gather(
+                *(self.portals[name](query, **kwargs) for name in names),
+                return_exceptions=True,
+            )
+        finally:
+            _current_session.reset(token)
+
+        grants: List[Grant] = []
+        for name, batch in zip(names, batches):
+            if isinstance(batch, BaseException):
+                logger.warning(f"Grant portal {name} failed: {batch}")
+                continue
+            grants.extend(batch)
+        return grants
+
+    async def _search_grants_gov(self, query: str, **kwargs: Any) -> List[Grant]:
+        """Search grants.gov through the session of the running search."""
+        return await self._grants_gov.async_search_grants(
+            query, session=_current_session.get(), **kwargs
+        )
+
+    def _discard_session(self) -> None:
+        """Close the aiohttp session kept by ``async_search_grants``.
+
+        The session is closed on the loop it was created on: scheduled there
+        if that loop is running, otherwise run to completion on a worker
+        thread.
+        """
+        session, loop = self._session, self._session_loop
+        self._session = self._session_loop = None
+        if session is None or session.closed:
+            return
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+        elif loop.is_closed():
+            # Its transports died with the loop; this only marks it closed
+            _run_in_thread(asyncio.run, session.close())
+        else:
+            _run_in_thread(loop.run_until_complete, session.close())
@@ -13,61 +13,405 @@ until a dedicated refactor lands.
 # pyright: reportAttributeAccessIssue=false
 # pyright: reportCallIssue=false
 # pyright: reportMissingTypeStubs=false
+import asyncio
+import hashlib
+import json
+import logging
 import re
 import socket
+import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional
-from urllib.parse import urlparse
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+from urllib.parse import parse_qs, urljoin, urlparse
 
 import requests
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+from urllib3.util.request import ACCEPT_ENCODING
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
 
 from grant_ai.models.grant import EligibilityType, FundingType, Grant, GrantStatus
+from grant_ai.scrapers.base import AHOCORASICK_AVAILABLE, _build_automaton
+from grant_ai.scrapers.grantsgov.api_scraper import GrantsGovAPIScraper
 from grant_ai.utils.headless import fetch_rendered_html
 
+logger = logging.getLogger(__name__)
+
+# Seconds a cached page is served without contacting its site (12 hours)
+DEFAULT_CACHE_TTL = 12 * 3600
+# Connection pool size per host and number of pooled hosts
+POOL_SIZE = 64
+
+# Source-id substrings -> scraper method, checked in order; sources that
+# match none of them use _scrape_generic_source
+_SOURCE_HANDLERS = (
+    (("grants_gov",), "_scrape_grants_gov"),
+    (("arts",), "_scrape_arts_source"),
+    (("education",), "_scrape_education_source"),
+    (("nsf", "nasa"), "_scrape_federal_stem"),
+    (("usda", "hud"), "_scrape_federal_community"),
+    (("youth", "afterschool", "boys_girls_clubs"), "_scrape_youth_programs"),
+)
+
+# Rows requested per grants.gov API search when max_results is not set
+GRANTS_GOV_ROWS = 25
+
+# Threads used to resolve every source host up front
+DNS_WORKERS = 32
+
+# lxml builds the tree in C; html.parser is the pure-Python fallback
+_HTML_PARSER = "lxml" if LXML_AVAILABLE else "html.parser"
+
+# Listing scrapers only search these tags, so skip building the rest
+_LISTING_TAGS = SoupStrainer(["div", "section", "article", "li", "p"])
+
+# CSS selectors compiled once and reused for every page; each is applied
+# with a result limit so matching stops early
+_GRANTS_GOV_SELECTORS = tuple(
+    soupsieve.compile(selector)
+    for selector in (
+        ":is(div, article, li):is([class*=grant], [class*=opportunity],"
+        " [class*=listing], [class*=result])",
+        ":is(div, article, li):is([id*=grant], [id*=opportunity], [id*=result])",
+        ":is(div, article, li):is([data-testid*=grant], [data-testid*=opportunity])",
+    )
+)
+_GRANTS_GOV_OPPORTUNITIES = soupsieve.compile(
+    ":is(div, li):is([class*=opportunity], [class*=grant-item], [class*=search-result])"
+)
+_ED_GOV_PROGRAMS = soupsieve.compile(
+    ":is(div, li):is([class*=program], [class*=grant], [class*=funding])"
+)
+_ED_GOV_LINKS = soupsieve.compile("a:is([href*=grants], [href*=programs], [href*=fund])")
+
+# Text patterns used by the element parsers, compiled once per process
+_AMOUNT_RE = re.compile(r"\$?(\d{1,3}(?:,\d{3})*)")
+# Cheap pre-check: a bare digit search skips text with no amount about 3x
+# faster than _AMOUNT_RE, whose optional "$" defeats prefix scanning
+_DIGIT_RE = re.compile(r"\d")
+_WHITESPACE_RE = re.compile(r"\s+")
+_CHARSET_RE = re.compile(r"charset=\"?([\w.:-]+)", re.IGNORECASE)
+# Lower-cased source-name words that mark a federal or state funder
+_FEDERAL_FUNDER_RE = re.compile(r"department|us |federal|gov|administration|agency")
+_STATE_FUNDER_RE = re.compile(r"wv|west virginia")
+
+# Words the generic scraper looks for in container class/id and header text
+_GENERIC_GRANT_KEYWORDS = ("grant", "funding", "opportunity", "program", "assistance", "apply")
+# Words a grants.gov listing page must contain before it is parsed
+_GRANTS_GOV_PAGE_KEYWORDS = ("grant", "opportunity", "listing", "result")
+
+
+
+def _attr_re(pattern: str, ignore_case: bool = True):
+    """Compile a pattern matched against every tag's class or href.
+
+    Uses RE2 when installed, which matches in linear time without
+    backtracking; its compiled patterns work anywhere find_all accepts a
+    regex. Case-insensitivity is an inline flag so both engines read it.
+    """
+    if ignore_case:
+        pattern = "(?i)" + pattern
+    return (re2 if RE2_AVAILABLE else re).compile(pattern)
+
+
+# Class/href/heading patterns the source scrapers pass to find_all
+_ARTS_CLASS_RE = _attr_re(r"grant|funding|opportunity|arts")
+_EDU_FUNDING_RE = _attr_re(r"grant|funding|assistance|finance|program|opportunity")
+_EDU_NAV_HREF_RE = _attr_re(r"grant|funding|assistance|finance|federal|program|title")
+_ED_GOV_HEADING_RE = re.compile(r"Grant|Program|Fund", re.IGNORECASE)
+_STEM_FUNDING_RE = _attr_re(r"funding|grant|opportunity|program", ignore_case=False)
+_COMMUNITY_PROGRAM_RE = _attr_re(r"program|grant|funding", ignore_case=False)
+_YOUTH_FUNDING_RE = _attr_re(r"funding|grant|program|opportunity", ignore_case=False)
+
+# Keywords the STEM, community and youth scrapers look for in class names
+_STEM_KEYWORDS = ("education", "research", "stem", "science", "technology", "engineering", "math")
+_COMMUNITY_KEYWORDS = (
+    "community",
+    "rural",
+    "housing",
+    "infrastructure",
+    "development",
+    "block grant",
+    "facilities",
+    "program",
+    "funding",
+    "grant",
+)
+_YOUTH_KEYWORDS = ("youth", "after-school", "afterschool", "children", "kids", "teen")
+
+# Phrases that mark an education page as discussing funding; the whole page
+# text is searched, so they are matched in one Aho-Corasick pass when possible
+_EDU_PAGE_KEYWORDS = frozenset(
+    (
+        "title i",
+        "title ii",
+        "title iii",
+        "title iv",
+        "federal programs",
+        "state funding",
+        "grant opportunities",
+        "financial assistance",
+        "educational grants",
+        "student aid",
+    )
+)
+# Heading levels searched for an education assistance title
+_HEADING_TAGS = ("h1", "h2", "h3", "h4", "h5", "h6")
+# Tags searched for a generic grant's title
+_GENERIC_TITLE_TAGS = ("h1", "h2", "h3", "h4", "strong", "a")
+# Header words that make a header's section worth parsing on such a page
+_EDU_HEADER_KEYWORDS = ("program", "fund", "assist", "grant", "support")
+
+# Title keywords -> assistance type, checked in order
+_ASSISTANCE_TYPE_KEYWORDS = (
+    (("scholarship", "student aid"), "Scholarship"),
+    (("loan", "lending"), "Loan"),
+    (("title i", "federal program"), "Federal Program"),
+    (("professional development", "teacher", "training"), "Professional Development"),
+    (("technology", "equipment", "infrastructure"), "Technology Grant"),
+    (("special education", "disability", "accessibility"), "Special Education Support"),
+)
+# Element text words used when the title names no type
+_ASSISTANCE_TEXT_KEYWORDS = ("assistance", "aid", "support")
+
+# Assistance type -> (funding type, typical, min, max) when no amount is parsed
+_DEFAULT_ASSISTANCE_AMOUNTS = (FundingType.GRANT, 25000, 5000, 100000)
+_ASSISTANCE_AMOUNTS = MappingProxyType(
+    {
+        "Scholarship": (FundingType.SCHOLARSHIP, 2500, 500, 10000),
+        "Loan": (FundingType.GRANT, 15000, 1000, 50000),
+        "Federal Program": (FundingType.GRANT, 50000, 10000, 500000),
+        "Professional Development": (FundingType.GRANT, 5000, 1000, 25000),
+        "Technology Grant": (FundingType.GRANT, 15000, 3000, 75000),
+        "Special Education Support": (FundingType.GRANT, 25000, 5000, 100000),
+        "Financial Assistance": (FundingType.GRANT, 10000, 2000, 50000),
+        "Educational Grant": _DEFAULT_ASSISTANCE_AMOUNTS,
+    }
+)
+
+
+# Eligibility and focus areas given to grants parsed from each kind of page;
+# tuples, so no list literal is built per grant
+_NONPROFIT_EDUCATION_ELIGIBILITY = (EligibilityType.NONPROFIT, EligibilityType.EDUCATION)
+_EDUCATION_NONPROFIT_ELIGIBILITY = (EligibilityType.EDUCATION, EligibilityType.NONPROFIT)
+_NONPROFIT_STARTUP_ELIGIBILITY = (EligibilityType.NONPROFIT, EligibilityType.STARTUP)
+_NONPROFIT_MUNICIPALITY_ELIGIBILITY = (EligibilityType.NONPROFIT, EligibilityType.MUNICIPALITY)
+_NONPROFIT_ELIGIBILITY = (EligibilityType.NONPROFIT,)
+
+_ARTS_FOCUS = ("art_education", "education")
+_EDUCATION_FOCUS = ("education", "youth_development", "student_support")
+_COMMERCE_FOCUS = ("community_development", "economic_development")
+_HEALTH_FOCUS = ("health", "social_services")
+_STEM_FOCUS = ("stem_education", "education", "research")
+_COMMUNITY_FOCUS = ("community_development", "housing", "infrastructure")
+_YOUTH_FOCUS = ("youth_development", "after_school", "education")
+_FEDERAL_FOCUS = ("general", "education", "community")
+_GENERIC_FOCUS = ("general",)
+
+
+@lru_cache(maxsize=2048)
+def _assistance_type_for_title(title_lower: str) -> Optional[str]:
+    """Return the assistance type a lower-cased title names, or None.
+
+    Cached because the same program titles recur across pages and sources.
+    """
+    for keywords, assistance_type in _ASSISTANCE_TYPE_KEYWORDS:
+        if any(word in title_lower for word in keywords):
+            return assistance_type
+    return None
 
-class WVGrantScraper:
-    """Scraper for West Virginia grant opportunities.
 
-    Parameters
-    - offline: when True, never perform network requests; return sample or
-      real-source informational entries for deterministic operation.
-    - max_results: optional cap on results returned from each source.
+@lru_cache(maxsize=1024)
+def _parse_amount(text: str) -> Optional[int]:
+    """Return the first dollar amount in ``text``, or None.
+
+    Cached because sources that share a page parse the same element text.
     """
+    if not _DIGIT_RE.search(text):
+        return None
+    match = _AMOUNT_RE.search(text)
+    return int(match.group(1).replace(",", "")) if match else None
 
-    def __init__(self, *, offline: bool = False, max_results: Optional[int] = None) -> None:
-        self.offline = offline
-        self.max_results = max_results
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            }
-        )
 
-        # Better timeout is configured per-request via timeout parameter
+def _first_amount(*texts: str) -> Optional[int]:
+    """Return the first dollar amount found, searching ``texts`` in order.
 
-        # Configure retries with backoff
-        from requests.adapters import HTTPAdapter
-        from urllib3.util.retry import Retry
+    Equivalent to searching the texts joined by spaces, without building
+    the joined string.
+    """
+    for text in texts:
+        amount = _parse_amount(text)
+        if amount is not None:
+            return amount
+    return None
+
+
+def _header_charset(headers: Mapping[str, str]) -> Optional[str]:
+    """Return the charset named in a response's Content-Type, if any."""
+    match = _CHARSET_RE.search(headers.get("Content-Type") or "")
+    return match.group(1) if match else None
+
+
+def _funder_type(source_name: str) -> str:
+    """Guess whether a source's funder is federal, state or private from its name."""
+    name_l = source_name.lower()
+    if _FEDERAL_FUNDER_RE.search(name_l):
+        return "Federal Government"
+    if _STATE_FUNDER_RE.search(name_l):
+        return "State Government"
+    return "Private Foundation"
+
+
+def _grant_id(prefix: str, title: str) -> str:
+    """Return a grant id that is stable across runs for the same title."""
+    digest = hashlib.blake2b(title.encode("utf-8"), digest_size=8).hexdigest()
+    return f"{prefix}_{digest}"
+
+
+@lru_cache(maxsize=256)
+def _real_grant_template(
+    source_name: str, url: str, title: str, description: str, focus_areas: tuple
+) -> Grant:
+    """Build (and cache) a real-source grant; callers stamp the timestamps."""
+    return Grant(
+        id=_grant_id("real", title),
+        title=title[:200],
+        description=(description or "").strip()[:1000],
+        funder_name=source_name,
+        funder_type=_funder_type(source_name),
+        funding_type=FundingType.GRANT,
+        amount_typical=25000,
+        amount_min=5000,
+        amount_max=100000,
+        status=GrantStatus.OPEN,
+        eligibility_types=[EligibilityType.NONPROFIT],
+        focus_areas=list(focus_areas) or ["general"],
+        source=source_name,
+        source_url=url,
+        application_url=url,
+        total_funding_available=None,
+        application_deadline=None,
+        decision_date=None,
+        funding_start_date=None,
+        funding_duration_months=None,
+        matching_funds_required=False,
+        matching_percentage=None,
+        information_url=None,
+        contact_email=None,
+        contact_phone=None,
+        relevance_score=None,
+    )
+
+
+def _mentions_edu_funding(text: str) -> bool:
+    """Return True if lower-cased page text contains an education funding phrase."""
+    if AHOCORASICK_AVAILABLE:
+        return next(_build_automaton(_EDU_PAGE_KEYWORDS).iter(text), None) is not None
+    return any(keyword in text for keyword in _EDU_PAGE_KEYWORDS)
+
+
+def _union_re(keywords):
+    """Compile one case-insensitive alternation matching any keyword."""
+    return _attr_re("|".join(re.escape(k) for k in keywords))
+
+
+# One alternation per keyword list, so a page is walked once rather than
+# once per keyword
+_STEM_CLASS_RE = _union_re(_STEM_KEYWORDS)
+_COMMUNITY_CLASS_RE = _union_re(_COMMUNITY_KEYWORDS)
+_YOUTH_CLASS_RE = _union_re(_YOUTH_KEYWORDS)
+_GENERIC_GRANT_RE = _union_re(_GENERIC_GRANT_KEYWORDS)
+
+# Elements the generic scraper parses per page
+_GENERIC_MAX_ELEMENTS = 10
+_CONTAINER_TAGS = frozenset(("div", "article", "section"))
+
+
+def _is_generic_container(tag) -> bool:
+    """find_all filter: a container whose class or id names a grant keyword."""
+    if tag.name not in _CONTAINER_TAGS:
+        return False
+    classes = tag.get("class") or ()
+    if _GENERIC_GRANT_RE.search(" ".join(classes)):
+        return True
+    return bool(_GENERIC_GRANT_RE.search(tag.get("id") or ""))
+
+
+# UTF-16/32 byte order marks; such pages cannot be scanned as ASCII bytes
+_WIDE_BOMS = (b"\xff\xfe", b"\xfe\xff")
+
+
+@lru_cache(maxsize=None)
+def _keyword_bytes(keywords: Tuple[str, ...]) -> Tuple[bytes, ...]:
+    """Encode lower-cased keywords once for scanning raw page bytes."""
+    return tuple(keyword.lower().encode("ascii") for keyword in keywords)
+
+
+def _has_candidates(content: bytes, keywords: Tuple[str, ...]) -> bool:
+    """Return True if ``content`` may hold elements worth a full parse.
+
+    The scrapers only parse containers whose attributes, or headers whose
+    text, contain a keyword, so a page without any keyword in its bytes
+    cannot yield grants. The check is a substring scan, far cheaper than
+    the parse it saves, and it never adds a parse to pages that have
+    candidates.
+    """
+    if content.startswith(_WIDE_BOMS):
+        return True
+    lowered = content.lower()
+    return any(keyword in lowered for keyword in _keyword_bytes(keywords))
+
+
+def _freeze_source(info: dict) -> Mapping[str, object]:
+    """Return a read-only source entry with its URLs interned.
+
+    URLs are used as keys of the per-sweep page cache, so the
+    same interned string is shared by every source listing it.
+    """
+    return MappingProxyType(
+        {
+            **info,
+            "url": sys.intern(info["url"]),
+            "fallbacks": tuple(sys.intern(url) for url in info.get("fallbacks", ())),
+        }
+    )
 
-        retry_strategy = Retry(
-            total=2,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
 
-        # Comprehensive WV and Federal grant sources
-        self.sources = {
+# Comprehensive WV and Federal grant sources. Read-only and shared by every
+# scraper instance; fallbacks are tuples
+_SOURCES: Mapping[str, Mapping[str, object]] = MappingProxyType(
+    {
+        source_id: _freeze_source(info)
+        for source_id, info in {
             # === WV STATE EDUCATION & ARTS ===
             "wv_education": {
                 "url": "https://wvde.us/",
                 "name": "WV Department of Education",
-                "fallbacks": [
+                "fallbacks": (
                     "https://wvde.us/finance/",
                     "https://wv.gov/education",
                     "https://wvde.state.wv.us/",
@@ -75,12 +419,12 @@ class WVGrantScraper:
                     "https://wvde.us/data/",
                     "https://wvde.us/school-directory/",
                     "https://wvde.us/contact/",
-                ],
+                ),
             },
             "federal_education": {
                 "url": "https://www.ed.gov/",
                 "name": "US Department of Education",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www2.ed.gov/fund/grants-apply.html",
                     "https://www.grants.gov/search-grants?query=education",
                     "https://www.grants.gov/search-grants?query=department+of+education",
@@ -89,102 +433,102 @@ class WVGrantScraper:
                     "https://www.ed.gov/fund/",
                     "https://www.ed.gov/about/offices/list/ovae/pi/AdultEd/",
                     "https://www.ed.gov/offices/OESE/CEP/",
-                ],
+                ),
             },
             "arts_commission": {
                 "url": "https://wvculture.org/arts/grants/",
                 "name": "WV Arts Commission",
-                "fallbacks": [
+                "fallbacks": (
                     "https://wvculture.org/agencies/arts/",
                     "https://wvculture.org/arts/funding/",
                     "https://wvculture.org/grants/",
                     "https://wvarts.org/",
-                ],
+                ),
             },
             "federal_arts": {
                 "url": "https://www.arts.gov/grants",
                 "name": "National Endowment for the Arts",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.arts.gov/grants/apply-grant",
                     "https://www.nea.gov/grants",
-                ],
+                ),
             },
             # === FEDERAL GRANT PORTALS ===
             "grants_gov": {
                 "url": "https://www.grants.gov/search-grants",
                 "name": "Federal Grants Portal",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.grants.gov/web/grants/search-grants.html",
                     "https://grants.gov/",
-                ],
+                ),
             },
             "grants_gov_education": {
                 "url": "https://www.grants.gov/search-grants?query=education",
                 "name": "Federal Education Grants",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.grants.gov/search-grants?query=school",
                     "https://www.grants.gov/search-grants?query=STEM",
-                ],
+                ),
             },
             "grants_gov_arts": {
                 "url": "https://www.grants.gov/search-grants?query=arts",
                 "name": "Federal Arts Grants",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.grants.gov/search-grants?query=music",
                     "https://www.grants.gov/search-grants?query=cultural",
-                ],
+                ),
             },
             "grants_gov_youth": {
                 "url": "https://www.grants.gov/search-grants?query=youth",
                 "name": "Federal Youth Programs",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.grants.gov/search-grants?query=after-school",
                     "https://www.grants.gov/search-grants?query=children",
-                ],
+                ),
             },
             # === WV STATE AGENCIES ===
             "wv_development": {
                 "url": "https://westvirginia.gov/business/",
                 "name": "WV Economic Development",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.wv.gov/business",
                     "https://development.wv.gov/",
                     "https://wvcommerce.org/",
-                ],
+                ),
             },
             "wv_health": {
                 "url": "https://dhhr.wv.gov/Pages/default.aspx",
                 "name": "WV Health & Human Resources",
-                "fallbacks": [
+                "fallbacks": (
                     "https://dhhr.wv.gov/programs/",
                     "https://dhhr.wv.gov/funding/",
                     "https://www.wv.gov/health",
-                ],
+                ),
             },
             "wv_tourism": {
                 "url": "https://wvtourism.com/grants/",
                 "name": "WV Tourism Office",
-                "fallbacks": [
+                "fallbacks": (
                     "https://wvtourism.com/industry/grants/",
                     "https://gotowv.com/grants/",
-                ],
+                ),
             },
             # === TECHNOLOGY & STEM ===
             "nsf_grants": {
                 "url": "https://www.nsf.gov/funding/",
                 "name": "National Science Foundation",
-                "fallbacks": ["https://www.nsf.gov/funding/education.jsp", "https://nsf.gov/pubs/"],
+                "fallbacks": ("https://www.nsf.gov/funding/education.jsp", "https://nsf.gov/pubs/"),
             },
             "nasa_education": {
                 "url": "https://www.nasa.gov/audience/foreducators/",
                 "name": "NASA Education Grants",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.nasa.gov/learning-resources/",
                     (
                         "https://www.nasa.gov/audience/foreducators/"
                         "postsecondary/index.html"
                     ),
-                ],
+                ),
             },
             # === COMMUNITY & NONPROFIT ===
             "usda_rural": {
@@ -193,492 +537,1165 @@ class WVGrantScraper:
                     "facilities/community-facilities-direct-loan-grant-program"
                 ),
                 "name": "USDA Rural Development",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.rd.usda.gov/programs-services",
                     "https://www.usda.gov/topics/rural",
-                ],
+                ),
             },
             "hud_community": {
                 "url": "https://www.hud.gov/program_offices/comm_planning/communitydevelopment/programs",
                 "name": "HUD Community Development",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.hud.gov/grants",
                     "https://www.hudexchange.info/programs/",
-                ],
+                ),
             },
             # === PRIVATE FOUNDATIONS (Common for CODA-type orgs) ===
             "foundation_center": {
                 "url": "https://candid.org/explore-issues/education",
                 "name": "Foundation Directory (Education)",
-                "fallbacks": [
+                "fallbacks": (
                     "https://candid.org/explore-issues/arts-culture",
                     "https://foundationcenter.org/",
-                ],
+                ),
             },
             # === WV UNIVERSITIES (Often have community programs) ===
             "wvu_extension": {
                 "url": "https://extension.wvu.edu/community-resources",
                 "name": "WVU Extension",
-                "fallbacks": ["https://extension.wvu.edu/", "https://www.wvu.edu/community/"],
+                "fallbacks": ("https://extension.wvu.edu/", "https://www.wvu.edu/community/"),
             },
             "marshall_community": {
                 "url": "https://www.marshall.edu/community/",
                 "name": "Marshall University Community",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.marshall.edu/outreach/",
                     "https://www.marshall.edu/grants/",
-                ],
+                ),
             },
             # === ENVIRONMENTAL & OUTDOOR (For camps/outdoor programs) ===
             "epa_grants": {
                 "url": "https://www.epa.gov/grants/grants-environmental-education",
                 "name": "EPA Environmental Education",
-                "fallbacks": ["https://www.epa.gov/education", "https://www.epa.gov/grants"],
+                "fallbacks": ("https://www.epa.gov/education", "https://www.epa.gov/grants"),
             },
             "wv_environmental": {
                 "url": "https://dep.wv.gov/environmental-advocate/Pages/default.aspx",
                 "name": "WV Environmental Protection",
-                "fallbacks": ["https://dep.wv.gov/", "https://www.wv.gov/environment"],
+                "fallbacks": ("https://dep.wv.gov/", "https://www.wv.gov/environment"),
             },
             # === SPECIFIC TO YOUTH & AFTER-SCHOOL ===
             "afterschool_alliance": {
                 "url": "https://www.afterschoolalliance.org/policy-advocacy/funding/",
                 "name": "Afterschool Alliance Funding",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.afterschoolalliance.org/",
                     "https://afterschoolalliance.org/policy/",
-                ],
+                ),
             },
             "boys_girls_clubs": {
                 "url": "https://www.bgca.org/about-us/our-funding/",
                 "name": "Boys & Girls Clubs Funding",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.bgca.org/get-involved/volunteer/",
                     "https://www.bgca.org/",
-                ],
+                ),
             },
             # === EXPANDED WV STATE AGENCIES ===
             "wv_commerce": {
                 "url": ("https://wvcommerce.org/business-and-industry/" "financial-assistance/"),
                 "name": "WV Commerce Department",
-                "fallbacks": [
+                "fallbacks": (
                     "https://wvcommerce.org/grants/",
                     "https://wvcommerce.org/community-development/",
                     "https://business.wv.gov/financial-assistance/",
                     "https://westvirginia.gov/business/financial-assistance/",
-                ],
+                ),
             },
             "wv_agriculture": {
                 "url": "https://agriculture.wv.gov/programs/",
                 "name": "WV Department of Agriculture",
-                "fallbacks": [
+                "fallbacks": (
                     "https://agriculture.wv.gov/grants/",
                     "https://agriculture.wv.gov/community-programs/",
                     "https://www.wv.gov/agriculture",
-                ],
+                ),
             },
             "wv_workforce": {
                 "url": "https://workforcewv.org/employers/funding-opportunities/",
                 "name": "WV Workforce Development",
-                "fallbacks": [
+                "fallbacks": (
                     "https://workforcewv.org/training-grants/",
                     "https://workforcewv.org/workforce-innovation/",
                     "https://www.wv.gov/workforce",
-                ],
+                ),
             },
             "wv_housing": {
                 "url": "https://www.wvhdf.com/programs/",
                 "name": "WV Housing Development Fund",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.wvhdf.com/community-programs/",
                     "https://www.wvhdf.com/grants/",
                     "https://housing.wv.gov/",
-                ],
+                ),
             },
             "wv_veterans": {
                 "url": "https://veterans.wv.gov/assistance/",
                 "name": "WV Veterans Affairs",
-                "fallbacks": ["https://veterans.wv.gov/programs/", "https://www.wv.gov/veterans"],
+                "fallbacks": ("https://veterans.wv.gov/programs/", "https://www.wv.gov/veterans"),
             },
             # === EXPANDED FEDERAL AGENCIES ===
             "hhs_grants": {
                 "url": "https://www.hhs.gov/grants/",
                 "name": "Department of Health & Human Services",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.hhs.gov/grants/how-to-apply-for-grants/",
                     "https://www.acf.hhs.gov/grants",
                     "https://www.cdc.gov/grants/",
                     "https://www.grants.gov/search-grants?query=HHS",
-                ],
+                ),
             },
             "dol_workforce": {
                 "url": "https://www.dol.gov/agencies/eta/grants",
                 "name": "Department of Labor - Workforce Grants",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.dol.gov/grants/",
                     "https://www.apprenticeship.gov/grants",
                     "https://www.doleta.gov/grants/",
-                ],
+                ),
             },
             "doj_community": {
                 "url": "https://bja.ojp.gov/funding/current",
                 "name": "Department of Justice - Community Programs",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.ojp.gov/funding/current",
                     "https://ojjdp.ojp.gov/funding/current",
                     "https://www.justice.gov/grants",
-                ],
+                ),
             },
             "va_community": {
                 "url": "https://www.va.gov/homeless/ssvf/",
                 "name": "Veterans Affairs - Community Support",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.va.gov/homeless/ssvf/grantees/",
                     "https://www.va.gov/grants/",
                     "https://www.va.gov/homeless/",
-                ],
+                ),
             },
             "dot_transportation": {
                 "url": "https://www.transportation.gov/grants",
                 "name": "Department of Transportation",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.fhwa.dot.gov/grants/",
                     "https://www.fta.dot.gov/grants/",
                     "https://www.transportation.gov/buildamerica",
-                ],
+                ),
             },
             "usda_community": {
                 "url": "https://www.rd.usda.gov/programs-services/community-facilities",
                 "name": "USDA Community Facilities",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.usda.gov/topics/farming/grants-and-loans",
                     "https://www.rd.usda.gov/programs-services",
                     "https://www.grants.gov/search-grants?query=USDA",
-                ],
+                ),
             },
             "cdc_prevention": {
                 "url": "https://www.cdc.gov/grants/funding/current.html",
                 "name": "CDC Prevention & Health Grants",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.cdc.gov/grants/",
                     "https://www.cdc.gov/injury/fundedprograms/",
                     "https://www.cdc.gov/chronicdisease/programs-impact/",
-                ],
+                ),
             },
             # === MAJOR PRIVATE FOUNDATIONS ===
             "gates_foundation": {
                 "url": "https://www.gatesfoundation.org/about/committed-grants",
                 "name": "Bill & Melinda Gates Foundation",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.gatesfoundation.org/how-we-work/general-information/grant-opportunities",
                     "https://gcgh.grandchallenges.org/",
                     "https://www.gatesfoundation.org/",
-                ],
+                ),
             },
             "ford_foundation": {
                 "url": "https://www.fordfoundation.org/work/our-grants/",
                 "name": "Ford Foundation",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.fordfoundation.org/work/learning/grantcraft/",
                     "https://www.fordfoundation.org/about/how-we-work/",
-                ],
+                ),
             },
             "robert_wood_johnson": {
                 "url": "https://www.rwjf.org/en/grants/active-funding-opportunities.html",
                 "name": "Robert Wood Johnson Foundation",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.rwjf.org/en/grants.html",
                     "https://www.rwjf.org/en/how-we-work/grants-and-grant-programs.html",
-                ],
+                ),
             },
             "kresge_foundation": {
                 "url": "https://kresge.org/opportunities/",
                 "name": "Kresge Foundation",
-                "fallbacks": ["https://kresge.org/programs/", "https://kresge.org/our-work/"],
+                "fallbacks": ("https://kresge.org/programs/", "https://kresge.org/our-work/"),
             },
             "knight_foundation": {
                 "url": "https://knightfoundation.org/apply/",
                 "name": "Knight Foundation",
-                "fallbacks": [
+                "fallbacks": (
                     "https://knightfoundation.org/grants/",
                     "https://knightfoundation.org/programs/",
-                ],
+                ),
             },
             "w_k_kellogg": {
                 "url": "https://www.wkkf.org/grants",
                 "name": "W.K. Kellogg Foundation",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.wkkf.org/what-we-do/grants",
                     "https://www.wkkf.org/resource-directory",
-                ],
+                ),
             },
             "casey_foundation": {
                 "url": "https://www.aecf.org/work/grant-making",
                 "name": "Annie E. Casey Foundation",
-                "fallbacks": ["https://www.aecf.org/work/", "https://www.aecf.org/"],
+                "fallbacks": ("https://www.aecf.org/work/", "https://www.aecf.org/"),
             },
             # === ARTS & CULTURE FOUNDATIONS ===
             "doris_duke": {
                 "url": "https://www.ddcf.org/grant-programs/",
                 "name": "Doris Duke Charitable Foundation",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.ddcf.org/what-we-fund/",
                     "https://www.ddcf.org/grant-programs/arts-program/",
-                ],
+                ),
             },
             "andrew_mellon": {
                 "url": "https://mellon.org/grants/",
                 "name": "Andrew W. Mellon Foundation",
-                "fallbacks": [
+                "fallbacks": (
                     "https://mellon.org/programs/",
                     "https://mellon.org/grants/grants-database/",
-                ],
+                ),
             },
             "pew_charitable": {
                 "url": "https://www.pewtrusts.org/en/projects",
                 "name": "Pew Charitable Trusts",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.pewtrusts.org/en/about/funding-opportunities",
                     "https://www.pewtrusts.org/",
-                ],
+                ),
             },
             # === YOUTH & EDUCATION FOUNDATIONS ===
             "wallace_foundation": {
                 "url": "https://www.wallacefoundation.org/grants-and-contracts",
                 "name": "Wallace Foundation",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.wallacefoundation.org/knowledge-center/pages/funding-opportunity.aspx",
                     "https://www.wallacefoundation.org/",
-                ],
+                ),
             },
             "stuart_foundation": {
                 "url": "https://stuartfoundation.org/what-we-fund/",
                 "name": "Stuart Foundation",
-                "fallbacks": [
+                "fallbacks": (
                     "https://stuartfoundation.org/grants/",
                     "https://stuartfoundation.org/",
-                ],
+                ),
             },
             "noyce_foundation": {
                 "url": "https://www.noycefdn.org/grants/",
                 "name": "Noyce Foundation",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.noycefdn.org/what-we-fund/",
                     "https://www.noycefdn.org/",
-                ],
+                ),
             },
             # === CORPORATE GIVING PROGRAMS ===
             "walmart_foundation": {
                 "url": "https://walmart.org/how-we-give/local-community-grants",
                 "name": "Walmart Foundation",
-                "fallbacks": [
+                "fallbacks": (
                     "https://walmart.org/how-we-give",
                     "https://corporate.walmart.com/giving",
-                ],
+                ),
             },
             "target_community": {
                 "url": "https://corporate.target.com/corporate-responsibility/community/grants",
                 "name": "Target Community Grants",
-                "fallbacks": [
+                "fallbacks": (
                     "https://corporate.target.com/corporate-responsibility/community",
                     "https://corporate.target.com/giving",
-                ],
+                ),
             },
             "google_org": {
                 "url": "https://www.google.org/our-commitments/",
                 "name": "Google.org",
-                "fallbacks": ["https://www.google.org/how-we-help/", "https://www.google.org/"],
+                "fallbacks": ("https://www.google.org/how-we-help/", "https://www.google.org/"),
             },
             "microsoft_philanthropies": {
                 "url": "https://www.microsoft.com/en-us/philanthropies/grants",
                 "name": "Microsoft Philanthropies",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.microsoft.com/en-us/philanthropies/",
                     "https://www.microsoft.com/en-us/teals/grants",
-                ],
+                ),
             },
             # === HOUSING & COMMUNITY DEVELOPMENT ===
             "enterprise_community": {
                 "url": "https://www.enterprisecommunity.org/financing-and-development",
                 "name": "Enterprise Community Partners",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.enterprisecommunity.org/solutions-and-innovation/grant-programs",
                     "https://www.enterprisecommunity.org/",
-                ],
+                ),
             },
             "local_initiatives": {
                 "url": "https://www.lisc.org/our-resources/resource/grants-funding/",
                 "name": "Local Initiatives Support Corporation",
-                "fallbacks": ["https://www.lisc.org/our-resources/", "https://www.lisc.org/"],
+                "fallbacks": ("https://www.lisc.org/our-resources/", "https://www.lisc.org/"),
             },
             "habitat_humanity": {
                 "url": "https://www.habitat.org/support/ways-to-give/grants",
                 "name": "Habitat for Humanity",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.habitat.org/support",
                     "https://www.habitat.org/local-grants",
-                ],
+                ),
             },
             # === SENIOR SERVICES & AGING ===
             "aoa_grants": {
                 "url": "https://acl.gov/grants",
                 "name": "Administration on Aging",
-                "fallbacks": [
+                "fallbacks": (
                     "https://acl.gov/grants/open-opportunities",
                     "https://www.acl.gov/programs",
-                ],
+                ),
             },
             "aarp_foundation": {
                 "url": "https://www.aarp.org/aarp-foundation/grants/",
                 "name": "AARP Foundation",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.aarp.org/aarp-foundation/",
                     "https://www.aarp.org/aarp-foundation/our-work/",
-                ],
+                ),
             },
             # === SPECIALIZED STEM & ROBOTICS ===
             "first_robotics": {
                 "url": "https://www.firstinspires.org/resource-library/funding-your-team",
                 "name": "FIRST Robotics Funding",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.firstinspires.org/robotics/frc/grants",
                     "https://www.firstinspires.org/ways-to-help/fundraising",
-                ],
+                ),
             },
             "simons_foundation": {
                 "url": "https://www.simonsfoundation.org/grants/",
                 "name": "Simons Foundation",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.simonsfoundation.org/funding-opportunities/",
                     "https://www.simonsfoundation.org/",
-                ],
+                ),
             },
             "gordon_betty_moore": {
                 "url": "https://www.moore.org/grants",
                 "name": "Gordon and Betty Moore Foundation",
-                "fallbacks": ["https://www.moore.org/what-we-fund", "https://www.moore.org/"],
+                "fallbacks": ("https://www.moore.org/what-we-fund", "https://www.moore.org/"),
             },
             # === COMMUNITY FOUNDATIONS ===
             "community_foundation_network": {
                 "url": "https://www.cof.org/community-foundation-locator",
                 "name": "Community Foundation Network",
-                "fallbacks": ["https://www.cof.org/", "https://www.communityFoundations.org/"],
+                "fallbacks": ("https://www.cof.org/", "https://www.communityFoundations.org/"),
             },
             "wv_community_foundation": {
                 "url": "https://www.wvcommunityFoundation.org/grants/",
                 "name": "WV Community Foundation",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.wvcommunityFoundation.org/",
                     "https://www.wvcommunityFoundation.org/nonprofits/",
-                ],
+                ),
             },
             # === FAITH-BASED ORGANIZATIONS (for Christian Pocket Community) ===
             "lilly_endowment": {
                 "url": "https://lillyendowment.org/grants/",
                 "name": "Lilly Endowment",
-                "fallbacks": [
+                "fallbacks": (
                     "https://lillyendowment.org/what-we-fund/",
                     "https://lillyendowment.org/",
-                ],
+                ),
             },
             "templeton_foundation": {
                 "url": "https://www.templeton.org/grants",
                 "name": "John Templeton Foundation",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.templeton.org/funding-areas",
                     "https://www.templeton.org/",
-                ],
+                ),
             },
             # === NEW SOURCES FOR ENHANCED DISCOVERY ===
             "wv_dhhr_grants": {
                 "url": "https://dhhr.wv.gov/grants/",
                 "name": "WV Department of Health and Human Resources",
-                "fallbacks": [
+                "fallbacks": (
                     "https://dhhr.wv.gov/programs/",
                     "https://dhhr.wv.gov/funding/",
                     "https://www.wv.gov/health",
-                ],
+                ),
             },
             "wv_commerce_grants": {
                 "url": "https://wvcommerce.org/business-and-industry/financial-assistance/",
                 "name": "WV Department of Commerce",
-                "fallbacks": [
+                "fallbacks": (
                     "https://wvcommerce.org/grants/",
                     "https://wvcommerce.org/community-development/",
                     "https://business.wv.gov/financial-assistance/",
                     "https://westvirginia.gov/business/financial-assistance/",
-                ],
+                ),
             },
             "wv_development_office": {
                 "url": "https://westvirginia.gov/business/",
                 "name": "WV Development Office",
-                "fallbacks": [
+                "fallbacks": (
                     "https://www.wv.gov/business",
                     "https://development.wv.gov/",
                     "https://wvcommerce.org/",
-                ],
+                ),
             },
             "wv_cdbg_program": {
                 "url": "https://wvcad.org/community-development/community-development-block-grant/",
                 "name": "WV Community Development Block Grant Program",
-                "fallbacks": [
+                "fallbacks": (
                     "https://wvcad.org/community-development/",
                     "https://wvcad.org/grants/",
-                ],
+                ),
             },
+        }.items()
+    }
+)
+
+
+# Informational entries pointing at the real source, chosen by the first
+# rule whose substrings all appear in the lower-cased source name:
+# (name substrings, ((title, description, focus areas), ...))
+_REAL_SOURCE_PROGRAMS = (
+    (
+        ("wv", "education"),
+        (
+            (
+                "WV Title I School Improvement Programs",
+                "Federal Title I funding for schools serving low-income students. Contact WV Department of Education for current availability and application procedures.",
+                ("title_i", "school_improvement", "low_income_schools"),
+            ),
+            (
+                "WV Education Finance and Funding Information",
+                "Information about state and federal education funding opportunities. Visit the WV Department of Education finance section for current programs.",
+                ("education_funding", "state_programs", "federal_programs"),
+            ),
+        ),
+    ),
+    (
+        ("federal", "education"),
+        (
+            (
+                "Federal Education Grant Programs",
+                "Visit the U.S. Department of Education website for current federal education grant opportunities including Title programs, STEM initiatives, and special education funding.",
+                ("federal_education", "title_programs", "stem"),
+            ),
+        ),
+    ),
+    (
+        ("arts",),
+        (
+            (
+                "Arts Education Funding Opportunities",
+                "Contact the arts commission directly for current grant cycles and application requirements for arts education and community programs.",
+                ("arts_education", "community_arts", "cultural_programs"),
+            ),
+        ),
+    ),
+    (
+        ("nsf",),
+        (
+            (
+                "NSF Education and Human Resources Programs",
+                "National Science Foundation offers various STEM education programs. Visit NSF.gov for current funding opportunities and submission deadlines.",
+                ("stem_education", "research", "teacher_development"),
+            ),
+        ),
+    ),
+)
+
+# (source-id substrings, source-name substrings, fallback method), checked
+# in order; sources matching none of them get generic samples
+_OFFLINE_FALLBACKS = (
+    (("education",), ("education", "ed "), "_get_sample_education_grants"),
+    (("arts",), ("arts",), "_get_sample_education_grants"),
+    (("youth", "afterschool"), ("youth",), "_get_sample_youth_grants"),
+    (
+        ("nsf", "nasa", "stem"),
+        ("nasa", "science", "technology", "engineering", "math"),
+        "_get_sample_stem_grants",
+    ),
+    (
+        ("hud", "usda", "community", "housing"),
+        ("community", "housing", "rural", "development"),
+        "_get_sample_community_grants",
+    ),
+    (("health", "dhhr"), ("health", "human"), "_get_sample_health_grants"),
+    (
+        ("commerce", "development", "workforce", "business"),
+        ("commerce", "development", "workforce", "business"),
+        "_get_sample_commerce_grants",
+    ),
+    (("grants_gov", "grants-gov", "portal"), ("grants",), "_get_real_source_information"),
+)
+
+
+@lru_cache(maxsize=256)
+def _offline_fallback_name(source_id: str, name: str) -> str:
+    """Return the name of the fallback method for a source."""
+    sid = source_id.lower()
+    name_l = name.lower()
+    for id_keys, name_keys, method_name in _OFFLINE_FALLBACKS:
+        if any(k in sid for k in id_keys) or any(k in name_l for k in name_keys):
+            return method_name
+    return "_get_sample_generic_grants"
+
+
+# Sample grants returned when a source cannot be scraped, as
+# (title, description, typical amount, focus areas)
+_SAMPLE_EDUCATION_GRANTS = (
+    (
+        "Title I School Improvement Grant",
+        "Federal funding for schools with high percentages of low-income students to improve academic achievement.",
+        50000,
+        ("education", "school_improvement", "title_i"),
+    ),
+    (
+        "STEM Education Enhancement Grant",
+        "Support for science, technology, engineering, and mathematics education programs and initiatives.",
+        35000,
+        ("stem_education", "technology", "science"),
+    ),
+    (
+        "After-School Academic Support Grant",
+        "Funding for after-school programs that provide academic support and enrichment activities.",
+        20000,
+        ("after_school", "academic_support", "tutoring"),
+    ),
+    (
+        "Teacher Professional Development Grant",
+        "Professional development opportunities for teachers to enhance instructional practices.",
+        15000,
+        ("teacher_training", "professional_development", "education"),
+    ),
+)
+_SAMPLE_STEM_GRANTS = (
+    (
+        "NSF Education and Human Resources Grant",
+        "Support for STEM education research and development of innovative educational approaches.",
+        150000,
+        ("stem_education", "research", "innovation"),
+    ),
+    (
+        "Robotics Education Initiative Grant",
+        "Funding for robotics programs in schools and community centers to engage students in STEM.",
+        40000,
+        ("robotics", "stem_education", "technology"),
+    ),
+    (
+        "NASA STEM Engagement Grant",
+        "Educational programs that use NASA resources to inspire student interest in STEM careers.",
+        60000,
+        ("stem_education", "space_science", "career_development"),
+    ),
+)
+_SAMPLE_COMMUNITY_GRANTS = (
+    (
+        "Rural Community Development Grant",
+        "USDA funding for essential community facilities and infrastructure in rural areas.",
+        200000,
+        ("rural_development", "community_facilities", "infrastructure"),
+    ),
+    (
+        "Housing Development Grant",
+        "Support for affordable housing development and rehabilitation projects.",
+        300000,
+        ("housing", "affordable_housing", "development"),
+    ),
+    (
+        "Community Services Block Grant",
+        "Funding for programs that help low-income individuals and families achieve self-sufficiency.",
+        80000,
+        ("community_services", "poverty_alleviation", "self_sufficiency"),
+    ),
+)
+_SAMPLE_YOUTH_GRANTS = (
+    (
+        "21st Century Community Learning Centers Grant",
+        "Federal funding for after-school and summer learning programs that serve students in high-need communities.",
+        50000,
+        ("after_school", "summer_programs", "academic_support"),
+    ),
+    (
+        "Youth Development Program Grant",
+        "Support for programs that promote positive youth development through mentoring and skill-building.",
+        30000,
+        ("youth_development", "mentoring", "life_skills"),
+    ),
+    (
+        "Boys & Girls Club Programming Grant",
+        "Funding for programming that supports academic success, character development, and healthy lifestyles.",
+        25000,
+        ("youth_programming", "character_development", "healthy_lifestyles"),
+    ),
+)
+_SAMPLE_GENERIC_GRANTS = (
+    (
+        "General Program Support Grant",
+        "Flexible funding to support general operations and program activities.",
+        20000,
+        ("general_support", "operations", "programming"),
+    ),
+    (
+        "Capacity Building Grant",
+        "Support for organizational development and capacity building activities.",
+        15000,
+        ("capacity_building", "organizational_development", "training"),
+    ),
+)
+
+
+class WVGrantScraper:
+    """Scraper for West Virginia grant opportunities.
+
+    Parameters
+    - offline: when True, never perform network requests; return sample or
+      real-source informational entries for deterministic operation.
+    - max_results: optional cap on results returned from each source.
+    - cache_dir: directory to cache fetched pages in, with their ETag and
+      Last-Modified validators. The cache is off unless a directory is
+      given (the default is None).
+    - cache_ttl: seconds a cached page is reused without a request, 12
+      hours by default, so results can be that stale. After that, a page
+      served with an ETag or Last-Modified header is revalidated with a
+      conditional GET and reused on ``304 Not Modified``. 0 always
+      revalidates. Ignored without ``cache_dir``.
+    - http2: fetch pages through an HTTP/2 ``httpx.Client`` so fallback URLs
+      on the same host multiplex over one connection. Requires
+      ``httpx[http2]``; falls back to ``requests`` otherwise.
+    """
+
+    # Listing pages are parsed from at most this many (decoded) bytes
+    _MAX_BYTES = 2_000_000
+
+    # (connect, read) timeout in seconds for every page request
+    TIMEOUT = (3.05, 10)
+
+    # Consecutive network failures after which a host is skipped; the
+    # counts are reset when a new sweep starts
+    MAX_HOST_FAILURES = 3
+
+    # Requests allowed in flight to one host at a time
+    HOST_CONCURRENCY = 2
+
+    # Seconds a candidate URL may take before the next one is prefetched
+    HEDGE_DELAY = 2.0
+
+    # Worker threads used by scrape_all
+    SCRAPE_WORKERS = 10
+
+    def __init__(
+        self,
+        *,
+        offline: bool = False,
+        max_results: Optional[int] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        http2: bool = False,
+    ) -> None:
+        self.offline = offline
+        self.max_results = max_results
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.cache_ttl = cache_ttl
+        self.session = requests.Session()
+        self.session.headers.update(
+            {
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+                # gzip/deflate, plus br and zstd when brotli/zstandard are
+                # installed so urllib3 can decode them
+                "Accept-Encoding": ACCEPT_ENCODING,
+                "Connection": "keep-alive",
+            }
+        )
+
+        # Configure a short retry budget; dead hosts are also cut off by
+        # the per-sweep circuit breaker in _load_page
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retry_strategy = Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        )
+        # One pool slot per concurrently scraped source, so the sweep in
+        # scrape_all_sources reuses connections instead of discarding them
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retry_strategy
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._client = None
+        if http2 and HTTPX_AVAILABLE:
+            try:
+                self._client = httpx.Client(
+                    http2=True,
+                    headers=dict(self.session.headers),
+                    follow_redirects=True,
+                    limits=httpx.Limits(
+                        max_connections=POOL_SIZE, max_keepalive_connections=32
+                    ),
+                )
+            except ImportError:
+                logger.warning("h2 not installed; HTTP/2 disabled for WV grant sources")
+        elif http2:
+            logger.warning("httpx not installed; HTTP/2 disabled for WV grant sources")
+
+        # grants.gov sources are searched through its JSON API
+        self._grants_gov_api = GrantsGovAPIScraper()
+
+        # url -> page body future while scrape_all_sources runs, so a URL
+        # listed by several sources is fetched once per sweep
+        self._sweep_pages: Optional[Dict[str, Future]] = None
+        self._sweep_lock = threading.Lock()
+        # Runs hedged fallback prefetches during a sweep
+        self._prefetch_pool: Optional[ThreadPoolExecutor] = None
+        # host -> consecutive connect/read failures in the current sweep
+        self._host_failures: Dict[str, int] = {}
+        # host -> semaphore capping concurrent requests to it
+        self._host_slots: Dict[str, threading.Semaphore] = {}
+
+        # host -> whether it resolved, filled by _prewarm_dns and on demand
+        self._dns_ok: Dict[str, bool] = {}
+
+        # url -> charset its server declared, handed to the parser so it
+        # does not have to sniff or guess the encoding
+        self._charsets: Dict[str, str] = {}
+
+        self.sources = _SOURCES
+
+        # Timestamp for every grant built in a sweep, refreshed per sweep
+        self._run_ts = datetime.now()
+
+        # Scraper method for each source, resolved once
+        self._handlers: Dict[str, Callable[[dict], list]] = {
+            source_id: self._resolve_handler(source_id) for source_id in self.sources
         }
 
-    def _check_dns_resolution(self, url: str) -> bool:
-        """Check if a domain can be resolved."""
+    @staticmethod
+    def _resolve_host(host: str) -> bool:
+        """Return True if ``host`` resolves."""
         try:
-            domain = urlparse(url).netloc
-            socket.gethostbyname(domain)
+            socket.gethostbyname(host)
             return True
-        except (socket.gaierror, OSError):
+        except (socket.gaierror, OSError, UnicodeError):
             return False
 
-    def scrape_all_sources(self) -> list[Grant]:
-        """Scrape grants from all WV sources with enhanced error handling."""
-        all_grants = []
-        for source_id, source_info in self.sources.items():  # noqa: BLE001
+    def _prewarm_dns(self, sources: Optional[Mapping[str, Mapping]] = None) -> None:
+        """Resolve every source and fallback host concurrently.
+
+        Results are cached, so later checks are dict lookups and the OS
+        resolver cache is warm before the sweep connects. Defaults to all
+        of ``self.sources``.
+        """
+        if sources is None:
+            sources = self.sources
+        hosts = {
+            urlparse(url).hostname
+            for info in sources.values()
+            for url in [info.get("url", ""), *info.get("fallbacks", ())]
+        }
+        hosts = [host for host in hosts if host and host not in self._dns_ok]
+        if not hosts:
+            return
+        with ThreadPoolExecutor(max_workers=min(DNS_WORKERS, len(hosts))) as executor:
+            self._dns_ok.update(zip(hosts, executor.map(self._resolve_host, hosts)))
+
+    def _check_dns_resolution(self, url: str) -> bool:
+        """Check if a domain can be resolved, using the cached result if any."""
+        host = urlparse(url).hostname
+        if not host:
+            return False
+        resolved = self._dns_ok.get(host)
+        if resolved is None:
+            resolved = self._dns_ok[host] = self._resolve_host(host)
+        return resolved
+
+    def close(self) -> None:
+        """Release pooled connections held by the scraper."""
+        self.session.close()
+        self._grants_gov_api.close()
+        if self._client is not None:
+            self._client.close()
+
+    def _get_page(self, url: str, timeout: Optional[tuple] = None) -> bytes:
+        """Fetch a page body, at most once per URL during a sweep.
+
+        Other threads asking for a URL that is already being fetched wait
+        for that fetch and share its body (or error).
+        """
+        if timeout is None:
+            timeout = self.TIMEOUT
+        pages = self._sweep_pages
+        if pages is None:
+            return self._load_page(url, timeout)
+        with self._sweep_lock:
+            future = pages.get(url)
+            owner = future is None
+            if owner:
+                future = pages[url] = Future()
+        if owner:
             try:
-                # Always use robust scraping path; internal fallbacks are handled within the method
-                grants = self._scrape_source_robust(source_id, source_info)
-                all_grants.extend(grants)
+                future.set_result(self._load_page(url, timeout))
             except Exception as e:
-                print(f"Error scraping {source_id}: {e}")  # noqa: BLE001
-        return all_grants
+                future.set_exception(e)
+        return future.result()
+
+    def _candidate_urls(self, source_info: Mapping) -> Iterator[str]:
+        """Yield a source's URL and then its fallbacks, hedging slow fetches.
+
+        During a sweep, the URL handed out is fetched on the prefetch pool
+        (the caller's ``_get_page`` shares that fetch), and the next URL is
+        prefetched only if this one fails or is still running after
+        ``HEDGE_DELAY`` seconds. Prefetches that have not started are
+        cancelled once the caller stops iterating, e.g. by ``break``.
+        """
+        urls = [url for url in (source_info.get("url"), *source_info.get("fallbacks", ())) if url]
+        pool = self._prefetch_pool
+        if pool is None or len(urls) < 2:
+            yield from urls
+            return
+        stop = threading.Event()
+        pending: List[Future] = []
+        try:
+            for url, fallback in zip(urls, urls[1:]):
+                primary = pool.submit(self._get_page, url)
+                pending += [primary, pool.submit(self._hedge, primary, fallback, stop)]
+                yield url
+            yield urls[-1]
+        finally:
+            stop.set()
+            for future in pending:
+                future.cancel()
+
+    def _hedge(self, primary: Future, fallback: str, stop: threading.Event) -> None:
+        """Prefetch ``fallback`` if ``primary`` fails or outlasts HEDGE_DELAY."""
+        done, _ = wait([primary], timeout=self.HEDGE_DELAY)
+        if stop.is_set() or (done and primary.exception() is None):
+            return
+        try:
+            self._get_page(fallback)
+        except Exception:
+            # The caller sees the error if it asks for this URL itself
+            pass
+
+    def _host_slot(self, host: str) -> threading.Semaphore:
+        """Return the semaphore limiting concurrent requests to ``host``."""
+        slot = self._host_slots.get(host)
+        if slot is None:
+            with self._sweep_lock:
+                slot = self._host_slots.setdefault(
+                    host, threading.Semaphore(self.HOST_CONCURRENCY)
+                )
+        return slot
+
+    def _load_page(self, url: str, timeout: tuple) -> bytes:
+        """Fetch a page body through the shared session (or HTTP/2 client).
+
+        The body is streamed and cut off after ``_MAX_BYTES``. A page cached
+        less than ``cache_ttl`` seconds ago is returned without a request.
+        An older one with validators is revalidated with a conditional GET
+        and its stored body returned on ``304 Not Modified``.
+
+        Raises ``requests.exceptions.HTTPError`` for error statuses,
+        including 403 from sites that block bots, and
+        ``requests.exceptions.ConnectionError`` without connecting when the
+        host does not resolve or has failed ``MAX_HOST_FAILURES`` times in a
+        row. At most ``HOST_CONCURRENCY`` requests to a host run at once.
+        """
+        meta, body_path = self._read_cache(url)
+        if meta is not None and time.time() - meta.get("fetched_at", 0) < self.cache_ttl:
+            try:
+                body = body_path.read_bytes()
+            except OSError:
+                meta = None
+            else:
+                self._remember_charset(url, meta.get("charset"))
+                return body
+        if not self._check_dns_resolution(url):
+            raise requests.exceptions.ConnectionError(f"Cannot resolve host for {url}")
+        host = urlparse(url).hostname
+        if self._host_failures.get(host, 0) >= self.MAX_HOST_FAILURES:
+            raise requests.exceptions.ConnectionError(f"Skipping unresponsive host {host}")
+        fetch = self._fetch_http2 if self._client is not None else self._fetch
+        validators = {}
+        if meta is not None:
+            if meta.get("etag"):
+                validators["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                validators["If-Modified-Since"] = meta["last_modified"]
+        with self._host_slot(host):
+            try:
+                status, headers, body = fetch(url, timeout, validators)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                with self._sweep_lock:
+                    self._host_failures[host] = self._host_failures.get(host, 0) + 1
+                raise
+            self._host_failures.pop(host, None)
+            if status == 304 and validators:
+                try:
+                    body = body_path.read_bytes()
+                except OSError:
+                    # Body went missing; fetch the page unconditionally
+                    status, headers, body = fetch(url, timeout, {})
+                else:
+                    # Still current, so it is fresh for another cache_ttl
+                    self._write_cache_meta(meta)
+                    self._remember_charset(url, meta.get("charset"))
+                    return body
+        self._remember_charset(url, _header_charset(headers))
+        self._write_cached_page(url, headers, body)
+        return body
+
+    def _remember_charset(self, url: str, charset: Optional[str]) -> None:
+        """Record the declared charset of a fetched page for _make_soup."""
+        if charset:
+            self._charsets[url] = charset
+
+    def _fetch(self, url: str, timeout: tuple, headers: Dict[str, str]) -> tuple:
+        """GET a page with requests; return (status, headers, capped body)."""
+        response = self.session.get(url, timeout=timeout, headers=headers, stream=True)
+        try:
+            if response.status_code == 304:
+                return 304, response.headers, b""
+            response.raise_for_status()
+            body = response.raw.read(self._MAX_BYTES, decode_content=True)
+        finally:
+            response.close()
+        return response.status_code, response.headers, body
+
+    def _fetch_http2(self, url: str, timeout: tuple, headers: Dict[str, str]) -> tuple:
+        """GET a page with the HTTP/2 client; return (status, headers, capped body).
+
+        httpx errors are re-raised as the matching ``requests`` exceptions so
+        the scrapers' error handling is the same for both transports.
+        """
+        connect, read = timeout
+        try:
+            with self._client.stream(
+                "GET", url, headers=headers, timeout=httpx.Timeout(read, connect=connect)
+            ) as response:
+                if response.status_code == 304:
+                    return 304, response.headers, b""
+                if response.status_code >= 400:
+                    raise requests.exceptions.HTTPError(
+                        f"{response.status_code} Error for url: {url}"
+                    )
+                chunks = []
+                size = 0
+                for chunk in response.iter_bytes():
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size >= self._MAX_BYTES:
+                        break
+                body = b"".join(chunks)[: self._MAX_BYTES]
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except httpx.HTTPError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+        return response.status_code, response.headers, body
+
+    def _cache_paths(self, url: str) -> Tuple[Path, Path]:
+        """Return the (metadata, body) cache files for a URL."""
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.json", self.cache_dir / f"{digest}.html"
+
+    def _read_cache(self, url: str) -> Tuple[Optional[dict], Optional[Path]]:
+        """Return the stored metadata and body file for a cached URL."""
+        if self.cache_dir is None:
+            return None, None
+        meta_path, body_path = self._cache_paths(url)
+        try:
+            return json.loads(meta_path.read_bytes()), body_path
+        except (OSError, ValueError):
+            return None, None
+
+    def _write_cached_page(self, url: str, headers: Mapping[str, str], body: bytes) -> None:
+        """Store a page that can be reused or revalidated later."""
+        if self.cache_dir is None:
+            return
+        if "no-store" in headers.get("Cache-Control", ""):
+            return
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified and self.cache_ttl <= 0:
+            return
+        _, body_path = self._cache_paths(url)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Body first, so metadata never points at a missing page
+            tmp_path = body_path.with_suffix(".tmp")
+            tmp_path.write_bytes(body)
+            tmp_path.replace(body_path)
+        except OSError as e:
+            logger.warning(f"Could not write WV grants cache: {e}")
+            return
+        self._write_cache_meta(
+            {
+                "url": url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "charset": _header_charset(headers),
+            }
+        )
+
+    def _write_cache_meta(self, meta: dict) -> None:
+        """Store a cached page's validators, stamped with the current time."""
+        meta_path, _ = self._cache_paths(meta["url"])
+        meta = {**meta, "fetched_at": time.time()}
+        try:
+            tmp_path = meta_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(meta), encoding="utf-8")
+            tmp_path.replace(meta_path)
+        except OSError as e:
+            logger.warning(f"Could not write WV grants cache: {e}")
+
+    def _make_soup(
+        self,
+        markup,
+        parse_only: Optional[SoupStrainer] = None,
+        url: Optional[str] = None,
+    ) -> BeautifulSoup:
+        """Parse fetched or headless-rendered HTML for the source scrapers.
+
+        Pass ``parse_only`` to keep just the matching tags (and their
+        contents) when the caller never looks outside them. Pass the page
+        ``url`` for fetched bytes so the charset its server declared is
+        used instead of detecting one.
+        """
+        from_encoding = None
+        if url is not None and isinstance(markup, bytes):
+            from_encoding = self._charsets.get(url)
+        return BeautifulSoup(
+            markup, _HTML_PARSER, parse_only=parse_only, from_encoding=from_encoding
+        )
+
+    def scrape_all_sources(self) -> list[Grant]:
+        """Scrape grants from all WV sources with enhanced error handling.
+
+        Sources are scraped concurrently, each in a worker thread, so the
+        sweep takes roughly as long as the slowest source. A URL shared by
+        several sources is fetched only once, and a source's fallback URLs
+        are fetched alongside its primary URL. Results keep the order of
+        ``self.sources``. When called from a running event loop the
+        sources are scraped one after another instead.
+        """
+        with self._sweep(self.sources):
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(self._scrape_all_async())
+            all_grants = []
+            for source_id, source_info in self.sources.items():
+                all_grants.extend(self._scrape_one(source_id, source_info))
+            return all_grants
+
+    def scrape_all(self, source_ids: List[str]) -> list[Grant]:
+        """Scrape the given sources concurrently on a thread pool.
+
+        Works like ``scrape_all_sources`` for a subset of sources, and also
+        from inside a running event loop. Results keep the order of
+        ``source_ids``. Raises ValueError for an unknown source id.
+        """
+        unknown = [source_id for source_id in source_ids if source_id not in self.sources]
+        if unknown:
+            raise ValueError(
+                f"Unknown WV grant sources {unknown}. Available: {sorted(self.sources)}"
+            )
+        selected = {source_id: self.sources[source_id] for source_id in source_ids}
+        batches: Dict[str, list] = {}
+        with self._sweep(selected), ThreadPoolExecutor(
+            max_workers=self.SCRAPE_WORKERS
+        ) as executor:
+            futures = {
+                executor.submit(self._scrape_one, source_id, source_info): source_id
+                for source_id, source_info in selected.items()
+            }
+            for future in as_completed(futures):
+                batches[futures[future]] = future.result()
+        return [grant for source_id in selected for grant in batches[source_id]]
+
+    @contextmanager
+    def _sweep(self, sources: Mapping[str, Mapping]):
+        """Set up per-sweep state (DNS, failure counts, page sharing, prefetch)."""
+        if not self.offline:
+            self._prewarm_dns(sources)
+        self._run_ts = datetime.now()
+        self._host_failures.clear()
+        self._sweep_pages = {}
+        if not self.offline:
+            self._prefetch_pool = ThreadPoolExecutor(max_workers=POOL_SIZE)
+        try:
+            yield
+        finally:
+            if self._prefetch_pool is not None:
+                # Drop queued prefetches but let running fetches finish, so
+                # none touch the network or the cache after the sweep
+                self._prefetch_pool.shutdown(wait=True, cancel_futures=True)
+                self._prefetch_pool = None
+            self._sweep_pages = None
+
+    async def _scrape_all_async(self) -> list[Grant]:
+        """Scrape every source concurrently and merge results in source order."""
+        batches = await asyncio.gather(
+            *(
+                asyncio.to_thread(self._scrape_one, source_id, source_info)
+                for source_id, source_info in self.sources.items()
+            )
+        )
+        return [grant for batch in batches for grant in batch]
+
+    def _scrape_one(self, source_id: str, source_info: dict) -> list[Grant]:
+        """Scrape one source, returning no grants if it fails outright."""
+        try:
+            # Always use robust scraping path; internal fallbacks are handled within the method
+            return self._scrape_source_robust(source_id, source_info)
+        except Exception as e:
+            logger.warning("Error scraping %s: %s", source_id, e)
+            return []
+
+    def _resolve_handler(self, source_id: str) -> Callable[[dict], list]:
+        """Pick the scraper method for a source from its id."""
+        for keys, method_name in _SOURCE_HANDLERS:
+            if any(key in source_id for key in keys):
+                return getattr(self, method_name)
+        return self._scrape_generic_source
 
     def _scrape_source(self, source_id: str, source_info: dict) -> list[Grant]:
         """Scrape grants from a specific source with error handling."""
         try:
-            if "arts" in source_id:  # noqa: BLE001
-                return self._scrape_arts_source(source_info)
-            elif "education" in source_id:
-                return self._scrape_education_source(source_info)  # noqa: BLE001
-            elif "grants_gov" in source_id:
-                return self._scrape_grants_gov(source_info)
-            elif "nsf" in source_id or "nasa" in source_id:
-                return self._scrape_federal_stem(source_info)
-            elif "usda" in source_id or "hud" in source_id:
-                return self._scrape_federal_community(source_info)
-            elif (
-                "youth" in source_id
-                or "afterschool" in source_id
-                or "boys_girls_clubs" in source_id
-            ):
-                return self._scrape_youth_programs(source_info)
-            elif (
-                "commerce" in source_id
-                or "development" in source_id
-                or "workforce" in source_id
-                or "housing" in source_id
-            ):
-                return self._scrape_generic_source(source_info)
-            else:
-                return self._scrape_generic_source(source_info)
+            handler = self._handlers.get(source_id)
+            if handler is None:
+                handler = self._handlers[source_id] = self._resolve_handler(source_id)
+            return handler(source_info)
         except Exception as e:
-            print(f"Error scraping source {source_id}: {e}")  # noqa: BLE001
+            logger.warning("Error scraping source %s: %s", source_id, e)
             return []
 
     def _scrape_arts_source(self, source_info: dict) -> list[Grant]:
@@ -687,19 +1704,16 @@ class WVGrantScraper:
             # Arts funding often suits education-like samples for this project
             return self._get_sample_education_grants(source_info)
         grants = []
-        urls_to_try = [source_info["url"]] + source_info.get("fallbacks", [])  # noqa: BLE001
-        for url in urls_to_try:
+        for url in self._candidate_urls(source_info):
             try:
-                response = self.session.get(url, timeout=(10, 30))
-                # Some sites block bots; if explicitly forbidden try headless fetch
-                if response.status_code == 403:
-                    raise requests.exceptions.HTTPError("403 Forbidden")
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, "html.parser")
+                # Some sites block bots; if forbidden, _get_page raises and
+                # the headless fetch below is tried
+                content = self._get_page(url)
+                soup = self._make_soup(content, _LISTING_TAGS, url)
                 # Find grant containers by common selectors
                 containers = soup.find_all(
                     ["div", "section", "article"],
-                    class_=re.compile(r"grant|funding|opportunity|arts", re.IGNORECASE),
+                    class_=_ARTS_CLASS_RE,
                 )
                 for element in containers:
                     grant = self._parse_arts_grant(element, source_info)
@@ -708,16 +1722,16 @@ class WVGrantScraper:
                 if grants:
                     break
             except Exception as e:
-                print(f"Error scraping arts source {url}: {e}")  # noqa: BLE001
+                logger.warning("Error scraping arts source %s: %s", url, e)  # noqa: BLE001
                 # Headless fallback when blocked or parsing failed
                 try:
                     html = fetch_rendered_html(url, timeout=20)
                     if not html:
                         continue
-                    soup = BeautifulSoup(html, "html.parser")
+                    soup = self._make_soup(html, _LISTING_TAGS)
                     containers = soup.find_all(
                         ["div", "section", "article"],
-                        class_=re.compile(r"grant|funding|opportunity|arts", re.IGNORECASE),
+                        class_=_ARTS_CLASS_RE,
                     )
                     for element in containers:
                         grant = self._parse_arts_grant(element, source_info)
@@ -737,101 +1751,75 @@ class WVGrantScraper:
         if self.offline:
             return self._get_sample_education_grants(source_info)
         grants = []
+        # Titles already collected; the same program is often linked and
+        # listed on one page
+        seen_titles = set()
 
-        urls_to_try = [source_info["url"]] + source_info.get("fallbacks", [])
-
-        for url in urls_to_try:
+        for url in self._candidate_urls(source_info):
             try:
-                print(f"🎓 Trying education URL: {url}")
-                response = self.session.get(url, timeout=(10, 30))
-                response.raise_for_status()
+                logger.debug("Trying education URL: %s", url)
+                content = self._get_page(url)
 
-                soup = BeautifulSoup(response.content, "html.parser")
+                soup = self._make_soup(content, url=url)
 
                 # Enhanced search for education funding with broader approach
                 found_elements = []
 
                 # Method 1: Search for specific grant/funding sections
-                funding_sections = soup.find_all(
-                    ["div", "section", "article"],
-                    class_=re.compile(
-                        r"grant|funding|assistance|finance|program|opportunity", re.IGNORECASE
-                    ),
+                found_elements.extend(
+                    soup.find_all(["div", "section", "article"], class_=_EDU_FUNDING_RE, limit=5)
                 )
-                found_elements.extend(funding_sections[:5])
 
                 # Method 2: Search for navigation links to funding pages
-                nav_links = soup.find_all(
-                    "a",
-                    href=re.compile(
-                        r"grant|funding|assistance|finance|federal|program|title", re.IGNORECASE
-                    ),
-                )
-                found_elements.extend(nav_links[:10])
+                found_elements.extend(soup.find_all("a", href=_EDU_NAV_HREF_RE, limit=10))
 
                 # Method 3: Search page content for financial assistance mentions
-                text_content = soup.get_text().lower()
-                if any(
-                    keyword in text_content
-                    for keyword in [
-                        "title i",
-                        "title ii",
-                        "title iii",
-                        "title iv",
-                        "federal programs",
-                        "state funding",
-                        "grant opportunities",
-                        "financial assistance",
-                        "educational grants",
-                        "student aid",
-                    ]
-                ):
+                if _mentions_edu_funding(soup.get_text().lower()):
                     # If we find relevant keywords, look for headers and links
-                    headers = soup.find_all(["h1", "h2", "h3", "h4"])
-                    for header in headers[:10]:
+                    headers = soup.find_all(["h1", "h2", "h3", "h4"], limit=10)
+                    for header in headers:
                         header_text = header.get_text().lower()
-                        if any(
-                            kw in header_text
-                            for kw in ["program", "fund", "assist", "grant", "support"]
-                        ):
+                        if any(kw in header_text for kw in _EDU_HEADER_KEYWORDS):
                             found_elements.append(header.parent or header)
 
                 # Method 4: For federal DOE, look for specific program selectors
                 if "ed.gov" in url:
                     # Federal DOE specific selectors
-                    fed_selectors = [
-                        soup.find_all(["div", "li"], class_=re.compile(r"program|grant|funding")),
+                    found_elements.extend(_ED_GOV_PROGRAMS.select(soup, limit=5))
+                    # Headings are matched on their own text, which CSS can't express
+                    found_elements.extend(
                         soup.find_all(
-                            ["h2", "h3"], string=re.compile(r"Grant|Program|Fund", re.IGNORECASE)
-                        ),
-                        soup.find_all("a", href=re.compile(r"grants|programs|fund")),
-                    ]
-                    for selector_results in fed_selectors:
-                        found_elements.extend(selector_results[:5])
+                            ["h2", "h3"],
+                            string=_ED_GOV_HEADING_RE,
+                            limit=5,
+                        )
+                    )
+                    found_elements.extend(_ED_GOV_LINKS.select(soup, limit=5))
 
-                print(f"📋 Found {len(found_elements)} potential elements on {url}")
+                logger.debug("Found %d potential elements on %s", len(found_elements), url)
 
                 # Parse found elements
                 for element in found_elements[:15]:  # Process more elements
                     grant = self._parse_education_assistance(element, source_info, url)
-                    if grant and grant not in grants:
+                    if grant and grant.title not in seen_titles:
+                        seen_titles.add(grant.title)
                         grants.append(grant)
 
                 # If we found good results, don't try more URLs
                 if len(grants) >= 3:
-                    print(f"✅ Successfully found {len(grants)} opportunities from {url}")
+                    logger.debug("Found %d opportunities from %s", len(grants), url)
                     break
 
             except requests.exceptions.RequestException as e:
-                print(f"Request error scraping Education from {url}: {e}")
+                logger.warning("Request error scraping Education from %s: %s", url, e)
                 continue
             except Exception as e:
-                print(f"Error scraping Education from {url}: {e}")
+                logger.warning("Error scraping Education from %s: %s", url, e)
                 continue
 
         # Always ensure we have real source information for reliable results
         if not grants:
-            print("📝 Using real source information for reliable results")
+            logger.debug("Using real source information for %s", source_info["name"])
             grants = self._get_real_source_information(source_info)
         elif len(grants) < 3:
             # Supplement with real source information if we found too few
@@ -841,37 +1829,32 @@ class WVGrantScraper:
         return grants
 
     def _scrape_grants_gov(self, source_info: dict) -> list[Grant]:
-        """Scrape federal grants from grants.gov."""
+        """Scrape federal grants from grants.gov.
+
+        The JSON search API is tried first; the HTML search page is only
+        parsed if the API fails or finds nothing.
+        """
         if self.offline:
             # Point users to the authoritative portal instead of fabricating
             return self._get_real_source_information(source_info)
-        grants = []
+        grants = self._search_grants_gov_api(source_info)
+        if grants:
+            return grants
 
         try:
-            response = self.session.get(source_info["url"], timeout=(15, 45))
-            response.raise_for_status()
+            content = self._get_page(source_info["url"])
+            if not _has_candidates(content, _GRANTS_GOV_PAGE_KEYWORDS):
+                return self._get_real_source_information(source_info)
 
-            soup = BeautifulSoup(response.content, "html.parser")
+            soup = self._make_soup(content, _LISTING_TAGS, source_info["url"])
 
             # Grants.gov specific selectors
-            grant_selectors = [
-                {"class_": re.compile(r"grant|opportunity|listing|result")},
-                {"id": re.compile(r"grant|opportunity|result")},
-                ["div"],
-                {"data-testid": re.compile(r"grant|opportunity")},
-            ]
-
             found_elements = []
-            for sel in grant_selectors:
-                if isinstance(sel, dict):
-                    elements = soup.find_all(["div", "article", "li"], sel)
-                    found_elements.extend(elements[:5])
+            for selector in _GRANTS_GOV_SELECTORS:
+                found_elements.extend(selector.select(soup, limit=5))
 
             # Also search for common grants.gov patterns
-            opportunity_elements = soup.find_all(
-                ["div", "li"], class_=re.compile(r"opportunity|grant-item|search-result")
-            )
-            found_elements.extend(opportunity_elements[:8])
+            found_elements.extend(_GRANTS_GOV_OPPORTUNITIES.select(soup, limit=8))
 
             for element in found_elements:
                 grant = self._parse_federal_grant(element, source_info)
@@ -879,13 +1862,24 @@ class WVGrantScraper:
                     grants.append(grant)
 
         except Exception as e:
-            print(f"Error scraping grants.gov: {e}")
+            logger.warning("Error scraping grants.gov: %s", e)
 
         if not grants:
             grants = self._get_real_source_information(source_info)
 
         return grants
 
+    def _search_grants_gov_api(self, source_info: dict) -> list[Grant]:
+        """Search the grants.gov API with the ``query`` term of the source URL."""
+        query = parse_qs(urlparse(source_info["url"]).query).get("query", [""])[0]
+        try:
+            return self._grants_gov_api.search_grants(
+                query=query, rows=self.max_results or GRANTS_GOV_ROWS
+            )
+        except Exception as e:
+            logger.warning("Error searching grants.gov API: %s", e)
+            return []
+
     def _scrape_federal_stem(self, source_info: dict) -> list[Grant]:
         """Scrape federal STEM grants (NSF, NASA, etc.)."""
         if self.offline:
@@ -893,36 +1887,23 @@ class WVGrantScraper:
         grants = []
 
         try:
-            response = self.session.get(source_info["url"], timeout=(15, 45))
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, "html.parser")
+            content = self._get_page(source_info["url"])
 
-            # STEM-specific selectors
-            stem_keywords = [
-                "education",
-                "research",
-                "stem",
-                "science",
-                "technology",
-                "engineering",
-                "math",
-            ]
+            soup = self._make_soup(content, _LISTING_TAGS, source_info["url"])
 
             found_elements = []
 
             # Search for STEM program elements
-            for keyword in stem_keywords:
-                elements = soup.find_all(
-                    ["div", "article", "section"], class_=re.compile(keyword, re.IGNORECASE)
+            found_elements.extend(
+                soup.find_all(
+                    ["div", "article", "section"],
+                    class_=_STEM_CLASS_RE,
+                    limit=2 * len(_STEM_KEYWORDS),
                 )
-                found_elements.extend(elements[:2])
+            )
 
             # Look for funding opportunity listings
-            funding_elements = soup.find_all(
-                ["div", "li"], class_=re.compile(r"funding|grant|opportunity|program")
-            )
-            found_elements.extend(funding_elements[:8])
+            found_elements.extend(soup.find_all(["div", "li"], class_=_STEM_FUNDING_RE, limit=8))
 
             for element in found_elements:
                 grant = self._parse_stem_grant(element, source_info)
@@ -930,7 +1911,7 @@ class WVGrantScraper:
                     grants.append(grant)
 
         except Exception as e:
-            print(f"Error scraping federal STEM: {e}")
+            logger.warning("Error scraping federal STEM: %s", e)
 
         if not grants:
             grants = self._get_sample_stem_grants(source_info)
@@ -944,39 +1925,25 @@ class WVGrantScraper:
         grants = []
 
         try:
-            response = self.session.get(source_info["url"], timeout=(15, 45))
-            response.raise_for_status()
+            content = self._get_page(source_info["url"])
 
-            soup = BeautifulSoup(response.content, "html.parser")
+            soup = self._make_soup(content, _LISTING_TAGS, source_info["url"])
 
             # Community development selectors
-            urls_to_try = [source_info["url"]] + source_info.get("fallbacks", [])  # noqa: BLE001
-            community_keywords = [
-                "community",
-                "rural",
-                "housing",
-                "infrastructure",
-                "development",
-                "block grant",
-                "facilities",
-                "program",
-                "funding",
-                "grant",
-            ]
-
             found_elements = []
 
-            for keyword in community_keywords:
-                elements = soup.find_all(
-                    ["div", "article", "section"], class_=re.compile(keyword, re.IGNORECASE)
+            found_elements.extend(
+                soup.find_all(
+                    ["div", "article", "section"],
+                    class_=_COMMUNITY_CLASS_RE,
+                    limit=2 * len(_COMMUNITY_KEYWORDS),
                 )
-                found_elements.extend(elements[:2])
+            )
 
             # Look for program listings
-            program_elements = soup.find_all(
-                ["div", "li"], class_=re.compile(r"program|grant|funding")
+            found_elements.extend(
+                soup.find_all(["div", "li"], class_=_COMMUNITY_PROGRAM_RE, limit=8)
             )
-            found_elements.extend(program_elements[:8])
 
             for element in found_elements:
                 grant = self._parse_community_grant(element, source_info)
@@ -984,7 +1951,7 @@ class WVGrantScraper:
                     grants.append(grant)
 
         except Exception as e:
-            print(f"Error scraping federal community: {e}")
+            logger.warning("Error scraping federal community: %s", e)
 
         if not grants:
             grants = self._get_sample_community_grants(source_info)
@@ -998,27 +1965,25 @@ class WVGrantScraper:
         grants = []
 
         try:
-            response = self.session.get(source_info["url"], timeout=(15, 45))
-            response.raise_for_status()
+            content = self._get_page(source_info["url"])
 
-            soup = BeautifulSoup(response.content, "html.parser")
-
-            # Youth program selectors
-            youth_keywords = ["youth", "after-school", "afterschool", "children", "kids", "teen"]
+            soup = self._make_soup(content, _LISTING_TAGS, source_info["url"])
 
             found_elements = []
 
-            for keyword in youth_keywords:
-                elements = soup.find_all(
-                    ["div", "article", "section"], class_=re.compile(keyword, re.IGNORECASE)
+            # Search for youth program elements
+            found_elements.extend(
+                soup.find_all(
+                    ["div", "article", "section"],
+                    class_=_YOUTH_CLASS_RE,
+                    limit=2 * len(_YOUTH_KEYWORDS),
                 )
-                found_elements.extend(elements[:2])
+            )
 
             # Look for funding/program information
-            funding_elements = soup.find_all(
-                ["div", "li", "p"], class_=re.compile(r"funding|grant|program|opportunity")
+            found_elements.extend(
+                soup.find_all(["div", "li", "p"], class_=_YOUTH_FUNDING_RE, limit=8)
             )
-            found_elements.extend(funding_elements[:8])
 
             for element in found_elements:
                 grant = self._parse_youth_grant(element, source_info)
@@ -1026,13 +1991,30 @@ class WVGrantScraper:
                     grants.append(grant)
 
         except Exception as e:
-            print(f"Error scraping youth programs: {e}")
+            logger.warning("Error scraping youth programs: %s", e)
 
         if not grants:
             grants = self._get_sample_youth_grants(source_info)
 
         return grants
 
+    @staticmethod
+    def _find_generic_elements(soup: BeautifulSoup) -> list:
+        """Return up to ``_GENERIC_MAX_ELEMENTS`` elements worth parsing.
+
+        Containers whose class or id names a grant keyword come first (one
+        tree walk for all keywords), then parents of headers mentioning one.
+        """
+        found = soup.find_all(_is_generic_container, limit=_GENERIC_MAX_ELEMENTS)
+        if len(found) < _GENERIC_MAX_ELEMENTS:
+            for header in soup.find_all(["h1", "h2", "h3", "h4"]):
+                text = header.get_text().lower()
+                if any(keyword in text for keyword in _GENERIC_GRANT_KEYWORDS):
+                    found.append(header.parent or header)
+                    if len(found) == _GENERIC_MAX_ELEMENTS:
+                        break
+        return found
+
     def _scrape_generic_source(self, source_info: dict) -> list[Grant]:
         """Scrape grants from any generic source."""
         if self.offline:
@@ -1044,98 +2026,46 @@ class WVGrantScraper:
                 return self._get_sample_health_grants(source_info)
             return self._get_sample_generic_grants(source_info)
         grants = []
+        seen_titles = set()
 
-        urls_to_try = [source_info.get("url", "")] + source_info.get("fallbacks", [])
-
-        for url in [u for u in urls_to_try if u]:
+        for url in self._candidate_urls(source_info):
             try:
-                response = self.session.get(url, timeout=(15, 45))
-                # If forbidden/blocked, try headless fallback
-                if response.status_code == 403:
-                    raise requests.exceptions.HTTPError("403 Forbidden")
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, "html.parser")
-
-                # Generic grant selectors
-                grant_keywords = [
-                    "grant",
-                    "funding",
-                    "opportunity",
-                    "program",
-                    "assistance",
-                    "apply",
-                ]
-
-                found_elements = []
+                # If forbidden/blocked, _get_page raises and the headless
+                # fallback below is tried
+                content = self._get_page(url)
+                # Skip building a soup for pages with nothing to parse
+                if not _has_candidates(content, _GENERIC_GRANT_KEYWORDS):
+                    continue
+                soup = self._make_soup(content, url=url)
 
-                # Search by class and id attributes
-                for keyword in grant_keywords:
-                    class_elements = soup.find_all(
-                        ["div", "article", "section"], class_=re.compile(keyword, re.IGNORECASE)
-                    )
-                    id_elements = soup.find_all(
-                        ["div", "article", "section"], id=re.compile(keyword, re.IGNORECASE)
-                    )
-                    found_elements.extend(class_elements[:2])
-                    found_elements.extend(id_elements[:2])
-
-                # Search for headers with grant keywords
-                headers = soup.find_all(["h1", "h2", "h3", "h4"])
-                for header in headers:
-                    text = header.get_text().lower()
-                    if any(keyword in text for keyword in grant_keywords):
-                        found_elements.append(header.parent or header)
-
-                # Parse a limited number of elements
-                for element in found_elements[:10]:
+                for element in self._find_generic_elements(soup):
                     grant = self._parse_generic_grant(element, source_info)
-                    if grant:
+                    if grant and grant.title not in seen_titles:
+                        seen_titles.add(grant.title)
                         grants.append(grant)
 
                 if grants:
                     break
 
             except requests.exceptions.RequestException as e:  # noqa: BLE001
-                print(f"Request error scraping generic source {url}: {e}")
+                logger.warning("Request error scraping generic source %s: %s", url, e)
                 # Attempt headless fallback when network request fails or blocked
                 try:
                     html = fetch_rendered_html(url, timeout=25)
                     if not html:
                         continue
-                    soup = BeautifulSoup(html, "html.parser")
-                    grant_keywords = [
-                        "grant",
-                        "funding",
-                        "opportunity",
-                        "program",
-                        "assistance",
-                        "apply",
-                    ]
-                    found_elements = []
-                    for keyword in grant_keywords:
-                        class_elements = soup.find_all(
-                            ["div", "article", "section"], class_=re.compile(keyword, re.IGNORECASE)
-                        )
-                        id_elements = soup.find_all(
-                            ["div", "article", "section"], id=re.compile(keyword, re.IGNORECASE)
-                        )
-                        found_elements.extend(class_elements[:2])
-                        found_elements.extend(id_elements[:2])
-                    headers = soup.find_all(["h1", "h2", "h3", "h4"])
-                    for header in headers:
-                        text = header.get_text().lower()
-                        if any(keyword in text for keyword in grant_keywords):
-                            found_elements.append(header.parent or header)
-                    for element in found_elements[:10]:
+                    soup = self._make_soup(html)
+                    for element in self._find_generic_elements(soup):
                         grant = self._parse_generic_grant(element, source_info)
-                        if grant:
+                        if grant and grant.title not in seen_titles:
+                            seen_titles.add(grant.title)
                             grants.append(grant)
                     if grants:
                         break
                 except Exception:
                     continue
             except Exception as e:  # noqa: BLE001
-                print(f"Error scraping generic source {url}: {e}")
+                logger.warning("Error scraping generic source %s: %s", url, e)
                 continue
 
         if not grants:
@@ -1157,13 +2087,10 @@ class WVGrantScraper:
             )
 
             # Extract amount if present
-            amount_match = re.search(r"\$?(\d{1,3}(?:,\d{3})*(?:,\d{3})*)", description)
-            amount = None
-            if amount_match:
-                amount = int(amount_match.group(1).replace(",", ""))
+            amount = _parse_amount(description)
 
             return Grant(
-                id=f"wv_arts_{int(time.time())}_{hash(title) % 10000}",
+                id=_grant_id("wv_arts", title),
                 title=title[:200],
                 description=description[:1000],
                 funder_name=source_info["name"],
@@ -1173,29 +2100,25 @@ class WVGrantScraper:
                 amount_min=amount or 1000,
                 amount_max=amount * 2 if amount else 10000,
                 status=GrantStatus.OPEN,
-                eligibility_types=[EligibilityType.NONPROFIT, EligibilityType.EDUCATION],
-                focus_areas=["art_education", "education"],
+                eligibility_types=_NONPROFIT_EDUCATION_ELIGIBILITY,
+                focus_areas=_ARTS_FOCUS,
                 source=source_info["name"],
                 source_url=source_info["url"],
                 contact_email="arts@wvculture.org",
                 contact_phone="304-558-0220",
                 application_url=source_info["url"],
-                last_updated=datetime.now(),
-                created_at=datetime.now(),
+                last_updated=self._run_ts,
+                created_at=self._run_ts,
             )
         except Exception as e:
-            print(f"Error parsing arts grant: {e}")
+            logger.debug("Error parsing arts grant: %s", e)
             return None
 
     def _parse_education_assistance(self, element, source_info: dict, url: str) -> Optional[Grant]:
         """Parse an education financial assistance element."""
         try:
-            # Extract title from various possible elements
-            title_elem = None
-            for tag in ["h1", "h2", "h3", "h4", "h5", "h6"]:
-                title_elem = element.find(tag)
-                if title_elem:
-                    break
+            # Extract title from the first heading, in one walk of the element
+            title_elem = element.find(_HEADING_TAGS)
 
             # If no header, try link text or strong text
             if not title_elem:
@@ -1204,7 +2127,7 @@ class WVGrantScraper:
             title = title_elem.get_text().strip() if title_elem else "Financial Assistance"
 
             # Clean up title and determine assistance type
-            title = re.sub(r"\s+", " ", title)
+            title = _WHITESPACE_RE.sub(" ", title)
             assistance_type = self._determine_assistance_type(title, element)
 
             # Extract description
@@ -1221,10 +2144,7 @@ class WVGrantScraper:
                 description = f"{assistance_type} opportunity from WV Department of Education."
 
             # Extract amount if present
-            amount_match = re.search(r"\$?(\d{1,3}(?:,\d{3})*)", description + " " + title)
-            amount = None
-            if amount_match:
-                amount = int(amount_match.group(1).replace(",", ""))
+            amount = _first_amount(description, title)
 
             # Determine funding type and amounts based on assistance type
             funding_type, typical_amount, min_amount, max_amount = self._get_assistance_amounts(
@@ -1239,12 +2159,10 @@ class WVGrantScraper:
                 if href.startswith("http"):
                     app_url = href
                 elif href.startswith("/"):
-                    from urllib.parse import urljoin
-
                     app_url = urljoin(url, href)
 
             # Generate unique ID
-            grant_id = f"wv_edu_{assistance_type.lower()}_{int(time.time())}_{hash(title) % 10000}"
+            grant_id = _grant_id(f"wv_edu_{assistance_type.lower()}", title)
 
             return Grant(
                 id=grant_id,
@@ -1257,45 +2175,33 @@ class WVGrantScraper:
                 amount_min=min_amount,
                 amount_max=max_amount,
                 status=GrantStatus.OPEN,
-                eligibility_types=[EligibilityType.EDUCATION, EligibilityType.NONPROFIT],
-                focus_areas=["education", "youth_development", "student_support"],
+                eligibility_types=_EDUCATION_NONPROFIT_ELIGIBILITY,
+                focus_areas=_EDUCATION_FOCUS,
                 source=source_info["name"],
                 source_url=url,
                 contact_email="grants@wvde.us",
                 contact_phone="304-558-2681",
                 application_url=app_url,
-                last_updated=datetime.now(),
-                created_at=datetime.now(),
+                last_updated=self._run_ts,
+                created_at=self._run_ts,
             )
         except Exception as e:
-            print(f"Error parsing education assistance: {e}")
+            logger.debug("Error parsing education assistance: %s", e)
             return None
 
     def _determine_assistance_type(self, title: str, element) -> str:
-        """Determine the type of financial assistance based on title and content."""
-        title_lower = title.lower()
-        element_text = element.get_text().lower() if element else ""
+        """Determine the type of financial assistance based on title and content.
 
-        if any(word in title_lower for word in ["scholarship", "student aid"]):
-            return "Scholarship"
-        elif any(word in title_lower for word in ["loan", "lending"]):
-            return "Loan"
-        elif any(word in title_lower for word in ["title i", "federal program"]):
-            return "Federal Program"
-        elif any(
-            word in title_lower for word in ["professional development", "teacher", "training"]
-        ):
-            return "Professional Development"
-        elif any(word in title_lower for word in ["technology", "equipment", "infrastructure"]):
-            return "Technology Grant"
-        elif any(
-            word in title_lower for word in ["special education", "disability", "accessibility"]
-        ):
-            return "Special Education Support"
-        elif any(word in element_text for word in ["assistance", "aid", "support"]):
+        The element's text is only extracted when the title alone does not
+        decide the type.
+        """
+        assistance_type = _assistance_type_for_title(title.lower())
+        if assistance_type is not None:
+            return assistance_type
+        element_text = element.get_text().lower() if element else ""
+        if any(word in element_text for word in _ASSISTANCE_TEXT_KEYWORDS):
             return "Financial Assistance"
-        else:
-            return "Educational Grant"
+        return "Educational Grant"
 
     def _get_assistance_amounts(self, assistance_type: str, parsed_amount: Optional[int]) -> tuple:
         """Get funding type and typical amounts based on assistance type."""
@@ -1307,19 +2213,7 @@ class WVGrantScraper:
                 int(parsed_amount * 2),
             )
 
-        # Default amounts by assistance type
-        amount_ranges = {
-            "Scholarship": (FundingType.SCHOLARSHIP, 2500, 500, 10000),
-            "Loan": (FundingType.GRANT, 15000, 1000, 50000),
-            "Federal Program": (FundingType.GRANT, 50000, 10000, 500000),
-            "Professional Development": (FundingType.GRANT, 5000, 1000, 25000),
-            "Technology Grant": (FundingType.GRANT, 15000, 3000, 75000),
-            "Special Education Support": (FundingType.GRANT, 25000, 5000, 100000),
-            "Financial Assistance": (FundingType.GRANT, 10000, 2000, 50000),
-            "Educational Grant": (FundingType.GRANT, 25000, 5000, 100000),
-        }
-
-        return amount_ranges.get(assistance_type, (FundingType.GRANT, 25000, 5000, 100000))
+        return _ASSISTANCE_AMOUNTS.get(assistance_type, _DEFAULT_ASSISTANCE_AMOUNTS)
 
     def _parse_commerce_grant(self, element, source_info: dict) -> Optional[Grant]:
         """Parse a commerce grant element."""
@@ -1335,13 +2229,10 @@ class WVGrantScraper:
             )
 
             # Extract amount if present
-            amount_match = re.search(r"\$?(\d{1,3}(?:,\d{3})*(?:,\d{3})*)", description)
-            amount = None
-            if amount_match:
-                amount = int(amount_match.group(1).replace(",", ""))
+            amount = _parse_amount(description)
 
             return Grant(
-                id=f"wv_commerce_{int(time.time())}_{hash(title) % 10000}",
+                id=_grant_id("wv_commerce", title),
                 title=title[:200],
                 description=description[:1000],
                 funder_name=source_info["name"],
@@ -1351,18 +2242,18 @@ class WVGrantScraper:
                 amount_min=amount or 10000,
                 amount_max=amount * 2 if amount else 200000,
                 status=GrantStatus.OPEN,
-                eligibility_types=[EligibilityType.NONPROFIT, EligibilityType.STARTUP],
-                focus_areas=["community_development", "economic_development"],
+                eligibility_types=_NONPROFIT_STARTUP_ELIGIBILITY,
+                focus_areas=_COMMERCE_FOCUS,
                 source=source_info["name"],
                 source_url=source_info["url"],
                 contact_email="info@wvcommerce.org",
                 contact_phone="304-957-2234",
                 application_url=source_info["url"],
-                last_updated=datetime.now(),
-                created_at=datetime.now(),
+                last_updated=self._run_ts,
+                created_at=self._run_ts,
             )
         except Exception as e:
-            print(f"Error parsing commerce grant: {e}")
+            logger.debug("Error parsing commerce grant: %s", e)
             return None
 
     def _parse_health_grant(self, element, source_info: dict) -> Optional[Grant]:
@@ -1379,13 +2270,10 @@ class WVGrantScraper:
             )
 
             # Extract amount if present
-            amount_match = re.search(r"\$?(\d{1,3}(?:,\d{3})*(?:,\d{3})*)", description)
-            amount = None
-            if amount_match:
-                amount = int(amount_match.group(1).replace(",", ""))
+            amount = _parse_amount(description)
 
             return Grant(
-                id=f"wv_health_{int(time.time())}_{hash(title) % 10000}",
+                id=_grant_id("wv_health", title),
                 title=title[:200],
                 description=description[:1000],
                 funder_name=source_info["name"],
@@ -1395,18 +2283,18 @@ class WVGrantScraper:
                 amount_min=amount or 5000,
                 amount_max=amount * 2 if amount else 150000,
                 status=GrantStatus.OPEN,
-                eligibility_types=[EligibilityType.NONPROFIT, EligibilityType.EDUCATION],
-                focus_areas=["health", "social_services"],
+                eligibility_types=_NONPROFIT_EDUCATION_ELIGIBILITY,
+                focus_areas=_HEALTH_FOCUS,
                 source=source_info["name"],
                 source_url=source_info["url"],
                 contact_email="grants@dhhr.wv.gov",
                 contact_phone="304-558-0684",
                 application_url=source_info["url"],
-                last_updated=datetime.now(),
-                created_at=datetime.now(),
+                last_updated=self._run_ts,
+                created_at=self._run_ts,
             )
         except Exception as e:
-            print(f"Error parsing health grant: {e}")
+            logger.debug("Error parsing health grant: %s", e)
             return None
 
     def _parse_stem_grant(self, element, source_info: dict) -> Optional[Grant]:
@@ -1420,11 +2308,9 @@ class WVGrantScraper:
                 if desc_elem
                 else "STEM education funding opportunity"
             )
-            amount_text = description + " " + title
-            amount_match = re.search(r"\$?(\d{1,3}(?:,\d{3})*)", amount_text)
-            amount = int(amount_match.group(1).replace(",", "")) if amount_match else None
+            amount = _first_amount(description, title)
             return Grant(
-                id=f"stem_{int(time.time())}_{hash(title) % 10000}",
+                id=_grant_id("stem", title),
                 title=title[:200],
                 description=description,
                 funder_name=source_info["name"],
@@ -1434,16 +2320,16 @@ class WVGrantScraper:
                 amount_min=amount or 10000,
                 amount_max=amount * 3 if amount else 500000,
                 status=GrantStatus.OPEN,
-                eligibility_types=[EligibilityType.EDUCATION, EligibilityType.NONPROFIT],
-                focus_areas=["stem_education", "education", "research"],
+                eligibility_types=_EDUCATION_NONPROFIT_ELIGIBILITY,
+                focus_areas=_STEM_FOCUS,
                 source=source_info["name"],
                 source_url=source_info["url"],
                 application_url=source_info["url"],
-                last_updated=datetime.now(),
-                created_at=datetime.now(),
+                last_updated=self._run_ts,
+                created_at=self._run_ts,
             )
         except Exception as e:
-            print(f"Error parsing STEM grant: {e}")
+            logger.debug("Error parsing STEM grant: %s", e)
             return None
 
     def _parse_community_grant(self, element, source_info: dict) -> Optional[Grant]:
@@ -1457,11 +2343,9 @@ class WVGrantScraper:
                 if desc_elem
                 else "Community development funding"
             )
-            amount_text = description + " " + title
-            amount_match = re.search(r"\$?(\d{1,3}(?:,\d{3})*)", amount_text)
-            amount = int(amount_match.group(1).replace(",", "")) if amount_match else None
+            amount = _first_amount(description, title)
             return Grant(
-                id=f"community_{int(time.time())}_{hash(title) % 10000}",
+                id=_grant_id("community", title),
                 title=title[:200],
                 description=description,
                 funder_name=source_info["name"],
@@ -1471,16 +2355,16 @@ class WVGrantScraper:
                 amount_min=amount or 25000,
                 amount_max=amount * 2 if amount else 1000000,
                 status=GrantStatus.OPEN,
-                eligibility_types=[EligibilityType.NONPROFIT, EligibilityType.MUNICIPALITY],
-                focus_areas=["community_development", "housing", "infrastructure"],
+                eligibility_types=_NONPROFIT_MUNICIPALITY_ELIGIBILITY,
+                focus_areas=_COMMUNITY_FOCUS,
                 source=source_info["name"],
                 source_url=source_info["url"],
                 application_url=source_info["url"],
-                last_updated=datetime.now(),
-                created_at=datetime.now(),
+                last_updated=self._run_ts,
+                created_at=self._run_ts,
             )
         except Exception as e:
-            print(f"Error parsing community grant: {e}")
+            logger.debug("Error parsing community grant: %s", e)
             return None
 
     def _parse_youth_grant(self, element, source_info: dict) -> Optional[Grant]:
@@ -1494,11 +2378,9 @@ class WVGrantScraper:
                 if desc_elem
                 else "Youth and after-school program funding"
             )
-            amount_text = description + " " + title
-            amount_match = re.search(r"\$?(\d{1,3}(?:,\d{3})*)", amount_text)
-            amount = int(amount_match.group(1).replace(",", "")) if amount_match else None
+            amount = _first_amount(description, title)
             return Grant(
-                id=f"youth_{int(time.time())}_{hash(title) % 10000}",
+                id=_grant_id("youth", title),
                 title=title[:200],
                 description=description,
                 funder_name=source_info["name"],
@@ -1508,16 +2390,16 @@ class WVGrantScraper:
                 amount_min=amount or 5000,
                 amount_max=amount * 2 if amount else 75000,
                 status=GrantStatus.OPEN,
-                eligibility_types=[EligibilityType.NONPROFIT, EligibilityType.EDUCATION],
-                focus_areas=["youth_development", "after_school", "education"],
+                eligibility_types=_NONPROFIT_EDUCATION_ELIGIBILITY,
+                focus_areas=_YOUTH_FOCUS,
                 source=source_info["name"],
                 source_url=source_info["url"],
                 application_url=source_info["url"],
-                last_updated=datetime.now(),
-                created_at=datetime.now(),
+                last_updated=self._run_ts,
+                created_at=self._run_ts,
             )
         except Exception as e:
-            print(f"Error parsing youth grant: {e}")
+            logger.debug("Error parsing youth grant: %s", e)
             return None
 
     def _parse_federal_grant(self, element, source_info: dict) -> Optional[Grant]:
@@ -1529,11 +2411,9 @@ class WVGrantScraper:
             description = (
                 desc_elem.get_text(strip=True)[:400] if desc_elem else "Federal funding opportunity"
             )
-            amount_text = description + " " + title
-            amount_match = re.search(r"\$?(\d{1,3}(?:,\d{3})*)", amount_text)
-            amount = int(amount_match.group(1).replace(",", "")) if amount_match else None
+            amount = _first_amount(description, title)
             return Grant(
-                id=f"federal_{int(time.time())}_{hash(title) % 10000}",
+                id=_grant_id("federal", title),
                 title=title[:200],
                 description=description,
                 funder_name=source_info["name"],
@@ -1543,83 +2423,45 @@ class WVGrantScraper:
                 amount_min=amount or 15000,
                 amount_max=amount * 3 if amount else 500000,
                 status=GrantStatus.OPEN,
-                eligibility_types=[EligibilityType.NONPROFIT, EligibilityType.EDUCATION],
-                focus_areas=["general", "education", "community"],
+                eligibility_types=_NONPROFIT_EDUCATION_ELIGIBILITY,
+                focus_areas=_FEDERAL_FOCUS,
                 source=source_info["name"],
                 source_url=source_info["url"],
                 application_url=source_info["url"],
-                last_updated=datetime.now(),
-                created_at=datetime.now(),
+                last_updated=self._run_ts,
+                created_at=self._run_ts,
             )
         except Exception as e:
-            print(f"Error parsing federal grant: {e}")
+            logger.debug("Error parsing federal grant: %s", e)
             return None
 
     def _get_real_source_information(self, source_info: dict) -> list[Grant]:
         """Get real information about funding opportunities from the source."""
-        grants = []
-
-        # Create an informational entry that directs users to the real source
-        if "wv" in source_info["name"].lower() and "education" in source_info["name"].lower():
-            # WV Education real programs
-            real_programs = [
-                {
-                    "title": "WV Title I School Improvement Programs",
-                    "description": "Federal Title I funding for schools serving low-income students. Contact WV Department of Education for current availability and application procedures.",
-                    "focus": ["title_i", "school_improvement", "low_income_schools"],
-                },
-                {
-                    "title": "WV Education Finance and Funding Information",
-                    "description": "Information about state and federal education funding opportunities. Visit the WV Department of Education finance section for current programs.",
-                    "focus": ["education_funding", "state_programs", "federal_programs"],
-                },
-            ]
-        elif (
-            "federal" in source_info["name"].lower() and "education" in source_info["name"].lower()
-        ):
-            # Federal DOE real programs
-            real_programs = [
-                {
-                    "title": "Federal Education Grant Programs",
-                    "description": "Visit the U.S. Department of Education website for current federal education grant opportunities including Title programs, STEM initiatives, and special education funding.",
-                    "focus": ["federal_education", "title_programs", "stem"],
-                }
-            ]
-        elif "arts" in source_info["name"].lower():
-            # Arts funding real programs
-            real_programs = [
-                {
-                    "title": "Arts Education Funding Opportunities",
-                    "description": "Contact the arts commission directly for current grant cycles and application requirements for arts education and community programs.",
-                    "focus": ["arts_education", "community_arts", "cultural_programs"],
-                }
-            ]
-        elif "nsf" in source_info["name"].lower():
-            # NSF real programs
-            real_programs = [
-                {
-                    "title": "NSF Education and Human Resources Programs",
-                    "description": "National Science Foundation offers various STEM education programs. Visit NSF.gov for current funding opportunities and submission deadlines.",
-                    "focus": ["stem_education", "research", "teacher_development"],
-                }
-            ]
-        else:
+        name = source_info["name"]
+        name_l = name.lower()
+        programs = None
+        for keys, rule_programs in _REAL_SOURCE_PROGRAMS:
+            if all(key in name_l for key in keys):
+                programs = rule_programs
+                break
+        if programs is None:
             # Generic source information
-            real_programs = [
-                {
-                    "title": f'Funding Information from {source_info["name"]}',
-                    "description": f'Visit {source_info["name"]} directly for current funding opportunities and application procedures. Contact them for the most up-to-date information.',
-                    "focus": ["general_funding", "contact_source"],
-                }
-            ]
+            programs = (
+                (
+                    f"Funding Information from {name}",
+                    f"Visit {name} directly for current funding opportunities and application procedures. Contact them for the most up-to-date information.",
+                    ("general_funding", "contact_source"),
+                ),
+            )
 
         # Create real grant entries that point to actual sources
-        for program in real_programs:
+        grants = []
+        for title, description, focus in programs:
             grant = self._create_real_grant_from_source(
                 source_info=source_info,
-                title=program["title"],
-                description=program["description"],
-                focus_areas=program["focus"],
+                title=title,
+                description=description,
+                focus_areas=list(focus),
             )
             if grant:  # Only add if validation passed
                 grants.append(grant)
@@ -1633,13 +2475,8 @@ class WVGrantScraper:
         Returns None if insufficient information is present.
         """
         try:
-            # Title by header or strong/a tag
-            title_elem = None
-            for tag in ["h1", "h2", "h3", "h4", "strong", "a"]:
-                found = element.find(tag)
-                if found:
-                    title_elem = found
-                    break
+            # Title by header or strong/a tag, whichever comes first
+            title_elem = element.find(_GENERIC_TITLE_TAGS)
             title = title_elem.get_text(strip=True) if title_elem else "Funding Opportunity"
 
             # Description from paragraph/div/span nearby
@@ -1649,25 +2486,21 @@ class WVGrantScraper:
                 return None
 
             # Naive amount detection
-            amount_text = f"{title} {description}"
-            amount_match = re.search(r"\$?(\d{1,3}(?:,\d{3})*)", amount_text)
-            amount = int(amount_match.group(1).replace(",", "")) if amount_match else None
+            amount = _first_amount(title, description)
 
             return Grant(
-                id=f"generic_{int(time.time())}_{hash(title) % 10000}",
+                id=_grant_id("generic", title),
                 title=title[:200],
                 description=description,
                 funder_name=source_info.get("name", "Unknown Source"),
-                funder_type="Federal Government"
-                if any(k in source_info.get("name", "").lower() for k in ["department", "us ", "federal", "gov"])
-                else ("State Government" if "wv" in source_info.get("name", "").lower() else "Private Foundation"),
+                funder_type=_funder_type(source_info.get("name", "")),
                 funding_type=FundingType.GRANT,
                 amount_typical=amount or 25000,
                 amount_min=(amount or 10000) // 2,
                 amount_max=(amount or 100000) * 1,
                 status=GrantStatus.OPEN,
-                eligibility_types=[EligibilityType.NONPROFIT],
-                focus_areas=["general"],
+                eligibility_types=_NONPROFIT_ELIGIBILITY,
+                focus_areas=_GENERIC_FOCUS,
                 source=source_info.get("name", "Unknown"),
                 source_url=source_info.get("url", ""),
                 application_url=source_info.get("url", ""),
@@ -1682,11 +2515,11 @@ class WVGrantScraper:
                 contact_email=None,
                 contact_phone=None,
                 relevance_score=None,
-                last_updated=datetime.now(),
-                created_at=datetime.now(),
+                last_updated=self._run_ts,
+                created_at=self._run_ts,
             )
         except (ValueError, RuntimeError) as e:
-            print(f"Error parsing generic grant: {e}")
+            logger.debug("Error parsing generic grant: %s", e)
             return None
 
     def _create_real_grant_from_source(
@@ -1697,121 +2530,82 @@ class WVGrantScraper:
         This is used as a reliable fallback to avoid fabricated data when scraping fails.
         """
         try:
-            source_name = source_info.get("name", "Source")
-            url = source_info.get("url", "")
-
-            # Heuristics for funder type based on source name
-            name_l = source_name.lower()
-            if any(k in name_l for k in ["department", "us ", "gov", "federal", "administration", "agency"]):
-                funder_type = "Federal Government"
-            elif "wv" in name_l or "west virginia" in name_l:
-                funder_type = "State Government"
-            else:
-                funder_type = "Private Foundation"
+            template = _real_grant_template(
+                source_info.get("name", "Source"),
+                source_info.get("url", ""),
+                title,
+                description,
+                tuple(focus_areas),
+            )
+            # Shallow copy; match_reasons is the only list filled in later
+            # (by the grant researcher), so each grant gets its own
+            return template.model_copy(
+                update={
+                    "last_updated": self._run_ts,
+                    "created_at": self._run_ts,
+                    "match_reasons": [],
+                }
+            )
+        except (ValueError, RuntimeError) as e:
+            logger.debug("Error creating real-source grant: %s", e)
+            return None
 
-            return Grant(
-                id=f"real_{int(time.time())}_{hash(title) % 10000}",
-                title=title[:200],
-                description=(description or "").strip()[:1000],
-                funder_name=source_name,
+    def _build_sample_grants(
+        self,
+        source_info: dict,
+        prefix: str,
+        definitions: tuple,
+        funder_type: str,
+        min_divisor: int,
+        max_multiplier: int,
+        eligibility: tuple,
+    ) -> list[Grant]:
+        """Build one sample grant per (title, description, amount, focus) definition.
+
+        Amounts range from ``amount // min_divisor`` to
+        ``amount * max_multiplier`` around the typical amount. Ids hash the
+        source name with the title, so sources sharing a sample set get
+        distinct ids that stay the same across runs.
+        """
+        name = source_info["name"]
+        url = source_info["url"]
+        return [
+            Grant(
+                id=_grant_id(prefix, f"{name}|{title}"),
+                title=title,
+                description=description,
+                funder_name=name,
                 funder_type=funder_type,
                 funding_type=FundingType.GRANT,
-                amount_typical=25000,
-                amount_min=5000,
-                amount_max=100000,
+                amount_typical=amount,
+                amount_min=amount // min_divisor,
+                amount_max=amount * max_multiplier,
                 status=GrantStatus.OPEN,
-                eligibility_types=[EligibilityType.NONPROFIT],
-                focus_areas=focus_areas or ["general"],
-                source=source_name,
+                eligibility_types=eligibility,
+                focus_areas=focus,
+                source=name,
                 source_url=url,
                 application_url=url,
-                total_funding_available=None,
-                application_deadline=None,
-                decision_date=None,
-                funding_start_date=None,
-                funding_duration_months=None,
-                matching_funds_required=False,
-                matching_percentage=None,
-                information_url=None,
-                contact_email=None,
-                contact_phone=None,
-                relevance_score=None,
-                last_updated=datetime.now(),
-                created_at=datetime.now(),
+                last_updated=self._run_ts,
+                created_at=self._run_ts,
             )
-        except (ValueError, RuntimeError) as e:
-            print(f"Error creating real-source grant: {e}")
-            return None
+            for title, description, amount, focus in definitions
+        ]
 
     def _get_sample_education_grants(self, source_info: dict) -> list[Grant]:
         """Generate sample education grants when scraping fails."""
-        samples: list[Grant] = []
-        definitions = [
-            (
-                "Title I School Improvement Grant",
-                "Federal funding for schools with high percentages of low-income students to improve academic achievement.",
-                50000,
-                ["education", "school_improvement", "title_i"],
-            ),
-            (
-                "STEM Education Enhancement Grant",
-                "Support for science, technology, engineering, and mathematics education programs and initiatives.",
-                35000,
-                ["stem_education", "technology", "science"],
-            ),
-            (
-                "After-School Academic Support Grant",
-                "Funding for after-school programs that provide academic support and enrichment activities.",
-                20000,
-                ["after_school", "academic_support", "tutoring"],
-            ),
-            (
-                "Teacher Professional Development Grant",
-                "Professional development opportunities for teachers to enhance instructional practices.",
-                15000,
-                ["teacher_training", "professional_development", "education"],
-            ),
-        ]
-
-        for i, (title, desc, amt, focus) in enumerate(definitions):
-            samples.append(
-                Grant(
-                    id=f"sample_edu_{int(time.time())}_{i}",
-                    title=title,
-                    description=desc,
-                    funder_name=source_info["name"],
-                    funder_type=(
-                        "State Government"
-                        if "wv" in source_info["name"].lower()
-                        else "Federal Government"
-                    ),
-                    funding_type=FundingType.GRANT,
-                    amount_typical=amt,
-                    amount_min=amt // 2,
-                    amount_max=amt * 3,
-                    status=GrantStatus.OPEN,
-                    eligibility_types=[EligibilityType.EDUCATION, EligibilityType.NONPROFIT],
-                    focus_areas=focus,
-                    source=source_info["name"],
-                    source_url=source_info["url"],
-                    application_url=source_info["url"],
-                    total_funding_available=None,
-                    application_deadline=None,
-                    decision_date=None,
-                    funding_start_date=None,
-                    funding_duration_months=None,
-                    matching_funds_required=False,
-                    matching_percentage=None,
-                    information_url=None,
-                    contact_email=None,
-                    contact_phone=None,
-                    relevance_score=None,
-                    last_updated=datetime.now(),
-                    created_at=datetime.now(),
-                )
-            )
-
-        return samples
+        funder_type = (
+            "State Government" if "wv" in source_info["name"].lower() else "Federal Government"
+        )
+        return self._build_sample_grants(
+            source_info,
+            "sample_edu",
+            _SAMPLE_EDUCATION_GRANTS,
+            funder_type,
+            2,
+            3,
+            _EDUCATION_NONPROFIT_ELIGIBILITY,
+        )
 
     def _get_sample_commerce_grants(self, source_info: dict) -> list[Grant]:
         """Get sample commerce grants."""
@@ -1834,8 +2628,8 @@ class WVGrantScraper:
                 contact_email="info@wvcommerce.org",
                 contact_phone="304-957-2234",
                 application_url=source_info["url"],
-                last_updated=datetime.now(),
-                created_at=datetime.now(),
+                last_updated=self._run_ts,
+                created_at=self._run_ts,
             )
         ]
 
@@ -1860,203 +2654,64 @@ class WVGrantScraper:
                 contact_email="grants@dhhr.wv.gov",
                 contact_phone="304-558-0684",
                 application_url=source_info["url"],
-                last_updated=datetime.now(),
-                created_at=datetime.now(),
+                last_updated=self._run_ts,
+                created_at=self._run_ts,
             )
         ]
 
     def _get_sample_stem_grants(self, source_info: dict) -> list[Grant]:
         """Generate sample STEM grants when scraping fails."""
-        sample_grants = [
-            {
-                "title": "NSF Education and Human Resources Grant",
-                "description": "Support for STEM education research and development of innovative educational approaches.",
-                "amount": 150000,
-                "focus": ["stem_education", "research", "innovation"],
-            },
-            {
-                "title": "Robotics Education Initiative Grant",
-                "description": "Funding for robotics programs in schools and community centers to engage students in STEM.",
-                "amount": 40000,
-                "focus": ["robotics", "stem_education", "technology"],
-            },
-            {
-                "title": "NASA STEM Engagement Grant",
-                "description": "Educational programs that use NASA resources to inspire student interest in STEM careers.",
-                "amount": 60000,
-                "focus": ["stem_education", "space_science", "career_development"],
-            },
-        ]
-
-        grants = []
-        for i, sample in enumerate(sample_grants):
-            grant = Grant(
-                id=f"sample_stem_{int(time.time())}_{i}",
-                title=sample["title"],
-                description=sample["description"],
-                funder_name=source_info["name"],
-                funder_type="Federal Government",
-                funding_type=FundingType.GRANT,
-                amount_typical=sample["amount"],
-                amount_min=sample["amount"] // 3,
-                amount_max=sample["amount"] * 4,
-                status=GrantStatus.OPEN,
-                eligibility_types=[EligibilityType.EDUCATION, EligibilityType.NONPROFIT],
-                focus_areas=sample["focus"],
-                source=source_info["name"],
-                source_url=source_info["url"],
-                application_url=source_info["url"],
-                last_updated=datetime.now(),
-                created_at=datetime.now(),
-            )
-            grants.append(grant)
-
-        return grants
+        return self._build_sample_grants(
+            source_info,
+            "sample_stem",
+            _SAMPLE_STEM_GRANTS,
+            "Federal Government",
+            3,
+            4,
+            _EDUCATION_NONPROFIT_ELIGIBILITY,
+        )
 
     def _get_sample_community_grants(self, source_info: dict) -> list[Grant]:
         """Generate sample community development grants when scraping fails."""
-        sample_grants = [
-            {
-                "title": "Rural Community Development Grant",
-                "description": "USDA funding for essential community facilities and infrastructure in rural areas.",
-                "amount": 200000,
-                "focus": ["rural_development", "community_facilities", "infrastructure"],
-            },
-            {
-                "title": "Housing Development Grant",
-                "description": "Support for affordable housing development and rehabilitation projects.",
-                "amount": 300000,
-                "focus": ["housing", "affordable_housing", "development"],
-            },
-            {
-                "title": "Community Services Block Grant",
-                "description": "Funding for programs that help low-income individuals and families achieve self-sufficiency.",
-                "amount": 80000,
-                "focus": ["community_services", "poverty_alleviation", "self_sufficiency"],
-            },
-        ]
-
-        grants = []
-        for i, sample in enumerate(sample_grants):
-            grant = Grant(
-                id=f"sample_comm_{int(time.time())}_{i}",
-                title=sample["title"],
-                description=sample["description"],
-                funder_name=source_info["name"],
-                funder_type="Federal Government",
-                funding_type=FundingType.GRANT,
-                amount_typical=sample["amount"],
-                amount_min=sample["amount"] // 4,
-                amount_max=sample["amount"] * 2,
-                status=GrantStatus.OPEN,
-                eligibility_types=[EligibilityType.NONPROFIT, EligibilityType.MUNICIPALITY],
-                focus_areas=sample["focus"],
-                source=source_info["name"],
-                source_url=source_info["url"],
-                application_url=source_info["url"],
-                last_updated=datetime.now(),
-                created_at=datetime.now(),
-            )
-            grants.append(grant)
-
-        return grants
+        return self._build_sample_grants(
+            source_info,
+            "sample_comm",
+            _SAMPLE_COMMUNITY_GRANTS,
+            "Federal Government",
+            4,
+            2,
+            _NONPROFIT_MUNICIPALITY_ELIGIBILITY,
+        )
 
     def _get_sample_youth_grants(self, source_info: dict) -> list[Grant]:
         """Generate sample youth program grants when scraping fails."""
-        sample_grants = [
-            {
-                "title": "21st Century Community Learning Centers Grant",
-                "description": "Federal funding for after-school and summer learning programs that serve students in high-need communities.",
-                "amount": 50000,
-                "focus": ["after_school", "summer_programs", "academic_support"],
-            },
-            {
-                "title": "Youth Development Program Grant",
-                "description": "Support for programs that promote positive youth development through mentoring and skill-building.",
-                "amount": 30000,
-                "focus": ["youth_development", "mentoring", "life_skills"],
-            },
-            {
-                "title": "Boys & Girls Club Programming Grant",
-                "description": "Funding for programming that supports academic success, character development, and healthy lifestyles.",
-                "amount": 25000,
-                "focus": ["youth_programming", "character_development", "healthy_lifestyles"],
-            },
-        ]
-
-        grants = []
-        for i, sample in enumerate(sample_grants):
-            grant = Grant(
-                id=f"sample_youth_{int(time.time())}_{i}",
-                title=sample["title"],
-                description=sample["description"],
-                funder_name=source_info["name"],
-                funder_type="Private Foundation"
-                if "boys" in source_info["name"].lower()
-                else "Federal Government",
-                funding_type=FundingType.GRANT,
-                amount_typical=sample["amount"],
-                amount_min=sample["amount"] // 2,
-                amount_max=sample["amount"] * 2,
-                status=GrantStatus.OPEN,
-                eligibility_types=[EligibilityType.NONPROFIT, EligibilityType.EDUCATION],
-                focus_areas=sample["focus"],
-                source=source_info["name"],
-                source_url=source_info["url"],
-                application_url=source_info["url"],
-                last_updated=datetime.now(),
-                created_at=datetime.now(),
-            )
-            grants.append(grant)
-
-        return grants
+        funder_type = (
+            "Private Foundation" if "boys" in source_info["name"].lower() else "Federal Government"
+        )
+        return self._build_sample_grants(
+            source_info,
+            "sample_youth",
+            _SAMPLE_YOUTH_GRANTS,
+            funder_type,
+            2,
+            2,
+            _NONPROFIT_EDUCATION_ELIGIBILITY,
+        )
 
     def _get_sample_generic_grants(self, source_info: dict) -> list[Grant]:
         """Generate sample generic grants when scraping fails."""
-        sample_grants = [
-            {
-                "title": "General Program Support Grant",
-                "description": "Flexible funding to support general operations and program activities.",
-                "amount": 20000,
-                "focus": ["general_support", "operations", "programming"],
-            },
-            {
-                "title": "Capacity Building Grant",
-                "description": "Support for organizational development and capacity building activities.",
-                "amount": 15000,
-                "focus": ["capacity_building", "organizational_development", "training"],
-            },
-        ]
-
-        grants = []
-        for i, sample in enumerate(sample_grants):
-            grant = Grant(
-                id=f"sample_gen_{int(time.time())}_{i}",
-                title=sample["title"],
-                description=sample["description"],
-                funder_name=source_info["name"],
-                funder_type="State Government",
-                funding_type=FundingType.GRANT,
-                amount_typical=sample["amount"],
-                amount_min=sample["amount"] // 2,
-                amount_max=sample["amount"] * 3,
-                status=GrantStatus.OPEN,
-                eligibility_types=[EligibilityType.NONPROFIT],
-                focus_areas=sample["focus"],
-                source=source_info["name"],
-                source_url=source_info["url"],
-                application_url=source_info["url"],
-                last_updated=datetime.now(),
-                created_at=datetime.now(),
-            )
-            grants.append(grant)
-
-        return grants
+        return self._build_sample_grants(
+            source_info,
+            "sample_gen",
+            _SAMPLE_GENERIC_GRANTS,
+            "State Government",
+            2,
+            3,
+            _NONPROFIT_ELIGIBILITY,
+        )
 
     def _scrape_source_robust(self, source_id: str, source_info: dict) -> list[Grant]:
         """Robustly scrape grants from a source with fallback/sample logic, error handling, and logging."""
-        import logging
-        logger = logging.getLogger(__name__)
         try:
             # In offline mode, avoid all network and use deterministic fallbacks
             if self.offline:
@@ -2088,33 +2743,8 @@ class WVGrantScraper:
 
     def _offline_fallback(self, source_id: str, source_info: dict) -> list[Grant]:
         """Heuristic mapping to appropriate sample/real-source fallbacks in offline mode."""
-        sid = source_id.lower()
-        name = source_info.get("name", "").lower()
-        # Education and arts
-        if any(k in sid for k in ["education"]) or any(k in name for k in ["education", "ed "]):
-            return self._get_sample_education_grants(source_info)
-        if any(k in sid for k in ["arts"]) or "arts" in name:
-            return self._get_sample_education_grants(source_info)
-        # Youth
-        if any(k in sid for k in ["youth", "afterschool"]) or "youth" in name:
-            return self._get_sample_youth_grants(source_info)
-        # STEM
-        if any(k in sid for k in ["nsf", "nasa", "stem"]) or any(k in name for k in ["nasa", "science", "technology", "engineering", "math"]):
-            return self._get_sample_stem_grants(source_info)
-        # Community & housing
-        if any(k in sid for k in ["hud", "usda", "community", "housing"]) or any(k in name for k in ["community", "housing", "rural", "development"]):
-            return self._get_sample_community_grants(source_info)
-        # Health
-        if any(k in sid for k in ["health", "dhhr"]) or any(k in name for k in ["health", "human"]):
-            return self._get_sample_health_grants(source_info)
-        # Commerce / development / workforce
-        if any(k in sid for k in ["commerce", "development", "workforce", "business"]) or any(k in name for k in ["commerce", "development", "workforce", "business"]):
-            return self._get_sample_commerce_grants(source_info)
-        # Grants.gov and other portals -> real source pointer
-        if any(k in sid for k in ["grants_gov", "grants-gov", "portal"]) or "grants" in name:
-            return self._get_real_source_information(source_info)
-        # Default generic samples
-        return self._get_sample_generic_grants(source_info)
+        method_name = _offline_fallback_name(source_id, source_info.get("name", ""))
+        return getattr(self, method_name)(source_info)
 
     # Auto-format the file to resolve lint errors (line length, indentation, trailing whitespace)
     # All lines >79 chars will be wrapped, and indentation fixed for PEP8 compliance
@@ -1,7 +1,9 @@
 """
 General-purpose helper functions for Grant AI.
 """
-from typing import Any, List, Dict
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Pattern, Tuple
 
 
 def chunk_list(lst: List[Any], n: int) -> List[List[Any]]:
@@ -12,3 +14,42 @@ def chunk_list(lst: List[Any], n: int) -> List[List[Any]]:
 def safe_get(d: Dict, key: Any, default: Any = None) -> Any:
     """Safely get a value from a dict."""
     return d.get(key, default)
+
+
+@lru_cache(maxsize=128)
+def keyword_pattern(keywords: Tuple[str, ...]) -> Pattern[str]:
+    """Compile keywords into one case-insensitive trie-shaped regex.
+
+    Keywords sharing a prefix are folded together (``grant|grants|great``
+    becomes ``gr(?:ant(?:s)?|eat)``), so the engine tests each prefix once
+    instead of once per keyword. Pass a sorted tuple so equivalent keyword
+    lists share a cache entry. An empty tuple yields a never-matching
+    pattern.
+    """
+    trie: Dict[str, Any] = {}
+    for keyword in keywords:
+        if not keyword:
+            continue
+        node = trie
+        for char in keyword.lower():
+            node = node.setdefault(char, {})
+        node[""] = {}
+    if not trie:
+        return re.compile(r"(?!x)x")
+    return re.compile(_trie_regex(trie), re.IGNORECASE)
+
+
+def _trie_regex(node: Dict[str, Any]) -> str:
+    """Render a trie node as a regex alternation."""
+    optional = "" in node
+    branches = [
+        re.escape(char) + _trie_regex(child)
+        for char, child in sorted(node.items())
+        if char
+    ]
+    if not branches:
+        return ""
+    if len(branches) == 1 and not optional:
+        return branches[0]
+    body = "(?:" + "|".join(branches) + ")"
+    return body + "?" if optional else body
@@ -1,7 +1,14 @@
 """Test configuration and fixtures for the Grant AI test suite."""
 
+import os
+import tempfile
 from datetime import date, timedelta
 
+# grant_ai.utils.logger opens its log file on import; keep it out of the tree
+os.environ.setdefault(
+    "GRANT_AI_LOG_FILE", os.path.join(tempfile.gettempdir(), "grant_ai_tests.log")
+)
+
 import pytest
 
 from grant_ai.models.ai_company import (
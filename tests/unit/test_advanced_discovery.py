@@ -0,0 +1,86 @@
+"""Unit tests for advanced grant discovery helpers."""
+
+import asyncio
+
+from grant_ai.models.grant import Grant
+from grant_ai.scrapers.advanced_discovery import AdvancedGrantDiscovery, _make_grant_id
+
+
+class TestAdvancedGrantDiscovery:
+    """Test cases for AdvancedGrantDiscovery scoring and extraction."""
+
+    def test_score_and_match(self):
+        """Test scoring returns top grants and matched keywords together."""
+        discovery = AdvancedGrantDiscovery()
+        grants = [
+            Grant(id="1", title="Machine learning for space", funder_name="A"),
+            Grant(id="2", title="Community arts", funder_name="B"),
+            Grant(id="3", title="Robotics spacecraft", funder_name="C"),
+        ]
+
+        relevant, matches, total = discovery._score_and_match(grants, ["robotics", "space"], 1)
+
+        assert [g.id for g in relevant] == ["3"]
+        assert set(matches) == {"robotics", "space"}
+        # Both space grants scored above zero; only the top one is returned
+        assert total == 2
+
+    def test_discovery_message_counts_matches_beyond_cap(self, monkeypatch):
+        """Test the result reports every match even when the grants are capped."""
+        discovery = AdvancedGrantDiscovery()
+        grants = [
+            Grant(id=str(i), title=f"Robotics project {i}", funder_name="A")
+            for i in range(3)
+        ]
+
+        async def fake_scrape(source_id, source_config, keywords):
+            return list(grants)
+
+        monkeypatch.setattr(discovery, "_scrape_source_with_keywords", fake_scrape)
+        results = asyncio.run(discovery.discover_grants_by_keywords(["robotics"], max_results=2))
+
+        result = results["nasa_nspires"]
+        assert len(result.grants) == 2
+        assert result.total_matches == 3
+        assert result.message == "Found 3 relevant grants (showing top 2)"
+
+    def test_cached_grants_are_not_rescored_by_later_queries(self, monkeypatch):
+        """Test two profiles queried back-to-back get independent scores."""
+        discovery = AdvancedGrantDiscovery()
+        discovery.sources = {"nasa_nspires": discovery.sources["nasa_nspires"]}
+        scraped = [Grant(id="1", title="Robotics for space habitats", funder_name="NASA")]
+
+        async def fake_nasa(keywords):
+            return scraped
+
+        monkeypatch.setattr(discovery, "_scrape_nasa_nspires", fake_nasa)
+
+        robotics = asyncio.run(discovery.discover_grants_by_keywords(["robotics"]))
+        first_score = robotics["nasa_nspires"].grants[0].relevance_score
+        both = asyncio.run(discovery.discover_grants_by_keywords(["robotics", "space"]))
+        again = asyncio.run(discovery.discover_grants_by_keywords(["robotics"]))
+
+        assert both["nasa_nspires"].grants[0].relevance_score > first_score
+        assert robotics["nasa_nspires"].grants[0].relevance_score == first_score
+        assert again["nasa_nspires"].grants[0].relevance_score == first_score
+        assert scraped[0].relevance_score is None
+
+    def test_extract_deadline_and_amount_from_text(self):
+        """Test extractors work on pre-extracted listing text."""
+        discovery = AdvancedGrantDiscovery()
+        text = "Deadline: March 15, 2025 awards from $10,000 up to $250,000"
+
+        deadline = discovery._extract_deadline(text)
+        amount = discovery._extract_amount(text)
+
+        assert deadline.year == 2025 and deadline.month == 3 and deadline.day == 15
+        assert amount == {"min": 10000, "max": 250000}
+
+    def test_make_grant_id_is_stable(self):
+        """Test grant IDs depend only on normalized content."""
+        first = _make_grant_id("nasa", "Space  Robotics", "https://example.gov")
+        second = _make_grant_id("nasa", "space robotics", "https://example.gov")
+
+        assert first == second
+        assert first.startswith("nasa_")
+        assert first != _make_grant_id("nasa", "Earth Observation", "https://example.gov")
@@ -0,0 +1,25 @@
+"""Unit tests for the foundation scraper."""
+
+from grant_ai.scrapers.foundation_scraper import FoundationScraper
+
+
+class TestFoundationScraper:
+    """Test cases for FoundationScraper.discover_foundation_grants."""
+
+    def test_source_matching_several_keywords_is_returned_once(self):
+        """Test a source is not repeated once per matching keyword."""
+        scraper = FoundationScraper()
+        stem = {"name": "STEM Fund", "focus_areas": ["education", "robotics"]}
+        arts = {"name": "Arts Fund", "focus_areas": ["arts"]}
+        scraper.sources = [stem, arts]
+
+        results = scraper.discover_foundation_grants(["education", "robotics"])
+
+        assert results == [stem]
+
+    def test_focus_areas_match_whole_names_only(self):
+        """Test keywords are compared to whole focus-area names."""
+        scraper = FoundationScraper()
+        scraper.sources = [{"name": "Arts Fund", "focus_areas": ["arts"]}, {"name": "Bare"}]
+
+        assert scraper.discover_foundation_grants(["art"]) == []
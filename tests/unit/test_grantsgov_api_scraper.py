@@ -1,15 +1,28 @@
 """
 Test for Grants.gov API scraper.
 """
+import asyncio
+import json
+
 import pytest
+from requests.exceptions import RequestException
 
-from grant_ai.scrapers.grantsgov.api_scraper import GrantsGovAPIScraper
+from grant_ai.models.grant import Grant
+from grant_ai.scrapers.grantsgov.api_scraper import (
+    GrantsGovAPIScraper,
+    GrantsGovBatcher,
+    _get_aiohttp_session,
+    close_async_session,
+)
 
 
 def test_grantsgov_api_scraper(monkeypatch):
     class DummyResponse:
         def raise_for_status(self):
             pass
+        @property
+        def content(self):
+            return json.dumps(self.json()).encode()
         def json(self):
             return {
                 "oppHits": [
@@ -24,7 +37,7 @@ def test_grantsgov_api_scraper(monkeypatch):
                     }
                 ]
             }
-    monkeypatch.setattr("requests.get", lambda *a, **k: DummyResponse())
+    monkeypatch.setattr("requests.Session.get", lambda *a, **k: DummyResponse())
     scraper = GrantsGovAPIScraper()
     grants = scraper.search_grants(query="test", rows=1)
     assert len(grants) == 1
@@ -33,3 +46,140 @@ def test_grantsgov_api_scraper(monkeypatch):
     assert g.funder_name == "Test Agency"
     assert g.status == "open"
     assert g.application_url == "https://www.grants.gov/test123"
+
+
+def test_scrape_grants_sends_keywords_to_api(monkeypatch, sample_organization):
+    captured = {}
+
+    class DummyResponse:
+        content = b'{"oppHits": []}'
+        def raise_for_status(self):
+            pass
+
+    def fake_get(self, url, params=None, **kwargs):
+        captured.update(params)
+        return DummyResponse()
+
+    monkeypatch.setattr("requests.Session.get", fake_get)
+    scraper = GrantsGovAPIScraper()
+    assert scraper.scrape_grants(sample_organization, filters={"open_only": True}) == []
+    assert " OR " in captured["keyword"]
+    assert "robotics" in captured["keyword"]
+    assert captured["oppStatuses"] == "posted"
+
+
+def test_page_params_uses_hit_count_and_max_pages():
+    params = {"startRecordNum": 0, "rows": 25, "keyword": "housing"}
+    pages = GrantsGovAPIScraper._page_params(params, {"hitCount": 80}, max_pages=3)
+    assert [p["startRecordNum"] for p in pages] == [25, 50]
+    assert GrantsGovAPIScraper._page_params(params, {"hitCount": 80}, max_pages=1) == []
+
+
+def test_async_session_from_previous_loop_is_closed():
+    sessions = []
+
+    async def get_session():
+        sessions.append(await _get_aiohttp_session())
+
+    asyncio.run(get_session())
+    asyncio.run(get_session())
+    try:
+        assert sessions[0] is not sessions[1]
+        assert sessions[0].closed
+        assert not sessions[1].closed
+    finally:
+        asyncio.run(close_async_session())
+
+
+class StubAsyncScraper:
+    """Records async searches and answers them from a callable."""
+
+    def __init__(self, respond):
+        self.calls = []
+        self._respond = respond
+
+    async def async_search_grants(self, query="", **kwargs):
+        self.calls.append((query, kwargs.get("rows")))
+        return self._respond(query, kwargs)
+
+
+def _grant(grant_id, title):
+    return Grant(id=grant_id, title=title, funder_name="Agency")
+
+
+def _lookup(batcher, keywords):
+    async def run():
+        return await asyncio.gather(
+            *(batcher.get(keyword) for keyword in keywords),
+            return_exceptions=True,
+        )
+
+    return asyncio.run(run())
+
+
+def test_batcher_coalesces_keywords_and_splits_hits():
+    hits = [_grant("1", "Housing repair"), _grant("2", "Youth mentoring")]
+    scraper = StubAsyncScraper(lambda query, kwargs: hits)
+    batcher = GrantsGovBatcher(scraper, rows=10)
+
+    housing, youth, again = _lookup(batcher, ["housing", "youth", "housing"])
+
+    assert scraper.calls == [("housing OR youth", 20)]
+    assert [g.id for g in housing] == ["1"]
+    assert [g.id for g in youth] == ["2"]
+    assert [g.id for g in again] == ["1"]
+
+
+def test_batcher_falls_back_when_split_may_differ():
+    def respond(query, kwargs):
+        if " OR " in query:
+            # A hit whose title/synopsis matches neither keyword
+            return [_grant("1", "Housing repair"), _grant("x", "Shelter aid")]
+        return [_grant(query, query)]
+
+    scraper = StubAsyncScraper(respond)
+    housing, youth = _lookup(GrantsGovBatcher(scraper, rows=10), ["housing", "youth"])
+
+    assert scraper.calls == [
+        ("housing OR youth", 20), ("housing", 10), ("youth", 10)
+    ]
+    assert [g.id for g in housing] == ["housing"]
+    assert [g.id for g in youth] == ["youth"]
+
+
+def test_batcher_falls_back_when_batch_is_truncated():
+    def respond(query, kwargs):
+        if " OR " in query:
+            return [_grant(str(i), f"Housing {i}") for i in range(kwargs["rows"])]
+        return [_grant(query, query)]
+
+    scraper = StubAsyncScraper(respond)
+    housing, youth = _lookup(GrantsGovBatcher(scraper, rows=1), ["housing", "youth"])
+
+    assert len(scraper.calls) == 3
+    assert [g.id for g in housing] == ["housing"]
+    assert [g.id for g in youth] == ["youth"]
+
+
+def test_batcher_propagates_errors_to_every_lookup():
+    def respond(query, kwargs):
+        raise RequestException("grants.gov down")
+
+    batcher = GrantsGovBatcher(StubAsyncScraper(respond))
+    results = _lookup(batcher, ["housing", "youth", "arts"])
+
+    assert len(results) == 3
+    assert all(isinstance(result, RequestException) for result in results)
+
+
+def test_build_params_and_parse_response_match_search():
+    scraper = GrantsGovAPIScraper()
+    params = scraper.build_params("housing", keywords=["youth"], open_only=True, rows=5)
+    assert params["keyword"] == "housing OR youth"
+    assert params["oppStatuses"] == "posted"
+    assert params["rows"] == 5
+
+    body = b'{"oppHits": [{"opportunityId": "1", "opportunityTitle": "Housing"}]}'
+    assert [g.title for g in scraper.parse_response(body)] == ["Housing"]
+    with pytest.raises(RequestException):
+        scraper.parse_response(b"not json")
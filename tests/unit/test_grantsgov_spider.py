@@ -0,0 +1,40 @@
+"""
+Tests for the grants.gov Scrapy spider.
+"""
+import json
+
+import pytest
+
+scrapy_http = pytest.importorskip("scrapy.http")
+
+from grant_ai.scrapers.grantsgov.spider import GrantsGovSpider  # noqa: E402
+
+
+def test_parse_yields_grant_dicts_from_api_body():
+    body = json.dumps({
+        "oppHits": [
+            {
+                "cfdaList": ["10.123"],
+                "opportunityId": "TEST123",
+                "opportunityTitle": "Test Grant",
+                "synopsis": "A test grant opportunity.",
+                "agencyName": "Test Agency",
+                "opportunityStatus": "posted",
+                "opportunityUrl": "https://www.grants.gov/test123",
+            }
+        ]
+    }).encode()
+    spider = GrantsGovSpider(query="test", rows=1)
+    response = scrapy_http.TextResponse(url="https://www.grants.gov/", body=body)
+
+    assert list(spider.parse(response)) == [
+        {
+            "title": "Test Grant",
+            "funder_name": "Test Agency",
+            "application_deadline": None,
+            "application_url": "https://www.grants.gov/test123",
+        }
+    ]
+    request = next(spider.start_requests())
+    assert "keyword=test" in request.url
+    assert "rows=1" in request.url
@@ -0,0 +1,18 @@
+"""Unit tests for general-purpose helpers."""
+
+from grant_ai.utils.helpers import keyword_pattern
+
+
+class TestKeywordPattern:
+    """Test cases for the trie keyword regex."""
+
+    def test_shared_prefixes_are_folded(self):
+        """Test keywords with a common prefix compile into one branch."""
+        pattern = keyword_pattern(("grant", "grants", "great"))
+
+        assert pattern.pattern == "gr(?:ant(?:s)?|eat)"
+        assert pattern.findall("Grants GREAT gran") == ["Grants", "GREAT"]
+
+    def test_empty_keywords_never_match(self):
+        """Test an empty keyword tuple matches nothing."""
+        assert keyword_pattern(()).search("anything") is None
@@ -73,6 +73,20 @@ class TestOrganizationProfile:
         assert any("education" in keyword.lower() for keyword in keywords)
         assert any("robotics" in keyword.lower() for keyword in keywords)
     
+    def test_get_keyword_matcher(self, sample_organization):
+        """Test the cached keyword matcher tracks focus area changes."""
+        keywords, pattern = sample_organization.get_keyword_matcher()
+        
+        assert "robotics" in keywords
+        assert pattern.search("after-school robotics club")
+        assert sample_organization.get_keyword_matcher()[1] is pattern
+        
+        sample_organization.add_focus_area(FocusArea.AFFORDABLE_HOUSING)
+        keywords, pattern = sample_organization.get_keyword_matcher()
+        
+        assert "housing" in keywords
+        assert pattern.search("affordable housing")
+    
     def test_update_timestamp(self, sample_organization):
         """Test timestamp updating."""
         original_time = sample_organization.updated_at
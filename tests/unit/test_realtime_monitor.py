@@ -0,0 +1,38 @@
+"""Unit tests for the real-time grant monitor."""
+
+import asyncio
+
+from grant_ai.scrapers.realtime_monitor import RealTimeGrantMonitor
+
+
+class TestRealTimeGrantMonitor:
+    """Test cases for concurrent source polling."""
+
+    def test_monitor_polls_sources_and_survives_failing_callbacks(self):
+        """Test every source is polled repeatedly even when a callback raises."""
+        monitor = RealTimeGrantMonitor()
+        monitor.add_source("feed-a", interval=0.01)
+        monitor.add_source("feed-b", interval=0.01)
+        alerts = []
+        failures = []
+
+        def flaky(alert):
+            if alert["source"] == "feed-b":
+                failures.append(alert)
+                raise RuntimeError("callback failed")
+
+        monitor.add_alert_callback(flaky)
+        monitor.add_alert_callback(alerts.append)
+
+        async def run_briefly():
+            try:
+                await asyncio.wait_for(monitor.monitor(interval=3600), timeout=0.1)
+            except asyncio.TimeoutError:
+                pass
+
+        asyncio.run(run_briefly())
+
+        sources = [alert["source"] for alert in alerts]
+        assert sources.count("feed-a") >= 2
+        assert "feed-b" not in sources
+        assert len(failures) >= 2
@@ -0,0 +1,56 @@
+"""Unit tests for the scraper base class legacy fallbacks."""
+
+from grant_ai.models.grant import Grant
+from grant_ai.models.organization import FocusArea, OrganizationProfile
+from grant_ai.scrapers.base import ScraperBase
+
+
+class _AllGrantsScraper(ScraperBase):
+    source_name = "all"
+
+    def get_all_grants(self):
+        return [
+            Grant(id="1", title="Robotics summer camp", funder_name="A"),
+            Grant(id="2", title="Senior meals", funder_name="B"),
+        ]
+
+
+class _SearchScraper(ScraperBase):
+    source_name = "search"
+
+    def search_grants(self, query: str = "", **kwargs):
+        return [Grant(id="3", title=f"Result for {query}", funder_name="C")]
+
+
+class TestScraperBase:
+    """Test cases for ScraperBase.scrape_grants dispatch."""
+
+    def test_get_all_grants_fallback_filters_by_keywords(self, sample_organization):
+        """Test subclasses with only get_all_grants are filtered by focus keywords."""
+        records = _AllGrantsScraper().scrape_grants(sample_organization)
+
+        assert [r.id for r in records] == ["1"]
+        assert records[0].source == "all"
+
+    def test_small_keyword_sets_track_hit_frequency(self):
+        """Test the substring fallback counts which keywords matched."""
+        profile = OrganizationProfile(
+            name="Robotics Club", focus_areas=[FocusArea.ROBOTICS]
+        )
+        scraper = _AllGrantsScraper()
+
+        records = scraper.scrape_grants(profile)
+
+        assert [r.id for r in records] == ["1"]
+        assert scraper._kw_hits["robotics"] == 1
+
+    def test_search_grants_fallback(self, sample_organization):
+        """Test subclasses with search_grants receive the focus keyword query."""
+        records = _SearchScraper().scrape_grants(sample_organization, limit=1)
+
+        assert len(records) == 1
+        assert records[0].id == "3"
+
+    def test_no_legacy_methods_returns_empty(self, sample_organization):
+        """Test the base class returns no grants when nothing is implemented."""
+        assert ScraperBase().scrape_grants(sample_organization) == []
@@ -0,0 +1,123 @@
+"""Unit tests for the sample-data grant discovery."""
+
+from grant_ai.scrapers.simple_advanced_discovery import (
+    SimpleAdvancedDiscovery,
+    SimpleEnhancedGrantDiscovery,
+)
+
+
+def _titles(results):
+    """Map each source with grants to its grant titles."""
+    return {
+        source: [grant.title for grant in result.grants]
+        for source, result in results.items()
+        if result.grants
+    }
+
+
+class TestSimpleAdvancedDiscovery:
+    """Test cases for keyword matching and amount filtering."""
+
+    def test_single_word_keyword_matches_title_tokens(self):
+        """Test a single-word keyword selects grants whose title has that word."""
+        discovery = SimpleAdvancedDiscovery()
+
+        results = discovery.discover_ai_space_grants(["mars"])
+
+        assert _titles(results) == {
+            "nasa": ["NASA SBIR: Computer Vision for Mars Exploration"],
+        }
+        assert results["nasa"].count == 1
+        assert all(result.success for result in results.values())
+
+    def test_keywords_are_case_folded(self):
+        """Test keywords and titles are compared case-insensitively."""
+        discovery = SimpleAdvancedDiscovery()
+
+        upper = _titles(discovery.discover_ai_space_grants(["DOE", "Climate"]))
+
+        assert upper == {"doe": ["DOE AI for Climate Modeling"]}
+
+    def test_multi_word_keyword_matches_phrase(self):
+        """Test a multi-word keyword matches the phrase, not its separate words."""
+        discovery = SimpleAdvancedDiscovery()
+
+        results = discovery.discover_ai_space_grants(["Machine Learning"])
+        reordered = discovery.discover_ai_space_grants(["learning machine"])
+
+        assert _titles(results) == {
+            "nsf": ["NSF AI Institute: Foundations of Machine Learning"],
+        }
+        assert _titles(reordered) == {}
+
+    def test_keywords_match_whole_words_only(self):
+        """Test a keyword does not match a longer word containing it."""
+        discovery = SimpleAdvancedDiscovery()
+
+        # "space" is part of "Spacecraft" but is not a title word
+        results = discovery.discover_ai_space_grants(["space"])
+
+        assert _titles(results) == {}
+        assert all(result.success and result.count == 0 for result in results.values())
+
+    def test_no_keywords_match_nothing(self):
+        """Test an empty or unmatched keyword list returns no grants."""
+        discovery = SimpleAdvancedDiscovery()
+
+        assert _titles(discovery.discover_ai_space_grants([])) == {}
+        assert _titles(discovery.discover_ai_space_grants(["zebra"])) == {}
+
+    def test_grants_in_amount_range_selects_overlapping_ranges(self):
+        """Test amount filters keep grants whose funding range overlaps the bounds."""
+        discovery = SimpleAdvancedDiscovery()
+
+        def ids(results):
+            return sorted(grant.id for grants in results.values() for grant in grants)
+
+        assert ids(discovery.grants_in_amount_range(min_amount=2_000_000)) == [
+            "doe_0", "nsf_0",
+        ]
+        assert ids(discovery.grants_in_amount_range(max_amount=300_000)) == [
+            "esa_0", "nsf_1",
+        ]
+        assert ids(discovery.grants_in_amount_range(900_000, 1_000_000)) == [
+            "doe_0", "nasa_0", "nasa_1", "nsf_0",
+        ]
+        assert len(ids(discovery.grants_in_amount_range())) == 6
+        assert ids(discovery.grants_in_amount_range(min_amount=10_000_000)) == []
+
+    def test_cached_results_are_not_shared_with_callers(self):
+        """Test mutating returned results does not change later cached calls."""
+        discovery = SimpleAdvancedDiscovery()
+        keywords = ["AI", "space exploration", "nasa"]
+
+        first = discovery.discover_ai_space_grants(keywords)
+        assert len(first["nasa"].grants) == 2
+        first["nasa"].grants.clear()
+
+        hit = discovery.discover_ai_space_grants(keywords)
+        assert len(hit["nasa"].grants) == 2
+        hit["nasa"].grants[0].title = "Changed"
+        hit["nasa"].grants.clear()
+
+        again = discovery.discover_ai_space_grants(keywords)
+        assert len(again["nasa"].grants) == 2
+        assert again["nasa"].grants[0].title.startswith("NASA STTR")
+
+
+class TestSimpleEnhancedGrantDiscovery:
+    """Test cases for cached discovery analytics."""
+
+    def test_cached_analysis_is_not_shared_with_callers(self):
+        """Test mutating a returned analysis does not change later cached calls."""
+        discovery = SimpleEnhancedGrantDiscovery()
+        keywords = ["AI", "nasa"]
+
+        first = discovery.discover_and_analyze(keywords)
+        total = first["analytics"]["total"]
+        first["results"]["nasa"].grants.clear()
+        first["analytics"]["total"] = -1
+
+        second = discovery.discover_and_analyze(keywords)
+        assert len(second["results"]["nasa"].grants) == 2
+        assert second["analytics"]["total"] == total
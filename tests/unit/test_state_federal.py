@@ -0,0 +1,114 @@
+"""Unit tests for the state/federal portal scraper."""
+
+import asyncio
+import logging
+
+from grant_ai.models.grant import Grant
+from grant_ai.scrapers.grantsgov.api_scraper import _get_aiohttp_session, close_async_session
+from grant_ai.scrapers.state_federal import StateFederalGrantScraper
+
+
+class TestStateFederalGrantScraper:
+    """Test cases for concurrent portal searches."""
+
+    def test_search_merges_portals_and_skips_failures(self):
+        """Test results from every portal are combined and failing portals are skipped."""
+        scraper = StateFederalGrantScraper()
+
+        async def federal(query, **kwargs):
+            return [Grant(id="f1", title=f"Federal {query}", funder_name="US")]
+
+        async def state(query, **kwargs):
+            return [Grant(id="s1", title=f"State {query}", funder_name="WV")]
+
+        async def broken(query, **kwargs):
+            raise RuntimeError("portal down")
+
+        scraper.portals = {"federal": federal}
+        scraper.add_portal("state", state)
+        scraper.add_portal("broken", broken)
+
+        grants = scraper.search_grants("housing")
+
+        assert [g.id for g in grants] == ["f1", "s1"]
+
+    def test_async_search_logs_failing_portal(self, caplog):
+        """Test _async_search returns the working portals and logs the failure."""
+        scraper = StateFederalGrantScraper()
+
+        async def state(query, **kwargs):
+            assert kwargs == {"rows": 5}
+            return [Grant(id="s1", title=f"State {query}", funder_name="WV")]
+
+        async def broken(query, **kwargs):
+            raise RuntimeError("portal down")
+
+        scraper.portals = {"broken": broken, "state": state}
+
+        async def search():
+            async with scraper:
+                return await scraper.async_search_grants("arts", rows=5)
+
+        with caplog.at_level(logging.WARNING):
+            grants = asyncio.run(search())
+
+        assert [g.title for g in grants] == ["State arts"]
+        assert "broken" in caplog.text and "portal down" in caplog.text
+
+    def test_close_releases_grants_gov_client(self, monkeypatch):
+        """Test close and the context manager close the grants.gov client."""
+        closed = []
+        monkeypatch.setattr(
+            "grant_ai.scrapers.grantsgov.api_scraper.GrantsGovAPIScraper.close",
+            lambda self: closed.append(self),
+        )
+
+        with StateFederalGrantScraper() as scraper:
+            pass
+        scraper.close()
+
+        assert closed == [scraper._grants_gov, scraper._grants_gov]
+
+    def test_search_grants_works_inside_running_loop(self):
+        """Test the blocking entry point can be called while a loop is running."""
+        scraper = StateFederalGrantScraper()
+
+        async def portal(query, **kwargs):
+            return [Grant(id="p1", title=f"Portal {query}", funder_name="WV")]
+
+        scraper.portals = {"portal": portal}
+
+        async def caller():
+            return scraper.search_grants("youth")
+
+        assert [g.title for g in asyncio.run(caller())] == ["Portal youth"]
+
+    def test_grants_gov_uses_own_session_not_shared_one(self, monkeypatch):
+        """Test grants.gov gets the scraper's session and the shared one stays open."""
+        seen = []
+
+        async def fake_search(self, query="", session=None, **kwargs):
+            seen.append(session)
+            return []
+
+        monkeypatch.setattr(
+            "grant_ai.scrapers.grantsgov.api_scraper.GrantsGovAPIScraper.async_search_grants",
+            fake_search,
+        )
+
+        async def run():
+            shared = await _get_aiohttp_session()
+            try:
+                async with StateFederalGrantScraper() as scraper:
+                    await scraper.async_search_grants("arts")
+                    await scraper.async_search_grants("youth")
+                    own = scraper._session
+                assert not shared.closed
+                return own
+            finally:
+                await close_async_session()
+
+        own = asyncio.run(run())
+
+        assert seen == [own, own]
+        assert own.closed
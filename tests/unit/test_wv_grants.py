@@ -0,0 +1,196 @@
+"""
+Tests for the West Virginia grant scraper.
+"""
+import io
+import time
+
+import pytest
+import requests
+from urllib3 import HTTPResponse
+
+from grant_ai.scrapers.wv_grants import WVGrantScraper, _has_candidates
+
+
+def test_get_page_revalidates_cached_page(monkeypatch, tmp_path):
+    sent = []
+
+    class DummyResponse:
+        def __init__(self, status_code, content=b"", headers=None):
+            self.status_code = status_code
+            self.raw = HTTPResponse(io.BytesIO(content), preload_content=False)
+            self.headers = headers or {}
+        def raise_for_status(self):
+            pass
+        def close(self):
+            pass
+
+    def fake_get(self, url, headers=None, **kwargs):
+        sent.append(headers)
+        if headers and headers.get("If-None-Match") == '"v1"':
+            return DummyResponse(304)
+        return DummyResponse(200, b"<html>grants</html>", {"ETag": '"v1"'})
+
+    monkeypatch.setattr("requests.Session.get", fake_get)
+    url = "https://example.org/grants"
+    for _ in range(2):
+        scraper = WVGrantScraper(cache_dir=tmp_path, cache_ttl=0)
+        scraper._dns_ok["example.org"] = True
+        assert scraper._get_page(url) == b"<html>grants</html>"
+    assert sent == [{}, {"If-None-Match": '"v1"'}]
+
+    # Within the TTL the stored page is used without a request
+    scraper = WVGrantScraper(cache_dir=tmp_path, cache_ttl=3600)
+    assert scraper._get_page(url) == b"<html>grants</html>"
+    assert len(sent) == 2
+
+
+def test_grants_gov_sources_use_api_query(monkeypatch):
+    calls = []
+
+    def fake_search(self, query="", **kwargs):
+        calls.append((query, kwargs["rows"]))
+        return ["grant"]
+
+    monkeypatch.setattr(
+        "grant_ai.scrapers.grantsgov.api_scraper.GrantsGovAPIScraper.search_grants",
+        fake_search,
+    )
+    scraper = WVGrantScraper(max_results=5)
+    source_info = scraper.sources["grants_gov_arts"]
+    assert scraper._scrape_source("grants_gov_arts", source_info) == ["grant"]
+    assert calls == [("arts", 5)]
+
+
+def test_scrape_all_keeps_requested_order():
+    scraper = WVGrantScraper(offline=True, cache_dir=None)
+    source_ids = list(scraper.sources)[:3][::-1]
+    grants = scraper.scrape_all(source_ids)
+    expected = [
+        grant.source
+        for source_id in source_ids
+        for grant in scraper._scrape_one(source_id, scraper.sources[source_id])
+    ]
+    assert [grant.source for grant in grants] == expected
+    with pytest.raises(ValueError):
+        scraper.scrape_all(["no_such_source"])
+
+
+def _stub_pages(monkeypatch, pages):
+    """Serve ``pages`` (url -> (status, delay)) from a stub session; return the URLs sent."""
+    sent = []
+
+    class DummyResponse:
+        def __init__(self, status_code):
+            self.status_code = status_code
+            self.raw = HTTPResponse(io.BytesIO(b"<html>grants</html>"), preload_content=False)
+            self.headers = {}
+        def raise_for_status(self):
+            if self.status_code >= 400:
+                raise requests.exceptions.HTTPError(str(self.status_code))
+        def close(self):
+            pass
+
+    def fake_get(self, url, **kwargs):
+        status, delay = pages[url]
+        time.sleep(delay)
+        sent.append(url)
+        return DummyResponse(status)
+
+    monkeypatch.setattr("requests.Session.get", fake_get)
+    return sent
+
+
+def _walk_candidates(scraper, source_info):
+    """Walk a source's URLs like the scrapers do, stopping at the first page."""
+    with scraper._sweep({}):
+        for url in scraper._candidate_urls(source_info):
+            try:
+                scraper._get_page(url)
+            except requests.exceptions.RequestException:
+                continue
+            break
+
+
+@pytest.fixture
+def hedged_scraper(monkeypatch):
+    monkeypatch.setattr(WVGrantScraper, "_prewarm_dns", lambda self, sources=None: None)
+    scraper = WVGrantScraper(cache_dir=None)
+    scraper._dns_ok["example.org"] = True
+    return scraper
+
+
+def test_fallbacks_are_not_fetched_when_primary_succeeds(monkeypatch, hedged_scraper):
+    urls = [f"https://example.org/{name}" for name in ("main", "alt1", "alt2")]
+    sent = _stub_pages(monkeypatch, {url: (200, 0) for url in urls})
+
+    _walk_candidates(hedged_scraper, {"url": urls[0], "fallbacks": urls[1:]})
+
+    assert sent == urls[:1]
+
+
+def test_fallback_is_fetched_when_primary_fails(monkeypatch, hedged_scraper):
+    urls = [f"https://example.org/{name}" for name in ("main", "alt1", "alt2")]
+    sent = _stub_pages(monkeypatch, {urls[0]: (500, 0), urls[1]: (200, 0), urls[2]: (200, 0)})
+
+    _walk_candidates(hedged_scraper, {"url": urls[0], "fallbacks": urls[1:]})
+
+    assert sorted(sent) == sorted(urls[:2])
+
+
+def test_slow_primary_is_hedged_and_sweep_waits(monkeypatch, hedged_scraper):
+    urls = ["https://example.org/main", "https://example.org/alt"]
+    sent = _stub_pages(monkeypatch, {urls[0]: (200, 0.2), urls[1]: (200, 0.4)})
+    hedged_scraper.HEDGE_DELAY = 0.05
+
+    _walk_candidates(hedged_scraper, {"url": urls[0], "fallbacks": urls[1:]})
+
+    # The hedged fallback finished before the sweep returned
+    assert sorted(sent) == sorted(urls)
+
+
+def test_sample_fallback_ids_are_distinct_and_stable():
+    # Both sources fall back to the education sample set
+    source_ids = ["wv_education", "arts_commission"]
+    scraper = WVGrantScraper(offline=True, cache_dir=None)
+    grants = scraper.scrape_all(source_ids)
+    ids = [grant.id for grant in grants]
+    assert {grant.source for grant in grants} == {
+        scraper.sources[source_id]["name"] for source_id in source_ids
+    }
+    assert len(ids) == len(set(ids))
+
+    again = WVGrantScraper(offline=True, cache_dir=None).scrape_all(source_ids)
+    assert [grant.id for grant in again] == ids
+
+
+def test_real_source_grants_do_not_share_match_reasons():
+    scraper = WVGrantScraper(offline=True, cache_dir=None)
+    source_info = {"name": "Example Foundation", "url": "https://example.org"}
+    first, second = (
+        scraper._create_real_grant_from_source(
+            source_info=source_info, title="Program", description="", focus_areas=["arts"]
+        )
+        for _ in range(2)
+    )
+    first.match_reasons.append("Focus areas match organization needs")
+    assert second.match_reasons == []
+    assert second.focus_areas == ["arts"]
+
+
+def test_page_cache_is_off_by_default(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    _stub_pages(monkeypatch, {"https://example.org/grants": (200, 0)})
+    scraper = WVGrantScraper()
+    scraper._dns_ok["example.org"] = True
+    assert scraper._get_page("https://example.org/grants") == b"<html>grants</html>"
+    assert scraper.cache_dir is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_has_candidates_skips_pages_without_keywords():
+    keywords = ("grant", "funding")
+    assert _has_candidates(b'<div class="Grant-List"><h3>Arts</h3></div>', keywords)
+    assert _has_candidates(b"<h2>Funding news</h2>", keywords)
+    assert not _has_candidates(b'<div class="news"><h2>Events</h2></div>', keywords)
+    # UTF-16 pages cannot be scanned byte-wise, so they are always parsed
+    assert _has_candidates("<h2>Events</h2>".encode("utf-16"), keywords)